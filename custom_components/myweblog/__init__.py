@@ -4,17 +4,50 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+
+from .coordinator import MyWebLogRuntime
+from .services import async_setup_services
 
 DOMAIN = "myweblog"
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.CALENDAR, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the MyWeblog services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MyWeblog from a config entry."""
+    runtime = MyWebLogRuntime(hass, entry)
+    await runtime.async_setup()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = runtime
+
+    entry.async_on_unload(entry.add_update_listener(async_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options and airplanes without reloading the entry."""
+    runtime: MyWebLogRuntime | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if runtime is None:
+        return
+    await runtime.async_update_options()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        runtime: MyWebLogRuntime = hass.data[DOMAIN].pop(entry.entry_id)
+        for coordinator in runtime.bookings_coordinators.values():
+            await coordinator.async_shutdown()
+        await runtime.objects_coordinator.async_shutdown()
+        runtime.single_flight.async_cancel()
+    return unload_ok
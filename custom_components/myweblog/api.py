@@ -0,0 +1,193 @@
+"""Deadline-bound access to the myWebLog API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from aiohttp import ClientSession
+from pyMyweblog import MyWebLogClient
+
+from homeassistant.core import HomeAssistant, callback  # type: ignore[import]
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+
+from .const import EXECUTOR_DECODE_BYTES
+
+if TYPE_CHECKING:
+    from .cassette import Cassette
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class MyWebLogSessionClient(MyWebLogClient):
+    """MyWebLogClient making its requests on a given aiohttp session.
+
+    The stock client opens and closes a session of its own around every use,
+    so no connection is ever reused. This one borrows the session, typically
+    the one Home Assistant shares between integrations, and leaves it open,
+    so keep-alive connections and the DNS cache carry over between requests.
+    Responses larger than EXECUTOR_DECODE_BYTES are decoded in the executor
+    rather than in the event loop. Given a cassette, the requests and their
+    results are recorded to it, or served from it when it is replaying.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        username: str,
+        password: str,
+        app_token: str | None = None,
+        cassette: Cassette | None = None,
+    ) -> None:
+        """Initialize the client."""
+        super().__init__(username, password, app_token)
+        self._shared_session = session
+        self.cassette = cassette
+
+    async def __aenter__(self) -> MyWebLogSessionClient:
+        """Borrow the session."""
+        self.session = self._shared_session
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Return the session without closing it."""
+        self.session = None
+
+    async def _myWeblogPost(self, qtype: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Send a request to the API and return its result.
+
+        Mirrors the request of the stock client, except for the decoding.
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            return await self.cassette.async_play(qtype, data)
+        if self.session is None:
+            raise RuntimeError("ClientSession is not initialized. Use 'async with'.")
+        if self.app_token is None:
+            raise RuntimeError("App token was not available.")
+
+        payload = {
+            "qtype": qtype,
+            "mwl_u": self.username,
+            "mwl_p": self.password,
+            "returnType": "JSON",
+            "charset": "UTF-8",
+            "app_token": self.app_token,
+            "language": "se",
+            **data,
+        }
+        start = time.monotonic()
+        async with self.session.post(self.base_url, data=payload) as resp:
+            resp.raise_for_status()
+            text = await resp.text()
+
+        if len(text) > EXECUTOR_DECODE_BYTES:
+            _LOGGER.debug("Decoding %d bytes of %s in the executor", len(text), qtype)
+            response = await asyncio.get_running_loop().run_in_executor(
+                None, json.loads, text
+            )
+        else:
+            response = json.loads(text)
+
+        if (
+            isinstance(response, dict)
+            and response.get("qType") == qtype
+            and response.get("APIVersion") == self.api_version
+        ):
+            result = response.get("result", {})
+            if self.cassette is not None:
+                self.cassette.record(qtype, data, result, time.monotonic() - start)
+            return result
+        raise ValueError(f"Unexpected response from API: {text}")
+
+
+@dataclass
+class ApiStats:
+    """Outcomes of the API requests of a config entry.
+
+    Timeouts are counted apart from other errors, as they point at a slow or
+    unreachable myWebLog rather than at a rejected request.
+    """
+
+    requests: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    last_timeout: datetime | None = None
+    last_error: str | None = None
+
+    def record_timeout(self) -> None:
+        """Count a request that ran out of time."""
+        self.timeouts += 1
+        self.last_timeout = dt_util.utcnow()
+
+    def record_error(self, err: Exception) -> None:
+        """Count a request that failed for another reason."""
+        self.errors += 1
+        self.last_error = repr(err)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        data = asdict(self)
+        if self.last_timeout is not None:
+            data["last_timeout"] = self.last_timeout.isoformat()
+        return data
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same resource into one.
+
+    While a call for a key is in flight, further calls for that key join it
+    and get its result or exception instead of starting a call of their own.
+    Callers are shielded from each other, so a cancelled caller does not
+    cancel the call the others are waiting for. The calls run as background
+    tasks of Home Assistant and are cancelled when the entry is unloaded.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the single flight group."""
+        self.hass = hass
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        self.joined = 0
+
+    async def async_run(
+        self, key: Hashable, func: Callable[[], Coroutine[Any, Any, _T]]
+    ) -> _T:
+        """Run the call for a key, or join the one in flight."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.joined += 1
+            return await asyncio.shield(task)
+
+        task = self.hass.async_create_background_task(
+            func(), f"myweblog single flight {key}"
+        )
+        self._inflight[key] = task
+
+        def async_done(_: asyncio.Task[Any]) -> None:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+            # Nobody may be left waiting for the outcome
+            if not task.cancelled():
+                task.exception()
+
+        task.add_done_callback(async_done)
+        return await asyncio.shield(task)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the calls in flight."""
+        for task in self._inflight.values():
+            task.cancel()
+
+
+async def async_call(awaitable: Awaitable[_T], timeout: float) -> _T:
+    """Await one API call, cancelling it when the deadline passes."""
+    async with asyncio.timeout(timeout):
+        return await awaitable
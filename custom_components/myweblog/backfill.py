@@ -0,0 +1,168 @@
+"""Long-term statistics backfill for the MyWeblog integration."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+import logging
+from typing import Any
+
+from homeassistant.helpers import entity_registry as er  # type: ignore[import]
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+
+from .const import DOMAIN, STATISTICS_IMPORT_BATCH_SIZE
+from .coordinator import MyWebLogRuntime, airplane_unique_id_prefix
+
+_LOGGER = logging.getLogger(__name__)
+
+# Flight counter sensors and the flight log field adding to them
+FLIGHT_COUNTERS: dict[str, tuple[str, str | None]] = {
+    "airborne": ("airborne_total", "h"),
+    "block": ("block_total", "h"),
+    "tachometer": ("tach_total", "h"),
+    "tach_time": ("tach_total", "h"),
+    "landings": ("flights", None),
+}
+
+
+def flight_end(flight: dict[str, Any]) -> datetime | None:
+    """Return when a logged flight ended, in UTC."""
+    try:
+        day = date.fromisoformat(flight["flight_datum"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    end = time(12)
+    for field in ("block_end", "airborne_end"):
+        try:
+            end = time.fromisoformat(flight[field])
+        except (KeyError, TypeError, ValueError):
+            continue
+        break
+    return dt_util.as_utc(
+        dt_util.start_of_local_day(day) + timedelta(hours=end.hour, minutes=end.minute)
+    )
+
+
+def hourly_deltas(
+    flights: list[dict[str, Any]],
+) -> dict[str, dict[datetime, float]]:
+    """Return the increase of each flight counter per hour."""
+    deltas: dict[str, dict[datetime, float]] = {
+        key: defaultdict(float) for key in FLIGHT_COUNTERS
+    }
+    for flight in flights:
+        end = flight_end(flight)
+        if end is None:
+            continue
+        hour = end.replace(minute=0, second=0, microsecond=0)
+        for key, (field, _) in FLIGHT_COUNTERS.items():
+            try:
+                value = float(flight[field])
+            except (KeyError, TypeError, ValueError):
+                continue
+            deltas[key][hour] += value
+    return deltas
+
+
+def build_hourly_statistics(
+    total: float,
+    last_sum: float,
+    deltas: dict[datetime, float],
+    start: datetime,
+    end: datetime,
+) -> list[dict[str, Any]]:
+    """Reconstruct hourly statistics of a counter from its current total.
+
+    Walking backwards from ``end``, the state of each hour is the current
+    total minus the flights logged after that hour. Sums are anchored so the
+    last hour continues from ``last_sum``, the sum the recorder has already
+    compiled, which keeps future statistics continuous.
+    """
+    running = total - sum(value for hour, value in deltas.items() if hour >= end)
+    anchor = running
+    rows: list[dict[str, Any]] = []
+    hour = end - timedelta(hours=1)
+    while hour >= start:
+        rows.append(
+            {
+                "start": hour,
+                "state": round(running, 2),
+                "sum": round(last_sum - (anchor - running), 2),
+            }
+        )
+        running -= deltas.get(hour, 0.0)
+        hour -= timedelta(hours=1)
+    rows.reverse()
+    return rows
+
+
+async def async_import_flight_statistics(runtime: MyWebLogRuntime, days: int) -> int:
+    """Backfill the statistics of the flight counter sensors of an entry.
+
+    The flight log of each tracked airplane is fetched once and turned into
+    hourly statistics, imported through the recorder in batches. Returns the
+    number of imported rows.
+    """
+    from homeassistant.components.recorder import get_instance  # type: ignore[import]
+    from homeassistant.components.recorder.statistics import (  # type: ignore[import]
+        async_import_statistics,
+        get_last_statistics,
+    )
+
+    hass = runtime.hass
+    ent_reg = er.async_get(hass)
+    end = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    start = end - timedelta(days=days)
+    imported = 0
+
+    for airplane_id, airplane in list(runtime.airplanes.items()):
+        prefix = airplane_unique_id_prefix(airplane["regnr"])
+        entity_ids = {
+            key: entity_id
+            for key in FLIGHT_COUNTERS
+            if (
+                entity_id := ent_reg.async_get_entity_id(
+                    "sensor", DOMAIN, f"{prefix}{key}"
+                )
+            )
+            is not None
+        }
+        if not entity_ids:
+            continue
+
+        result = await runtime.async_fetch_flight_log(
+            airplane_id,
+            dt_util.as_local(start).date(),
+            dt_util.as_local(end).date(),
+        )
+        deltas = hourly_deltas(result.get("FlightLog", []))
+
+        for key, entity_id in entity_ids.items():
+            state = hass.states.get(entity_id)
+            try:
+                total = float(state.state)  # type: ignore[union-attr]
+            except (AttributeError, TypeError, ValueError):
+                continue
+            last = await get_instance(hass).async_add_executor_job(
+                get_last_statistics, hass, 1, entity_id, False, {"sum"}
+            )
+            last_sum = (last.get(entity_id) or [{}])[0].get("sum") or 0.0
+            rows = build_hourly_statistics(total, last_sum, deltas[key], start, end)
+            metadata = {
+                "has_mean": False,
+                "has_sum": True,
+                "name": None,
+                "source": "recorder",
+                "statistic_id": entity_id,
+                "unit_of_measurement": FLIGHT_COUNTERS[key][1],
+            }
+            for index in range(0, len(rows), STATISTICS_IMPORT_BATCH_SIZE):
+                async_import_statistics(
+                    hass,
+                    metadata,  # type: ignore[arg-type]
+                    rows[index : index + STATISTICS_IMPORT_BATCH_SIZE],  # type: ignore[arg-type]
+                )
+            imported += len(rows)
+
+    _LOGGER.info("Imported %d hourly statistics for %d days", imported, days)
+    return imported
@@ -0,0 +1,136 @@
+"""Support for MyWeblog airplane in use binary sensors."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.components.binary_sensor import (  # type: ignore[import]
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry  # type: ignore[import]
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback  # type: ignore[import]
+from homeassistant.helpers.dispatcher import async_dispatcher_connect  # type: ignore[import]
+from homeassistant.helpers.entity import DeviceInfo  # type: ignore[import]
+from homeassistant.helpers.entity_platform import AddEntitiesCallback  # type: ignore[import]
+from homeassistant.helpers.event import async_track_point_in_utc_time  # type: ignore[import]
+from homeassistant.helpers.update_coordinator import CoordinatorEntity  # type: ignore[import]
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+
+from .const import DOMAIN, SIGNAL_AIRPLANES_UPDATED
+from .coordinator import MyWebLogRuntime, airplane_unique_id_prefix
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up myWebLog in use binary sensors from a config entry."""
+    runtime: MyWebLogRuntime = hass.data[DOMAIN][config_entry.entry_id]
+
+    @callback
+    def async_airplanes_updated(added: list[dict[str, Any]]) -> None:
+        """Add binary sensors for airplanes added while the entry is loaded."""
+        if added:
+            async_add_entities(
+                MyWebLogInUseBinarySensor(runtime, airplane) for airplane in added
+            )
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_AIRPLANES_UPDATED.format(config_entry.entry_id),
+            async_airplanes_updated,
+        )
+    )
+
+    async_add_entities(
+        MyWebLogInUseBinarySensor(runtime, airplane)
+        for airplane in runtime.airplanes.values()
+    )
+
+
+class MyWebLogInUseBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Binary sensor that is on while a myWebLog airplane is booked.
+
+    The state is looked up in the booking index when the bookings are
+    refreshed, and again exactly when the next booking starts or the current
+    one ends, so it flips on time without polling myWebLog in between.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "in_use"
+    _attr_name = "In use"
+    _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
+
+    def __init__(self, runtime: MyWebLogRuntime, airplane: dict[str, Any]) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(runtime.bookings_coordinators[airplane["id"]])
+        self._runtime = runtime
+        self._airplane_id = airplane["id"]
+        self._airplane_regnr = airplane["regnr"]
+        self._unsub_edge: CALLBACK_TYPE | None = None
+        self._attr_unique_id = (
+            f"{airplane_unique_id_prefix(self._airplane_regnr)}in_use"
+        )
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._airplane_regnr)},
+            name=self._airplane_regnr,
+            manufacturer="myWebLog",
+            model=airplane.get("title", self._airplane_regnr),
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Look up the state and follow the booking edges."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_edge)
+        self._async_update_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Look up the state in the refreshed bookings."""
+        self._async_update_state()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_edge(self, now: datetime) -> None:
+        """Look up the state as a booking starts or ends."""
+        self._unsub_edge = None
+        self._async_update_state()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_edge(self) -> None:
+        if self._unsub_edge is not None:
+            self._unsub_edge()
+            self._unsub_edge = None
+
+    @callback
+    def _async_update_state(self) -> None:
+        """Set the state from the ongoing booking and time the next edge."""
+        self._async_cancel_edge()
+        if self._airplane_id not in self._runtime.bookings_coordinators:
+            # The airplane is being removed
+            return
+        if self.coordinator.data is None:
+            # Not knowing the bookings is not knowing whether it is in use
+            self._attr_is_on = None
+            self._attr_extra_state_attributes = {}
+            return
+        index = self._runtime.get_booking_index(self._airplane_id)
+        now = dt_util.utcnow().timestamp()
+        booking = index.current(now)
+        self._attr_is_on = booking is not None
+        attributes: dict[str, Any] = {}
+        if booking is not None:
+            summary = self._runtime.get_booking_summary(self._airplane_id, booking)
+            if summary is not None:
+                attributes = {"booking_start": summary.start, **summary.attributes}
+        self._attr_extra_state_attributes = attributes
+
+        if (edge := index.next_change(now)) is not None:
+            self._unsub_edge = async_track_point_in_utc_time(
+                self.hass, self._async_edge, dt_util.utc_from_timestamp(edge)
+            )
@@ -0,0 +1,266 @@
+"""Booking helpers for the MyWeblog integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import accumulate
+from typing import Any
+
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+
+
+def booking_key(booking: dict[str, Any]) -> Any:
+    """Return the key identifying a booking across payloads."""
+    booking_id = booking.get("ID")
+    if booking_id is not None:
+        return str(booking_id)
+    return (booking.get("bStart"), booking.get("bEnd"), booking.get("user_id"))
+
+
+def _is_timestamp(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def format_booking_length(seconds: float) -> str:
+    """Return a duration like "1 day 2 hrs 30 min"."""
+    total_minutes = int(seconds / 60)
+    minutes = total_minutes % 60
+    total_hours = total_minutes // 60
+    hours = total_hours % 24
+    days = total_hours // 24
+
+    parts = []
+    if days > 0:
+        parts.append(f"{days} day{'s' if days != 1 else ''}")
+    if hours > 0 or days > 0:  # Show hours if there are days or hours
+        parts.append(f"{hours} hr{'s' if hours != 1 else ''}")
+    parts.append(f"{minutes} min")
+    return " ".join(parts)
+
+
+def _local_time(lt_obj: Any) -> str | None:
+    """Return a local time object of the API in ISO 8601, None if invalid."""
+    try:
+        dt_str = lt_obj.get("date")
+        try:
+            dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S.%f")
+        except ValueError:
+            dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
+        if (tz := dt_util.get_time_zone(lt_obj.get("timezone"))) is None:
+            return None
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return dt.replace(tzinfo=tz).isoformat()
+
+
+@dataclass(frozen=True)
+class BookingSummary:
+    """Display fields of a booking, computed once when it is ingested."""
+
+    start: str | None
+    end: str | None
+    attributes: dict[str, Any]
+
+    @classmethod
+    def from_booking(cls, booking: dict[str, Any]) -> BookingSummary:
+        """Compute the display fields of a booking."""
+        attributes: dict[str, Any] = {}
+        if fullname := booking.get("fullname"):
+            attributes["booked_by"] = fullname
+        student_name = booking.get("extra_elev_fullname")
+        if isinstance(student_name, str) and student_name.strip():
+            attributes["student_name"] = student_name.strip()
+        start, end = booking.get("bStart"), booking.get("bEnd")
+        if _is_timestamp(start) and _is_timestamp(end):
+            attributes["booking_length"] = format_booking_length(end - start)
+        end_time = _local_time(booking.get("bEndLTObj"))
+        if end_time is not None:
+            attributes["booking_end"] = end_time
+        return cls(_local_time(booking.get("bStartLTObj")), end_time, attributes)
+
+
+@dataclass
+class BookingChanges:
+    """Bookings created, updated and cancelled by one ingested payload."""
+
+    created: list[dict[str, Any]] = field(default_factory=list)
+    updated: list[tuple[dict[str, Any], dict[str, Any]]] = field(default_factory=list)
+    cancelled: list[dict[str, Any]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return whether there are any changes."""
+        return bool(self.created or self.updated or self.cancelled)
+
+
+class BookingStore:
+    """Bookings of one airplane, keyed by booking ID.
+
+    Each fetched window is merged into the store: fetched bookings replace
+    the stored ones with the same ID, stored bookings starting inside the
+    window that were not fetched again are dropped, and bookings that ended
+    before the expiry time are pruned.
+
+    The merge also diffs the payload against the stored bookings. The first
+    payload is the baseline and reports no changes. Bookings that only show
+    up because the window moved forward are not reported as created, and
+    pruned bookings are not reported as cancelled.
+
+    The display fields of each booking are summarized as it is merged, and
+    kept for as long as the booking is unchanged.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._bookings: dict[Any, dict[str, Any]] = {}
+        self._summaries: dict[Any, BookingSummary] = {}
+        self._sorted: list[dict[str, Any]] = []
+        self._window_end: float | None = None
+        self.changes = BookingChanges()
+
+    def __len__(self) -> int:
+        """Return the number of stored bookings."""
+        return len(self._bookings)
+
+    @property
+    def bookings(self) -> list[dict[str, Any]]:
+        """Return the stored bookings ordered by start time."""
+        return self._sorted
+
+    def ingest(
+        self,
+        bookings: list[dict[str, Any]],
+        window_start: float,
+        window_end: float,
+        expire_before: float,
+    ) -> list[dict[str, Any]]:
+        """Merge the bookings fetched for [window_start, window_end)."""
+        fetched = {booking_key(booking): booking for booking in bookings}
+        stored = self._bookings
+        previous_end = self._window_end
+        self._window_end = window_end
+        changes = self.changes = BookingChanges()
+
+        for key in list(stored):
+            if key in fetched:
+                continue
+            start = stored[key].get("bStart")
+            if not _is_timestamp(start) or window_start <= start < window_end:
+                changes.cancelled.append(stored.pop(key))
+
+        if previous_end is not None:
+            for key, booking in fetched.items():
+                old = stored.get(key)
+                if old is None:
+                    start = booking.get("bStart")
+                    if not _is_timestamp(start) or start < previous_end:
+                        changes.created.append(booking)
+                elif old != booking:
+                    changes.updated.append((old, booking))
+
+        summaries = self._summaries
+        for key, booking in fetched.items():
+            if key not in summaries or stored.get(key) != booking:
+                summaries[key] = BookingSummary.from_booking(booking)
+        stored.update(fetched)
+
+        for key in [
+            key
+            for key, booking in stored.items()
+            if _is_timestamp(booking.get("bEnd")) and booking["bEnd"] < expire_before
+        ]:
+            del stored[key]
+        for key in summaries.keys() - stored.keys():
+            del summaries[key]
+
+        self._sorted = sorted(
+            stored.values(),
+            key=lambda booking: (
+                booking["bStart"] if _is_timestamp(booking.get("bStart")) else 0
+            ),
+        )
+        return self._sorted
+
+    def summary(self, booking: dict[str, Any]) -> BookingSummary | None:
+        """Return the display fields of a stored booking."""
+        return self._summaries.get(booking_key(booking))
+
+
+class BookingIndex:
+    """Sorted interval index over the (bStart, bEnd) of bookings.
+
+    Bookings are sorted by start time once, together with a running maximum of
+    the end times. A range lookup bisects both arrays, so only bookings that
+    can overlap the range are visited, regardless of how many bookings are
+    indexed. Bookings without an end only take part in the lookup of the
+    next starting booking.
+    """
+
+    def __init__(self, bookings: list[dict[str, Any]]) -> None:
+        """Build the index from a list of bookings."""
+        started = sorted(
+            (booking for booking in bookings if _is_timestamp(booking.get("bStart"))),
+            key=lambda booking: booking["bStart"],
+        )
+        self._next_starts = [booking["bStart"] for booking in started]
+        self._next_bookings = started
+        intervals = sorted(
+            (
+                (booking["bStart"], booking["bEnd"], booking)
+                for booking in started
+                if _is_timestamp(booking.get("bEnd"))
+            ),
+            key=lambda interval: (interval[0], interval[1]),
+        )
+        self._starts = [interval[0] for interval in intervals]
+        self._ends = [interval[1] for interval in intervals]
+        self._max_ends = list(accumulate(self._ends, max))
+        self._bookings = [interval[2] for interval in intervals]
+
+    def __len__(self) -> int:
+        """Return the number of indexed bookings."""
+        return len(self._bookings)
+
+    def overlapping(self, start: float, end: float) -> list[dict[str, Any]]:
+        """Return the bookings overlapping [start, end), ordered by start."""
+        high = bisect_left(self._starts, end)
+        low = bisect_right(self._max_ends, start, 0, high)
+        ends = self._ends
+        return [self._bookings[i] for i in range(low, high) if ends[i] > start]
+
+    def next_starting(self, now: float) -> dict[str, Any] | None:
+        """Return the first booking starting after a moment."""
+        i = bisect_right(self._next_starts, now)
+        return self._next_bookings[i] if i < len(self._next_bookings) else None
+
+    def current(self, now: float) -> dict[str, Any] | None:
+        """Return the earliest started booking that is ongoing at a moment."""
+        ends = self._ends
+        for i in range(
+            bisect_right(self._max_ends, now), bisect_right(self._starts, now)
+        ):
+            if ends[i] > now:
+                return self._bookings[i]
+        return None
+
+    def next_change(self, now: float) -> float | None:
+        """Return when a booking next starts or ends after a moment."""
+        started = bisect_right(self._starts, now)
+        ends = self._ends
+        edges = [
+            ends[i]
+            for i in range(bisect_right(self._max_ends, now), started)
+            if ends[i] > now
+        ]
+        if started < len(self._starts):
+            edges.append(self._starts[started])
+        return min(edges, default=None)
+
+    def current_or_next(self, now: float) -> dict[str, Any] | None:
+        """Return the ongoing booking, or the next one if none is ongoing."""
+        ends = self._ends
+        for i in range(bisect_right(self._max_ends, now), len(ends)):
+            if ends[i] > now:
+                return self._bookings[i]
+        return None
@@ -0,0 +1,216 @@
+"""Support for MyWeblog booking calendars."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import heapq
+import logging
+from typing import Any
+
+from homeassistant.components.calendar import (  # type: ignore[import]
+    CalendarEntity,
+    CalendarEvent,
+)
+from homeassistant.config_entries import ConfigEntry  # type: ignore[import]
+from homeassistant.core import HomeAssistant, callback  # type: ignore[import]
+from homeassistant.helpers.dispatcher import async_dispatcher_connect  # type: ignore[import]
+from homeassistant.helpers.entity import DeviceInfo  # type: ignore[import]
+from homeassistant.helpers.entity_platform import AddEntitiesCallback  # type: ignore[import]
+from homeassistant.helpers.update_coordinator import CoordinatorEntity  # type: ignore[import]
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+
+from .const import DOMAIN, SIGNAL_AIRPLANES_UPDATED
+from .coordinator import MyWebLogRuntime, airplane_unique_id_prefix
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def booking_to_event(booking: dict[str, Any], regnr: str) -> CalendarEvent:
+    """Convert a myWebLog booking to a calendar event."""
+    fullname = (booking.get("fullname") or "").strip()
+    student_name = (booking.get("extra_elev_fullname") or "").strip()
+    description = [
+        text
+        for text in (
+            f"Student: {student_name}" if student_name else "",
+            (booking.get("fritext") or "").strip(),
+        )
+        if text
+    ]
+    return CalendarEvent(
+        start=dt_util.utc_from_timestamp(booking["bStart"]),
+        end=dt_util.utc_from_timestamp(booking["bEnd"]),
+        summary=f"{regnr}: {fullname}" if fullname else regnr,
+        description="\n".join(description) or None,
+        uid=str(booking["ID"]) if booking.get("ID") is not None else None,
+    )
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up myWebLog booking calendars from a config entry."""
+    runtime: MyWebLogRuntime = hass.data[DOMAIN][config_entry.entry_id]
+
+    @callback
+    def async_airplanes_updated(added: list[dict[str, Any]]) -> None:
+        """Add calendars for airplanes added while the entry is loaded."""
+        if added:
+            async_add_entities(
+                MyWebLogAirplaneCalendar(runtime, airplane) for airplane in added
+            )
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_AIRPLANES_UPDATED.format(config_entry.entry_id),
+            async_airplanes_updated,
+        )
+    )
+
+    calendars: list[CalendarEntity] = [
+        MyWebLogAirplaneCalendar(runtime, airplane)
+        for airplane in runtime.airplanes.values()
+    ]
+    calendars.append(MyWebLogFleetCalendar(runtime))
+    async_add_entities(calendars)
+
+
+class MyWebLogAirplaneCalendar(CoordinatorEntity, CalendarEntity):
+    """Calendar with the bookings of a myWebLog airplane."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "bookings"
+    _attr_name = "Bookings"
+
+    def __init__(self, runtime: MyWebLogRuntime, airplane: dict[str, Any]) -> None:
+        """Initialize the calendar."""
+        super().__init__(runtime.bookings_coordinators[airplane["id"]])
+        self._runtime = runtime
+        self._airplane_id = airplane["id"]
+        self._airplane_regnr = airplane["regnr"]
+        self._attr_unique_id = (
+            f"{airplane_unique_id_prefix(self._airplane_regnr)}bookings"
+        )
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._airplane_regnr)},
+            name=self._airplane_regnr,
+            manufacturer="myWebLog",
+            model=airplane.get("title", self._airplane_regnr),
+        )
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the ongoing or next booking."""
+        booking = self._runtime.get_booking_index(self._airplane_id).current_or_next(
+            dt_util.utcnow().timestamp()
+        )
+        if booking is None:
+            return None
+        return booking_to_event(booking, self._airplane_regnr)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the bookings between two points in time."""
+        index = self._runtime.get_booking_index(self._airplane_id)
+        return [
+            booking_to_event(booking, self._airplane_regnr)
+            for booking in index.overlapping(
+                start_date.timestamp(), end_date.timestamp()
+            )
+        ]
+
+
+class MyWebLogFleetCalendar(CalendarEntity):
+    """Calendar with the bookings of all tracked airplanes."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "fleet_bookings"
+    _attr_name = "Bookings"
+    _attr_should_poll = False
+
+    def __init__(self, runtime: MyWebLogRuntime) -> None:
+        """Initialize the fleet calendar."""
+        self._runtime = runtime
+        self._unsubs: dict[str, Any] = {}
+        self._attr_unique_id = "myweblog_fleet_bookings"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "fleet")},
+            name="MyWebLog Fleet",
+            manufacturer="myWebLog",
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the bookings coordinators of all airplanes."""
+        await super().async_added_to_hass()
+        self._async_track_coordinators()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_AIRPLANES_UPDATED.format(self._runtime.config_entry.entry_id),
+                self._async_airplanes_updated,
+            )
+        )
+        self.async_on_remove(self._async_untrack_coordinators)
+
+    @callback
+    def _async_track_coordinators(self) -> None:
+        """Listen to the bookings coordinators of the tracked airplanes."""
+        coordinators = self._runtime.bookings_coordinators
+        for airplane_id in list(self._unsubs):
+            if airplane_id not in coordinators:
+                self._unsubs.pop(airplane_id)()
+        for airplane_id, coordinator in coordinators.items():
+            if airplane_id not in self._unsubs:
+                self._unsubs[airplane_id] = coordinator.async_add_listener(
+                    self.async_write_ha_state
+                )
+
+    @callback
+    def _async_untrack_coordinators(self) -> None:
+        for unsub in self._unsubs.values():
+            unsub()
+        self._unsubs.clear()
+
+    @callback
+    def _async_airplanes_updated(self, added: list[dict[str, Any]]) -> None:
+        self._async_track_coordinators()
+        self.async_write_ha_state()
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the earliest ongoing or next booking of the fleet."""
+        now = dt_util.utcnow().timestamp()
+        candidates = []
+        for airplane_id, airplane in self._runtime.airplanes.items():
+            booking = self._runtime.get_booking_index(airplane_id).current_or_next(now)
+            if booking is not None:
+                candidates.append((booking["bStart"], booking, airplane["regnr"]))
+        if not candidates:
+            return None
+        _, booking, regnr = min(candidates, key=lambda candidate: candidate[0])
+        return booking_to_event(booking, regnr)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the bookings of all airplanes between two points in time."""
+        start, end = start_date.timestamp(), end_date.timestamp()
+        per_airplane = [
+            [
+                (booking["bStart"], booking, airplane["regnr"])
+                for booking in self._runtime.get_booking_index(airplane_id).overlapping(
+                    start, end
+                )
+            ]
+            for airplane_id, airplane in self._runtime.airplanes.items()
+        ]
+        return [
+            booking_to_event(booking, regnr)
+            for _, booking, regnr in heapq.merge(
+                *per_airplane, key=lambda item: item[0]
+            )
+        ]
@@ -0,0 +1,288 @@
+"""Recording and replay of myWebLog API traffic."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable
+import copy
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+import json
+import logging
+import time
+from typing import Any
+
+from aiohttp import ClientSession
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback  # type: ignore[import]
+from homeassistant.helpers.event import async_call_later  # type: ignore[import]
+
+from .api import MyWebLogSessionClient
+from .coordinator import MyWebLogRuntime
+
+_LOGGER = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+# Request fields that move with the clock and are not matched on in replay
+UNMATCHED_PARAMS = {"from_date", "to_date"}
+
+# Response fields naming, identifying or reaching members, or holding their
+# free texts, pseudonymized when recording
+PERSONAL_FIELDS = {
+    "completeMobile",
+    "elevuserid",
+    "email",
+    "extra_elev_fullname",
+    "fritext",
+    "fullname",
+    "remarkBy",
+    "remarkText",
+    "user_id",
+}
+
+
+@dataclass
+class Interaction:
+    """A request to the API and the result it got."""
+
+    qtype: str
+    params: dict[str, Any]
+    result: Any
+    duration: float
+
+    def match_key(self) -> tuple[str, str]:
+        """Return what a request has to agree on to be served this result."""
+        return _match_key(self.qtype, self.params)
+
+
+def _match_key(qtype: str, params: dict[str, Any]) -> tuple[str, str]:
+    return qtype, json.dumps(
+        {key: value for key, value in params.items() if key not in UNMATCHED_PARAMS},
+        sort_keys=True,
+        default=str,
+    )
+
+
+class Cassette(ABC):
+    """Hook of an API client into recorded traffic.
+
+    A cassette records the requests of the client unless it is replaying,
+    in which case the client asks it for the results instead.
+    """
+
+    replaying = False
+
+    def record(
+        self, qtype: str, params: dict[str, Any], result: Any, duration: float
+    ) -> None:
+        """Record a request the client made."""
+
+    @abstractmethod
+    async def async_play(self, qtype: str, params: dict[str, Any]) -> Any:
+        """Return the recorded result of a request."""
+
+
+class CassetteRecorder(Cassette):
+    """Record the requests of an API client with personal data replaced.
+
+    The credentials are never part of the request parameters passed to the
+    cassette. Names, contact details and free texts in the results are
+    replaced by pseudonyms numbered per field, so the same member gets the
+    same pseudonym throughout a cassette and its payloads keep their shape.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the recorder."""
+        self.interactions: list[Interaction] = []
+        self._pseudonyms: dict[str, dict[Any, str]] = defaultdict(dict)
+
+    def record(
+        self, qtype: str, params: dict[str, Any], result: Any, duration: float
+    ) -> None:
+        """Record a request the client made."""
+        self.interactions.append(
+            Interaction(qtype, dict(params), self._sanitize(result), round(duration, 3))
+        )
+
+    def _sanitize(self, value: Any, field: str | None = None) -> Any:
+        if isinstance(value, dict):
+            return {key: self._sanitize(item, key) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._sanitize(item, field) for item in value]
+        if (
+            field in PERSONAL_FIELDS
+            and isinstance(value, (str, int))
+            and not isinstance(value, bool)
+            and str(value).strip()
+        ):
+            pseudonyms = self._pseudonyms[field]
+            return pseudonyms.setdefault(value, f"{field} {len(pseudonyms) + 1}")
+        return value
+
+    async def async_play(self, qtype: str, params: dict[str, Any]) -> Any:
+        """Refuse to serve results, as a recorder is never replayed from."""
+        raise ValueError("A cassette being recorded cannot be replayed")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cassette in its file format."""
+        return {
+            "version": CASSETTE_VERSION,
+            "interactions": [asdict(interaction) for interaction in self.interactions],
+        }
+
+    def save(self, path: str) -> None:
+        """Write the cassette to a file, doing I/O."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.as_dict(), file, ensure_ascii=False, indent=1)
+
+
+class CassettePlayer(Cassette):
+    """Serve recorded results in place of the API.
+
+    A request is served the results recorded for the same query type and
+    parameters, apart from its date window, or failing that for the same
+    query type, in recorded order and starting over once all were served,
+    so a short recording can drive a long soak run. Each result is held back
+    for its recorded duration divided by the speed, a speed of 0 serving
+    results at once.
+    """
+
+    replaying = True
+
+    def __init__(self, interactions: list[Interaction], speed: float = 1.0) -> None:
+        """Initialize the player."""
+        self.speed = speed
+        self.served = 0
+        self._by_key: dict[tuple[str, str], list[Interaction]] = defaultdict(list)
+        self._by_qtype: dict[str, list[Interaction]] = defaultdict(list)
+        for interaction in interactions:
+            self._by_key[interaction.match_key()].append(interaction)
+            self._by_qtype[interaction.qtype].append(interaction)
+        self._turns: dict[Any, int] = defaultdict(int)
+
+    @classmethod
+    def load(cls, path: str, speed: float = 1.0) -> CassettePlayer:
+        """Load a cassette from a file, doing I/O."""
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')}")
+        return cls(
+            [Interaction(**interaction) for interaction in data["interactions"]], speed
+        )
+
+    async def async_play(self, qtype: str, params: dict[str, Any]) -> Any:
+        """Return the recorded result of a request."""
+        key: Any = _match_key(qtype, params)
+        if not (interactions := self._by_key.get(key)):
+            key = qtype
+            if not (interactions := self._by_qtype.get(qtype)):
+                raise ValueError(f"No recorded response to {qtype} {params}")
+        interaction = interactions[self._turns[key] % len(interactions)]
+        self._turns[key] += 1
+        if self.speed > 0 and interaction.duration > 0:
+            await asyncio.sleep(interaction.duration / self.speed)
+        self.served += 1
+        return copy.deepcopy(interaction.result)
+
+    def client_factory(self) -> type[MyWebLogSessionClient]:
+        """Return a client class replaying this cassette whatever it is given.
+
+        Patched in for the client of the coordinators, it runs an entry on
+        the cassette without any further setup.
+        """
+        player = self
+
+        class ReplayingClient(MyWebLogSessionClient):
+            def __init__(
+                self,
+                session: ClientSession,
+                username: str,
+                password: str,
+                app_token: str | None = None,
+                cassette: Cassette | None = None,
+            ) -> None:
+                super().__init__(session, username, password, app_token, player)
+
+        return ReplayingClient
+
+
+@callback
+def async_record_cassettes(
+    hass: HomeAssistant, runtimes: Iterable[MyWebLogRuntime], duration: timedelta
+) -> list[str]:
+    """Start recording the API traffic of config entries.
+
+    The entries are refreshed at once and then recorded in the background
+    until the duration has passed, after which a cassette per entry is
+    written to the config directory. Return the files that will be written.
+    """
+    stamp = int(time.time() * 1000)
+    recorders = {}
+    paths = []
+    for runtime in runtimes:
+        runtime.cassette = recorder = CassetteRecorder()
+        path = hass.config.path(
+            f"myweblog_cassette_{runtime.config_entry.entry_id}_{stamp}.json"
+        )
+        recorders[runtime] = (recorder, path)
+        paths.append(path)
+
+    finished = asyncio.Event()
+
+    @callback
+    def async_finish(now: datetime) -> None:
+        finished.set()
+
+    unsub = async_call_later(hass, duration, async_finish)
+    hass.async_create_background_task(
+        _async_record(hass, recorders, finished, unsub), "myweblog cassette recording"
+    )
+    return paths
+
+
+async def _async_record(
+    hass: HomeAssistant,
+    recorders: dict[MyWebLogRuntime, tuple[CassetteRecorder, str]],
+    finished: asyncio.Event,
+    unsub_finish: CALLBACK_TYPE,
+) -> None:
+    try:
+        await asyncio.gather(*(runtime.async_refresh() for runtime in recorders))
+        await finished.wait()
+    finally:
+        unsub_finish()
+        for runtime in recorders:
+            runtime.cassette = None
+
+    for runtime, (recorder, path) in recorders.items():
+        await hass.async_add_executor_job(recorder.save, path)
+        _LOGGER.info(
+            "Recorded %d requests of %s to %s",
+            len(recorder.interactions),
+            runtime.config_entry.title,
+            path,
+        )
+
+
+async def async_replay_cassette(
+    hass: HomeAssistant,
+    runtimes: Iterable[MyWebLogRuntime],
+    path: str | None,
+    speed: float,
+) -> None:
+    """Serve the requests of config entries from a cassette file.
+
+    Without a file the entries go back to the API. Either way they are
+    refreshed at once.
+    """
+    player = None
+    if path is not None:
+        player = await hass.async_add_executor_job(CassettePlayer.load, path, speed)
+    runtimes = list(runtimes)
+    for runtime in runtimes:
+        runtime.cassette = player
+    await asyncio.gather(*(runtime.async_refresh() for runtime in runtimes))
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
 from typing import Any
 
-from pyMyweblog import MyWebLogClient
 import voluptuous as vol  # type: ignore[import]
 
 from homeassistant import config_entries  # type: ignore[import]
@@ -14,8 +13,33 @@ from homeassistant.core import HomeAssistant  # type: ignore[import]
 from homeassistant.data_entry_flow import FlowResult  # type: ignore[import]
 from homeassistant.exceptions import HomeAssistantError  # type: ignore[import]
 from homeassistant.helpers import config_validation as cv  # type: ignore[import]
-
-from .const import APP_SECRET, DOMAIN
+from homeassistant.helpers import selector  # type: ignore[import]
+from homeassistant.helpers.aiohttp_client import async_get_clientsession  # type: ignore[import]
+
+from .api import MyWebLogSessionClient, async_call
+from .const import (
+    APP_SECRET,
+    CONF_BOOKINGS_DAYS_AHEAD,
+    CONF_BOOKINGS_DAYS_BACK,
+    CONF_BOOKINGS_INTERVAL,
+    CONF_FOLLOW_CLUB,
+    CONF_OBJECTS_INTERVAL,
+    CONF_POLLING_PROFILE,
+    CONF_QUIET_END,
+    CONF_QUIET_START,
+    CONF_REFRESH_TIMEOUT,
+    CONF_REQUEST_TIMEOUT,
+    DEFAULT_BOOKINGS_DAYS_AHEAD,
+    DEFAULT_BOOKINGS_DAYS_BACK,
+    DEFAULT_REFRESH_TIMEOUT,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    POLLING_PROFILES,
+    PROFILE_CUSTOM,
+    PROFILE_STANDARD,
+)
+from .helpers import entry_title, extract_airplanes, is_auth_error
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,52 +51,32 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
-def is_auth_error(err: Exception) -> bool:
-    """Check if an exception indicates an authentication error."""
-    err_str = str(err).lower()
-    return (
-        "ogiltigt" in err_str
-        or "invalid" in err_str
-        or "auth" in err_str
-        or "unauthorized" in err_str
-        or "forbidden" in err_str
-        or "401" in err_str
-        or "403" in err_str
-    )
-
-
 async def validate_credentials(
     hass: HomeAssistant, username: str, password: str
 ) -> tuple[list[dict[str, Any]], str]:
     """Validate the user credentials and return (airplanes, app_token)."""
     _LOGGER.debug("Validating credentials for username=%s", username)
     try:
-        async with MyWebLogClient(username, password) as client:
-            app_token = await client.obtainAppToken(APP_SECRET)
-            result = await client.getObjects()
-
-            # Filter out non-planes and extract required data
-            airplanes = []
-
-            callsign_pattern = re.compile(r"^[A-Z0-9]{1,2}-[A-Z0-9]+$", re.IGNORECASE)
-            for obj in result.get("Object", []):
-                regnr = obj.get("regnr", "")
-                plane_id = obj.get("ID")
-                if callsign_pattern.match(regnr) and plane_id:
-                    airplanes.append(
-                        {
-                            "id": plane_id,
-                            "regnr": regnr,
-                            "title": f"{regnr} ({obj.get('model', '')})",
-                        }
-                    )
-            _LOGGER.info(
-                "Validated credentials for %s, found %d airplanes",
-                username,
-                len(airplanes),
-            )
-            return airplanes, app_token or ""
+        async with asyncio.timeout(DEFAULT_REFRESH_TIMEOUT):
+            async with MyWebLogSessionClient(
+                async_get_clientsession(hass), username, password
+            ) as client:
+                app_token = await async_call(
+                    client.obtainAppToken(APP_SECRET), DEFAULT_REQUEST_TIMEOUT
+                )
+                result = await async_call(client.getObjects(), DEFAULT_REQUEST_TIMEOUT)
 
+                airplanes = extract_airplanes(result.get("Object", []))
+                _LOGGER.info(
+                    "Validated credentials for %s, found %d airplanes",
+                    username,
+                    len(airplanes),
+                )
+                return airplanes, app_token or ""
+
+    except TimeoutError as err:
+        _LOGGER.error("Credential validation timed out for username=%s", username)
+        raise CannotConnect from err
     except Exception as err:
         _LOGGER.error("Credential validation failed for username=%s: %s", username, err)
         if is_auth_error(err):
@@ -202,7 +206,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[misc
 
             # Create a summary title with the number of planes
             planes_count = len(selected_planes)
-            title = f"MyWeblog ({self._username} - {planes_count} {'plane' if planes_count == 1 else 'planes'})"
+            title = entry_title(self._username, planes_count)
 
             _LOGGER.info(
                 "Config flow: selected %d airplanes for user %s",
@@ -242,6 +246,33 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[misc
         return self.hass.config_entries.async_get_entry(self.context["entry_id"])
 
 
+# Intervals, in minutes, the custom polling profile starts from
+DEFAULT_OBJECTS_INTERVAL = int(
+    POLLING_PROFILES[PROFILE_STANDARD][0].total_seconds() // 60
+)
+DEFAULT_BOOKINGS_INTERVAL = int(
+    POLLING_PROFILES[PROFILE_STANDARD][1].total_seconds() // 60
+)
+
+
+def polling_options(user_input: dict[str, Any]) -> dict[str, Any]:
+    """Return the polling options of a submitted options form.
+
+    Cleared quiet hours are stored as None, so they replace earlier ones.
+    """
+    return {
+        CONF_POLLING_PROFILE: user_input.get(CONF_POLLING_PROFILE, PROFILE_STANDARD),
+        CONF_OBJECTS_INTERVAL: user_input.get(
+            CONF_OBJECTS_INTERVAL, DEFAULT_OBJECTS_INTERVAL
+        ),
+        CONF_BOOKINGS_INTERVAL: user_input.get(
+            CONF_BOOKINGS_INTERVAL, DEFAULT_BOOKINGS_INTERVAL
+        ),
+        CONF_QUIET_START: user_input.get(CONF_QUIET_START),
+        CONF_QUIET_END: user_input.get(CONF_QUIET_END),
+    }
+
+
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow for MyWeblog."""
 
@@ -272,17 +303,24 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         current_airplanes = entry.data.get("airplanes", [])
         current_regnrs = {plane["regnr"] for plane in current_airplanes}
 
-        if user_input is not None:
+        if user_input is not None and (CONF_QUIET_START in user_input) != (
+            CONF_QUIET_END in user_input
+        ):
+            errors["base"] = "quiet_hours_incomplete"
+        elif user_input is not None:
             try:
                 # Fetch available airplanes from API
                 airplanes, app_token = await validate_credentials(
                     self.hass, username, password
                 )
 
-                # Find selected airplanes
+                # Find selected airplanes, or all of them when following the club
+                follow_club = user_input.get(CONF_FOLLOW_CLUB, False)
                 selected_regnrs = set(user_input.get("airplanes", []))
                 selected_planes = [
-                    plane for plane in airplanes if plane["regnr"] in selected_regnrs
+                    plane
+                    for plane in airplanes
+                    if follow_club or plane["regnr"] in selected_regnrs
                 ]
 
                 if not selected_planes:
@@ -299,7 +337,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     ]
 
                     planes_count = len(planes_data)
-                    title = f"MyWeblog ({username} - {planes_count} {'plane' if planes_count == 1 else 'planes'})"
+                    title = entry_title(username, planes_count)
 
                     _LOGGER.info(
                         "Options flow: updating to %d airplanes for user %s",
@@ -316,8 +354,30 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             "app_token": app_token,
                         },
                     )
-                    await self.hass.config_entries.async_reload(entry.entry_id)
-                    return self.async_create_entry(title="", data={})
+                    # A loaded entry applies the new selection incrementally
+                    # from its update listener; otherwise set it up from scratch.
+                    if entry.state is not config_entries.ConfigEntryState.LOADED:
+                        await self.hass.config_entries.async_reload(entry.entry_id)
+                    return self.async_create_entry(
+                        title="",
+                        data={
+                            **entry.options,
+                            CONF_FOLLOW_CLUB: follow_club,
+                            CONF_BOOKINGS_DAYS_BACK: user_input.get(
+                                CONF_BOOKINGS_DAYS_BACK, DEFAULT_BOOKINGS_DAYS_BACK
+                            ),
+                            CONF_BOOKINGS_DAYS_AHEAD: user_input.get(
+                                CONF_BOOKINGS_DAYS_AHEAD, DEFAULT_BOOKINGS_DAYS_AHEAD
+                            ),
+                            CONF_REQUEST_TIMEOUT: user_input.get(
+                                CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT
+                            ),
+                            CONF_REFRESH_TIMEOUT: user_input.get(
+                                CONF_REFRESH_TIMEOUT, DEFAULT_REFRESH_TIMEOUT
+                            ),
+                            **polling_options(user_input),
+                        },
+                    )
             except CannotConnect:
                 _LOGGER.error("Options flow: cannot connect")
                 errors["base"] = "cannot_connect"
@@ -343,13 +403,76 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             {
                 vol.Required(
                     "airplanes", default=list(current_regnrs)
-                ): cv.multi_select(airplane_titles)
+                ): cv.multi_select(airplane_titles),
+                vol.Optional(
+                    CONF_FOLLOW_CLUB,
+                    default=entry.options.get(CONF_FOLLOW_CLUB, False),
+                ): bool,
+                vol.Optional(
+                    CONF_BOOKINGS_DAYS_BACK,
+                    default=entry.options.get(
+                        CONF_BOOKINGS_DAYS_BACK, DEFAULT_BOOKINGS_DAYS_BACK
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=365)),
+                vol.Optional(
+                    CONF_BOOKINGS_DAYS_AHEAD,
+                    default=entry.options.get(
+                        CONF_BOOKINGS_DAYS_AHEAD, DEFAULT_BOOKINGS_DAYS_AHEAD
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=365)),
+                vol.Optional(
+                    CONF_REQUEST_TIMEOUT,
+                    default=entry.options.get(
+                        CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+                vol.Optional(
+                    CONF_REFRESH_TIMEOUT,
+                    default=entry.options.get(
+                        CONF_REFRESH_TIMEOUT, DEFAULT_REFRESH_TIMEOUT
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=900)),
+                vol.Optional(
+                    CONF_POLLING_PROFILE,
+                    default=entry.options.get(CONF_POLLING_PROFILE, PROFILE_STANDARD),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[*POLLING_PROFILES, PROFILE_CUSTOM],
+                        translation_key=CONF_POLLING_PROFILE,
+                        mode=selector.SelectSelectorMode.DROPDOWN,
+                    )
+                ),
+                vol.Optional(
+                    CONF_OBJECTS_INTERVAL,
+                    default=entry.options.get(
+                        CONF_OBJECTS_INTERVAL, DEFAULT_OBJECTS_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=15, max=1440)),
+                vol.Optional(
+                    CONF_BOOKINGS_INTERVAL,
+                    default=entry.options.get(
+                        CONF_BOOKINGS_INTERVAL, DEFAULT_BOOKINGS_INTERVAL
+                    ),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=DEFAULT_SCAN_INTERVAL // 60, max=1440),
+                ),
+                # Quiet hours can be cleared, so they are suggested rather
+                # than defaulted
+                vol.Optional(
+                    CONF_QUIET_START,
+                    description={
+                        "suggested_value": entry.options.get(CONF_QUIET_START)
+                    },
+                ): selector.TimeSelector(),
+                vol.Optional(
+                    CONF_QUIET_END,
+                    description={"suggested_value": entry.options.get(CONF_QUIET_END)},
+                ): selector.TimeSelector(),
             }
         )
 
-        return self.async_show_form(
-            step_id="init", data_schema=schema, errors=errors
-        )
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
 
 
 class CannotConnect(HomeAssistantError):
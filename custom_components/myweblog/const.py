@@ -5,7 +5,83 @@ from datetime import timedelta
 APP_SECRET = "**--hidden--**"
 DOMAIN = "myweblog"
 
+CONF_FOLLOW_CLUB = "follow_club"
+CONF_BOOKINGS_DAYS_BACK = "bookings_days_back"
+CONF_BOOKINGS_DAYS_AHEAD = "bookings_days_ahead"
+CONF_REQUEST_TIMEOUT = "request_timeout"
+CONF_REFRESH_TIMEOUT = "refresh_timeout"
+CONF_POLLING_PROFILE = "polling_profile"
+CONF_OBJECTS_INTERVAL = "objects_interval"
+CONF_BOOKINGS_INTERVAL = "bookings_interval"
+CONF_QUIET_START = "quiet_start"
+CONF_QUIET_END = "quiet_end"
+
+# Bookings are fetched for this window around today
+DEFAULT_BOOKINGS_DAYS_BACK = 1
+DEFAULT_BOOKINGS_DAYS_AHEAD = 30
+
+# Shortest interval at which bookings are polled
 DEFAULT_SCAN_INTERVAL = 300  # 5 minutes
 
+# Seconds a single API call, and a whole refresh including opening and
+# closing the client session, may take before they are cancelled
+DEFAULT_REQUEST_TIMEOUT = 30
+DEFAULT_REFRESH_TIMEOUT = 90
+
+# API responses larger than this are JSON decoded in the executor
+EXECUTOR_DECODE_BYTES = 256 * 1024
+
+# Seconds a callback may hold the event loop before it is reported as slow,
+# and seconds between the warnings about the same callback
+LOOP_BLOCK_THRESHOLD = 0.05
+LOOP_BLOCK_WARN_INTERVAL = 900
+
+# hass.data key of the poll scheduler shared by all config entries
+DATA_POLL_SCHEDULER = "myweblog_poll_scheduler"
+
 OBJECTS_UPDATE_INTERVAL = timedelta(hours=1)
 BOOKINGS_UPDATE_INTERVAL = timedelta(minutes=15)
+
+# Polling profiles and their objects and bookings update intervals. The
+# custom profile takes both intervals, in minutes, from the options.
+PROFILE_ECONOMY = "economy"
+PROFILE_STANDARD = "standard"
+PROFILE_FLIGHT_DAY = "flight_day"
+PROFILE_CUSTOM = "custom"
+POLLING_PROFILES = {
+    PROFILE_ECONOMY: (timedelta(hours=4), timedelta(hours=1)),
+    PROFILE_STANDARD: (OBJECTS_UPDATE_INTERVAL, BOOKINGS_UPDATE_INTERVAL),
+    PROFILE_FLIGHT_DAY: (
+        timedelta(minutes=15),
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+    ),
+}
+
+# Airplanes with fewer hours to maintenance count as due in the fleet sensors
+FLEET_MAINTENANCE_DUE_HOURS = 10
+
+# Dispatcher signal sent when airplanes are added to or removed from an entry
+SIGNAL_AIRPLANES_UPDATED = "myweblog_airplanes_updated_{}"
+
+# Events fired when a refresh finds created, moved or cancelled bookings
+EVENT_BOOKING_CREATED = "myweblog_booking_created"
+EVENT_BOOKING_UPDATED = "myweblog_booking_updated"
+EVENT_BOOKING_CANCELLED = "myweblog_booking_cancelled"
+
+# Events fired when a refresh finds opened or closed remarks
+EVENT_REMARK_OPENED = "myweblog_remark_opened"
+EVENT_REMARK_CLOSED = "myweblog_remark_closed"
+
+# Days of recorded flight time history used to forecast maintenance
+FORECAST_HISTORY_DAYS = 30
+
+# Hourly statistics are handed to the recorder in batches of this size
+STATISTICS_IMPORT_BATCH_SIZE = 500
+DEFAULT_STATISTICS_IMPORT_DAYS = 90
+FLIGHT_LOG_LIMIT = 5000
+
+SERVICE_IMPORT_STATISTICS = "import_statistics"
+SERVICE_PROFILE = "profile"
+SERVICE_RECORD_CASSETTE = "record_cassette"
+SERVICE_REFRESH = "refresh"
+SERVICE_REPLAY_CASSETTE = "replay_cassette"
@@ -0,0 +1,895 @@
+"""Data coordinators and shared runtime state for the MyWeblog integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from datetime import date, time as dt_time, timedelta
+import logging
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from homeassistant import config_entries  # type: ignore[import]
+from homeassistant.config_entries import ConfigEntry  # type: ignore[import]
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback  # type: ignore[import]
+from homeassistant.helpers import device_registry as dr  # type: ignore[import]
+from homeassistant.helpers import entity_registry as er  # type: ignore[import]
+from homeassistant.helpers.aiohttp_client import async_get_clientsession  # type: ignore[import]
+from homeassistant.helpers.dispatcher import async_dispatcher_send  # type: ignore[import]
+from homeassistant.helpers.update_coordinator import (  # type: ignore[import]
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+
+from .api import ApiStats, MyWebLogSessionClient, SingleFlight, async_call
+from .objects import ProjectionSpec, project_objects
+from .bookings import BookingChanges, BookingIndex, BookingStore, BookingSummary
+from .const import (
+    CONF_BOOKINGS_DAYS_AHEAD,
+    CONF_BOOKINGS_DAYS_BACK,
+    CONF_BOOKINGS_INTERVAL,
+    CONF_FOLLOW_CLUB,
+    CONF_OBJECTS_INTERVAL,
+    CONF_POLLING_PROFILE,
+    CONF_QUIET_END,
+    CONF_QUIET_START,
+    CONF_REFRESH_TIMEOUT,
+    CONF_REQUEST_TIMEOUT,
+    DEFAULT_BOOKINGS_DAYS_AHEAD,
+    DEFAULT_BOOKINGS_DAYS_BACK,
+    DEFAULT_REFRESH_TIMEOUT,
+    DEFAULT_REQUEST_TIMEOUT,
+    DOMAIN,
+    EVENT_BOOKING_CANCELLED,
+    EVENT_BOOKING_CREATED,
+    EVENT_BOOKING_UPDATED,
+    EVENT_REMARK_CLOSED,
+    EVENT_REMARK_OPENED,
+    FLIGHT_LOG_LIMIT,
+    POLLING_PROFILES,
+    PROFILE_CUSTOM,
+    PROFILE_STANDARD,
+    SIGNAL_AIRPLANES_UPDATED,
+)
+from .helpers import (
+    async_import_module,
+    entry_title,
+    extract_airplanes,
+    is_auth_error,
+)
+from .publisher import MyWebLogStatePublisher
+from .remarks import REMARK_COLORS, RemarkIndex, remark_title
+from .scheduler import async_get_poll_scheduler, quiet_hours_end
+from .watchdog import LoopWatchdog
+
+if TYPE_CHECKING:
+    from .cassette import Cassette
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Schema variants of the flight counters in a getObjects payload
+SCHEMA_FLIGHT_DATA = "flightData"
+SCHEMA_FT_DATA = "ftData"
+
+
+def detect_objects_schema(objects: list[dict[str, Any]]) -> str:
+    """Return which flight counter schema variant an objects payload uses."""
+    for obj in objects:
+        if not isinstance(obj, dict):
+            continue
+        flight_data = obj.get("flightData")
+        if isinstance(flight_data, dict) and isinstance(flight_data.get("total"), dict):
+            return SCHEMA_FLIGHT_DATA
+        if isinstance(obj.get("ftData"), dict):
+            return SCHEMA_FT_DATA
+    return SCHEMA_FLIGHT_DATA
+
+
+def airplane_unique_id_prefix(regnr: str) -> str:
+    """Return the unique_id prefix shared by all entities of an airplane."""
+    return f"myweblog_{regnr.lower().replace('-', '_')}_"
+
+
+def booking_event_data(booking: dict[str, Any]) -> dict[str, Any]:
+    """Return the event data describing a booking."""
+
+    def timestamp(value: Any) -> str | None:
+        if not isinstance(value, (int, float)):
+            return None
+        return dt_util.utc_from_timestamp(value).isoformat()
+
+    return {
+        "booking_id": booking.get("ID"),
+        "start": timestamp(booking.get("bStart")),
+        "end": timestamp(booking.get("bEnd")),
+        "booked_by": (booking.get("fullname") or "").strip() or None,
+        "student_name": (booking.get("extra_elev_fullname") or "").strip() or None,
+    }
+
+
+def remark_event_data(remark: dict[str, Any]) -> dict[str, Any]:
+    """Return the event data describing a remark."""
+    category = remark.get("remarkCategory")
+    return {
+        "remark_id": remark.get("remarkID"),
+        "category": category,
+        "color": REMARK_COLORS.get(category),
+        "title": remark_title(remark),
+        "text": remark.get("remarkText"),
+        "reported_by": remark.get("remarkBy"),
+        "date": remark.get("remarkDate"),
+    }
+
+
+class StaggeredCoordinator(DataUpdateCoordinator[_T]):
+    """DataUpdateCoordinator polling in its slot of the poll scheduler.
+
+    A plain coordinator polls one interval after its last refresh, so the
+    coordinators set up together poll together. This one waits for its slot
+    instead, which spreads the polls of the domain over the interval.
+
+    Polling is demand driven: only listeners of enabled entities keep the
+    coordinator polling, while passive listeners of the runtime are updated
+    with whatever the entities fetch. When the first entity subscribes to a
+    coordinator whose data is missing or older than an interval, a refresh
+    is requested right away.
+
+    The listeners are timed in the loop watchdog, the passive ones each on
+    their own and the entities together.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: logging.Logger,
+        *,
+        name: str,
+        poll_key: Hashable,
+        watchdog: LoopWatchdog,
+        update_method: Callable[[], Awaitable[_T]],
+        update_interval: timedelta,
+        quiet_hours: tuple[dt_time, dt_time] | None = None,
+    ) -> None:
+        """Initialize the coordinator and claim its slot."""
+        super().__init__(
+            hass,
+            logger,
+            name=name,
+            update_method=update_method,
+            update_interval=update_interval,
+        )
+        self._poll_key = poll_key
+        self._watchdog = watchdog
+        self.quiet_hours = quiet_hours
+        self._scheduler = async_get_poll_scheduler(hass)
+        self._unregister_poll = self._scheduler.async_register(poll_key)
+        self._passive_listeners: dict[CALLBACK_TYPE, None] = {}
+        self._fetched_at: float | None = None
+
+    @property
+    def has_demand(self) -> bool:
+        """Return whether an entity depends on the data."""
+        return bool(self._listeners)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, fetching when demand resumes on old data."""
+        idle = not self._listeners
+        remove_listener = super().async_add_listener(update_callback, context)
+        if idle and self._is_stale():
+            self.hass.async_create_task(
+                self.async_request_refresh(), f"{self.name} demand refresh"
+            )
+        return remove_listener
+
+    @callback
+    def async_add_passive_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> Callable[[], None]:
+        """Listen for data updates without keeping the coordinator polling."""
+        self._passive_listeners[update_callback] = None
+
+        @callback
+        def remove_listener() -> None:
+            self._passive_listeners.pop(update_callback, None)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the passive listeners, then the entities."""
+        for update_callback in list(self._passive_listeners):
+            with self._watchdog.timed(self.name, update_callback.__name__):
+                update_callback()
+        with self._watchdog.timed(self.name, "update_listeners"):
+            super().async_update_listeners()
+
+    def _is_stale(self) -> bool:
+        """Return whether the data is missing or older than one interval."""
+        if self._fetched_at is None:
+            return True
+        if self.update_interval is None:
+            return False
+        age = self.hass.loop.time() - self._fetched_at
+        return age >= self.update_interval.total_seconds()
+
+    async def _async_update_data(self) -> _T:
+        """Fetch the data and note when."""
+        data = await super()._async_update_data()
+        self._fetched_at = self.hass.loop.time()
+        return data
+
+    def poll_offset(self) -> float | None:
+        """Return the seconds into each interval at which this one polls."""
+        if self.update_interval is None:
+            return None
+        return self._scheduler.offset(
+            self._poll_key, self.update_interval.total_seconds()
+        )
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh in the slot of this coordinator."""
+        if self.update_interval is None:
+            return
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+        self._async_unsub_refresh()
+        loop = self.hass.loop
+        interval = self.update_interval.total_seconds()
+        delay = self._scheduler.delay(self._poll_key, interval)
+        if self.quiet_hours is not None and (
+            quiet_end := quiet_hours_end(
+                dt_util.utcnow() + timedelta(seconds=delay), self.quiet_hours
+            )
+        ):
+            # Resume in the first slot after the quiet hours
+            delay = self._scheduler.delay(
+                self._poll_key, interval, not_before=quiet_end.timestamp()
+            )
+        self._unsub_refresh = loop.call_at(
+            loop.time() + delay, self.hass.async_run_hass_job, self._job
+        ).cancel
+
+    @callback
+    def async_set_polling(
+        self, update_interval: timedelta, quiet_hours: tuple[dt_time, dt_time] | None
+    ) -> None:
+        """Change the interval and quiet hours, rescheduling a pending poll."""
+        if (update_interval, quiet_hours) == (self.update_interval, self.quiet_hours):
+            return
+        self.update_interval = update_interval
+        self.quiet_hours = quiet_hours
+        if self._unsub_refresh is not None:
+            self._schedule_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the polls and free the slot."""
+        await super().async_shutdown()
+        self._unregister_poll()
+
+
+class MyWebLogRuntime:
+    """Coordinators and tracked airplanes for one myWebLog config entry.
+
+    The objects coordinator is shared by all airplanes, while each airplane has
+    its own bookings coordinator. Airplanes can be added and removed while the
+    entry is loaded without touching the coordinators of the other airplanes.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialize the runtime."""
+        self.hass = hass
+        self.config_entry = config_entry
+        self.airplanes: dict[str, dict[str, Any]] = {}
+        self.bookings_coordinators: dict[str, StaggeredCoordinator] = {}
+        self.watchdog = LoopWatchdog()
+        self.publisher = MyWebLogStatePublisher(self.watchdog)
+        self.api_stats = ApiStats()
+        # Refreshes of the same resource share one in-flight request
+        self.single_flight = SingleFlight(hass)
+        # Both the data and the options update of an options flow fire the
+        # update listener, so airplane updates must not interleave
+        self._update_lock = asyncio.Lock()
+        # Records or replays the API traffic while set
+        self.cassette: Cassette | None = None
+        objects_interval, _, quiet_hours = self.polling_options()
+        self.objects_coordinator = StaggeredCoordinator(
+            hass,
+            _LOGGER,
+            name="myweblog_airplanes_objects",
+            poll_key=(config_entry.entry_id, "objects"),
+            watchdog=self.watchdog,
+            update_method=self._async_update_objects,
+            update_interval=objects_interval,
+            quiet_hours=quiet_hours,
+        )
+        # Manually track last successful update time
+        self.objects_coordinator._last_update_success_timestamp = None  # type: ignore
+        self.objects_schema = SCHEMA_FLIGHT_DATA
+        self._objects_by_id: dict[str, dict[str, Any]] = {}
+        self._indexed_objects: list[dict[str, Any]] | None = None
+        # Airplanes whose objects were kept with all fields in use
+        self._projected_ids: set[str] = set()
+        self._object_fields: ProjectionSpec | None = None
+        self._remark_indexes: dict[str, RemarkIndex] = {}
+        self._tracked_remarks: dict[str, dict[Any, dict[str, Any]]] = {}
+        self._booking_stores: dict[str, BookingStore] = {}
+        self._bookings_window = self.bookings_window_options()
+        self._booking_indexes: dict[
+            str, tuple[list[dict[str, Any]] | None, BookingIndex]
+        ] = {}
+
+    def _index_objects(self) -> None:
+        """Index the current objects payload, once per payload."""
+        objects = self.objects_coordinator.data
+        if objects is self._indexed_objects:
+            return
+        self._indexed_objects = objects
+        objects = objects or []
+        self._objects_by_id = {
+            obj.get("ID"): obj for obj in reversed(objects) if isinstance(obj, dict)
+        }
+        self._remark_indexes = {}
+        self.objects_schema = detect_objects_schema(objects)
+        _LOGGER.debug("Indexed objects payload, schema=%s", self.objects_schema)
+
+    def get_airplane_object(self, airplane_id: str) -> dict[str, Any] | None:
+        """Return the object of an airplane from the current objects payload."""
+        self._index_objects()
+        return self._objects_by_id.get(airplane_id)
+
+    def get_remark_index(self, airplane_id: str) -> RemarkIndex:
+        """Return the remark index of an airplane, built once per payload."""
+        self._index_objects()
+        index = self._remark_indexes.get(airplane_id)
+        if index is None:
+            obj = self._objects_by_id.get(airplane_id) or {}
+            index = RemarkIndex(obj.get("activeRemarks"))
+            self._remark_indexes[airplane_id] = index
+        return index
+
+    def get_booking_index(self, airplane_id: str) -> BookingIndex:
+        """Return the booking index of an airplane, built once per payload."""
+        if (coordinator := self.bookings_coordinators.get(airplane_id)) is None:
+            # The airplane is being removed
+            return BookingIndex([])
+        bookings = coordinator.data
+        cached = self._booking_indexes.get(airplane_id)
+        if cached is not None and cached[0] is bookings:
+            return cached[1]
+        index = BookingIndex(bookings or [])
+        self._booking_indexes[airplane_id] = (bookings, index)
+        return index
+
+    def get_next_booking(self, airplane_id: str, now: float) -> BookingSummary | None:
+        """Return the display fields of the next booking of an airplane."""
+        if airplane_id not in self._booking_stores:
+            # The airplane is being removed
+            return None
+        booking = self.get_booking_index(airplane_id).next_starting(now)
+        if booking is None:
+            return None
+        return self.get_booking_summary(airplane_id, booking)
+
+    def get_booking_summary(
+        self, airplane_id: str, booking: dict[str, Any]
+    ) -> BookingSummary | None:
+        """Return the display fields of a booking of an airplane."""
+        if (store := self._booking_stores.get(airplane_id)) is None:
+            # The airplane is being removed
+            return None
+        return store.summary(booking)
+
+    def get_objects_schema(self) -> str:
+        """Return the schema variant of the current objects payload."""
+        self._index_objects()
+        return self.objects_schema
+
+    def _credentials(self) -> tuple[str, str, str]:
+        """Return the current credentials of the config entry."""
+        username = self.config_entry.data.get("username")
+        password = self.config_entry.data.get("password")
+        app_token = self.config_entry.data.get("app_token")
+        if (
+            not isinstance(username, str)
+            or not isinstance(password, str)
+            or not isinstance(app_token, str)
+        ):
+            raise TypeError("Missing or invalid credentials for myWebLog integration")
+        return username, password, app_token
+
+    def timeout_options(self) -> tuple[float, float]:
+        """Return the configured per-call and per-refresh deadlines."""
+        options = self.config_entry.options
+        return (
+            options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT),
+            options.get(CONF_REFRESH_TIMEOUT, DEFAULT_REFRESH_TIMEOUT),
+        )
+
+    async def _async_request(
+        self, request: Callable[[MyWebLogSessionClient], Awaitable[_T]]
+    ) -> _T:
+        """Make an API call on the shared HTTP session under the deadlines.
+
+        The call is bounded by the per-call deadline, and the whole request
+        including setting up and releasing the client by the per-refresh one.
+        A call running out of time is cancelled and the client still released.
+        """
+        username, password, app_token = self._credentials()
+        call_timeout, refresh_timeout = self.timeout_options()
+        self.api_stats.requests += 1
+        try:
+            async with asyncio.timeout(refresh_timeout):
+                async with MyWebLogSessionClient(
+                    async_get_clientsession(self.hass),
+                    username,
+                    password,
+                    app_token,
+                    self.cassette,
+                ) as client:
+                    return await async_call(request(client), call_timeout)
+        except TimeoutError:
+            self.api_stats.record_timeout()
+            raise
+        except Exception as err:
+            self.api_stats.record_error(err)
+            raise
+
+    def _update_failed(self, err: Exception, message: str) -> UpdateFailed:
+        """Return the UpdateFailed for an error, starting re-auth if needed."""
+        if isinstance(err, TimeoutError):
+            return UpdateFailed(f"{message}: timed out")
+        if is_auth_error(err):
+            _LOGGER.warning(
+                "Authentication error detected, triggering re-authentication"
+            )
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={
+                        "source": config_entries.SOURCE_REAUTH,
+                        "entry_id": self.config_entry.entry_id,
+                    },
+                    data=self.config_entry.data,
+                )
+            )
+            return UpdateFailed("Authentication failed, please re-authenticate")
+        return UpdateFailed(f"{message}: {err}")
+
+    async def _async_update_objects(self) -> list[dict[str, Any]]:
+        """Fetch the objects, or join the fetch in flight."""
+        return await self.single_flight.async_run("objects", self._async_fetch_objects)
+
+    async def _async_fetch_objects(self) -> list[dict[str, Any]]:
+        """Fetch all objects of the club, projected to the fields in use."""
+        _LOGGER.debug("Fetching objects")
+        try:
+            result = await self._async_request(lambda client: client.getObjects())
+        except Exception as e:
+            raise self._update_failed(e, "Error fetching objects") from e
+        objects = result.get("Object", [])
+        if self._object_fields is None:
+            # The sensor descriptions name the fields they read
+            sensor = await async_import_module(self.hass, "sensor")
+            self._object_fields = sensor.OBJECT_FIELDS
+        airplane_ids = {
+            airplane["id"] for airplane in self.config_entry.data.get("airplanes", [])
+        }
+        if self.config_entry.options.get(CONF_FOLLOW_CLUB) and isinstance(
+            objects, list
+        ):
+            # Any club airplane may be tracked next, so its object is kept in
+            # full and picking it up takes no further request
+            airplane_ids.update(
+                airplane["id"]
+                for airplane in extract_airplanes(
+                    [obj for obj in objects if isinstance(obj, dict)]
+                )
+            )
+        with self.watchdog.timed("objects", "project_objects"):
+            records = project_objects(objects, airplane_ids, self._object_fields)
+        self._projected_ids = airplane_ids
+        _LOGGER.debug("Fetched %d objects, kept %d", len(objects), len(records))
+        return records
+
+    async def async_fetch_flight_log(
+        self, airplane_id: str, from_date: date, to_date: date
+    ) -> dict[str, Any]:
+        """Fetch the logged flights of one airplane between two dates."""
+        _LOGGER.debug(
+            "Fetching flight log for airplane_id=%s from %s to %s",
+            airplane_id,
+            from_date,
+            to_date,
+        )
+        return await self._async_request(
+            lambda client: client.getFlightLog(
+                limit=FLIGHT_LOG_LIMIT,
+                from_date=from_date,
+                to_date=to_date,
+                ac_id=int(airplane_id),
+            )
+        )
+
+    def bookings_window(self) -> tuple[date, date]:
+        """Return the first and last day of the bookings fetch horizon."""
+        days_back, days_ahead = self.bookings_window_options()
+        today = dt_util.now().date()
+        return today - timedelta(days=days_back), today + timedelta(days=days_ahead)
+
+    async def _async_update_bookings(self, airplane_id: str) -> list[dict[str, Any]]:
+        """Fetch the bookings of one airplane within the fetch horizon."""
+        from_date, to_date = self.bookings_window()
+        _LOGGER.debug(
+            "Fetching bookings for airplane_id=%s from %s to %s",
+            airplane_id,
+            from_date,
+            to_date,
+        )
+        try:
+            result = await self._async_request(
+                lambda client: client.getBookingsWithDates(
+                    airplane_id, from_date, to_date
+                )
+            )
+            _LOGGER.debug("Fetched bookings: %s", result)
+        except Exception as e:
+            raise self._update_failed(
+                e, f"Error fetching bookings for airplane_id={airplane_id}"
+            ) from e
+
+        window_start = dt_util.start_of_local_day(from_date).timestamp()
+        window_end = dt_util.start_of_local_day(to_date + timedelta(days=1)).timestamp()
+        if (store := self._booking_stores.get(airplane_id)) is None:
+            # The airplane was removed while its bookings were fetched
+            return []
+        regnr = self.airplanes[airplane_id]["regnr"]
+        with self.watchdog.timed(regnr, "ingest_bookings"):
+            bookings = store.ingest(
+                result.get("Booking", []), window_start, window_end, window_start
+            )
+            if store.changes:
+                self._async_fire_booking_events(airplane_id, store.changes)
+        return bookings
+
+    @callback
+    def _async_fire_booking_events(
+        self, airplane_id: str, changes: BookingChanges
+    ) -> None:
+        """Fire one event per kind of booking change found by a refresh."""
+        base = {
+            "entry_id": self.config_entry.entry_id,
+            "airplane_id": airplane_id,
+            "regnr": self.airplanes[airplane_id]["regnr"],
+        }
+        _LOGGER.debug(
+            "Booking changes for airplane_id=%s: %d created, %d updated, %d cancelled",
+            airplane_id,
+            len(changes.created),
+            len(changes.updated),
+            len(changes.cancelled),
+        )
+        if changes.created:
+            self.hass.bus.async_fire(
+                EVENT_BOOKING_CREATED,
+                {
+                    **base,
+                    "bookings": [booking_event_data(b) for b in changes.created],
+                },
+            )
+        if changes.updated:
+            self.hass.bus.async_fire(
+                EVENT_BOOKING_UPDATED,
+                {
+                    **base,
+                    "bookings": [
+                        {**booking_event_data(new), "previous": booking_event_data(old)}
+                        for old, new in changes.updated
+                    ],
+                },
+            )
+        if changes.cancelled:
+            self.hass.bus.async_fire(
+                EVENT_BOOKING_CANCELLED,
+                {
+                    **base,
+                    "bookings": [booking_event_data(b) for b in changes.cancelled],
+                },
+            )
+
+    def _create_bookings_coordinator(
+        self, airplane: dict[str, Any]
+    ) -> StaggeredCoordinator:
+        """Create and track the bookings coordinator of an airplane."""
+        airplane_id = airplane["id"]
+
+        _, bookings_interval, quiet_hours = self.polling_options()
+
+        async def async_update_bookings() -> list[dict[str, Any]]:
+            return await self.single_flight.async_run(
+                ("bookings", airplane_id),
+                lambda: self._async_update_bookings(airplane_id),
+            )
+
+        coordinator = StaggeredCoordinator(
+            self.hass,
+            _LOGGER,
+            name=f"myweblog_airplane_{airplane_id}_bookings",
+            poll_key=(self.config_entry.entry_id, "bookings", airplane_id),
+            watchdog=self.watchdog,
+            update_method=async_update_bookings,
+            update_interval=bookings_interval,
+            quiet_hours=quiet_hours,
+        )
+        self.airplanes[airplane_id] = airplane
+        self.bookings_coordinators[airplane_id] = coordinator
+        self._booking_stores[airplane_id] = BookingStore()
+        return coordinator
+
+    async def async_setup(self) -> None:
+        """Perform the first refresh of all coordinators.
+
+        When the entry already has entities from a previous run, they restore
+        their last state, so there is no first refresh holding back the setup
+        of the entry. Each coordinator is instead refreshed in the background
+        as soon as an enabled entity subscribes to it, and the passive
+        listeners registered here treat its first payload as the baseline,
+        just like after a blocking first refresh.
+        """
+        self._credentials()
+        objects_coordinator = self.objects_coordinator
+        restore = bool(
+            er.async_entries_for_config_entry(
+                er.async_get(self.hass), self.config_entry.entry_id
+            )
+        )
+        if not restore:
+            await objects_coordinator.async_config_entry_first_refresh()
+            # Record successful initial refresh
+            if objects_coordinator.last_exception is None:
+                objects_coordinator._last_update_success_timestamp = time.time()  # type: ignore
+
+            # Pick up club airplanes added or retired while we were not running
+            self._async_follow_club()
+
+        for airplane in self.config_entry.data.get("airplanes", []):
+            _LOGGER.info("Creating coordinator for airplane_id=%s", airplane["id"])
+            coordinator = self._create_bookings_coordinator(airplane)
+            if not restore:
+                await coordinator.async_config_entry_first_refresh()
+
+        # The remarks of the first payload are the baseline
+        self._async_track_remarks()
+
+        def update_last_update_timestamp() -> None:
+            """Update the last update timestamp when coordinator refreshes."""
+            if objects_coordinator.last_exception is None:
+                objects_coordinator._last_update_success_timestamp = time.time()  # type: ignore
+
+        # Listen for coordinator updates and track successful ones. These
+        # follow the updates fetched for the entities rather than keeping the
+        # objects polled themselves.
+        self.config_entry.async_on_unload(
+            objects_coordinator.async_add_passive_listener(update_last_update_timestamp)
+        )
+        self.config_entry.async_on_unload(
+            objects_coordinator.async_add_passive_listener(self._async_follow_club)
+        )
+        self.config_entry.async_on_unload(
+            objects_coordinator.async_add_passive_listener(self._async_track_remarks)
+        )
+
+    async def async_refresh(self, airplane_ids: Iterable[str] | None = None) -> None:
+        """Refresh the objects, then the bookings of some or all airplanes.
+
+        Only data an enabled entity depends on is fetched. Refreshes
+        overlapping with a scheduled poll or with each other join the request
+        already in flight.
+        """
+        if self.objects_coordinator.has_demand:
+            await self.objects_coordinator.async_refresh()
+        if airplane_ids is None:
+            airplane_ids = list(self.bookings_coordinators)
+        await asyncio.gather(
+            *(
+                self.bookings_coordinators[airplane_id].async_refresh()
+                for airplane_id in airplane_ids
+                if airplane_id in self.bookings_coordinators
+                and self.bookings_coordinators[airplane_id].has_demand
+            )
+        )
+
+    @callback
+    def _async_track_remarks(self) -> None:
+        """Fire events for remarks opened or closed since the last payload.
+
+        Remarks are compared by ID per tracked airplane. Airplanes seen for
+        the first time, and airplanes missing from the payload, fire nothing.
+        """
+        if self.objects_coordinator.data is None:
+            return
+        for airplane_id, airplane in self.airplanes.items():
+            if self.get_airplane_object(airplane_id) is None:
+                continue
+            current = self.get_remark_index(airplane_id).by_id
+            previous = self._tracked_remarks.get(airplane_id)
+            self._tracked_remarks[airplane_id] = current
+            if previous is None or previous is current:
+                continue
+            opened = [remark for key, remark in current.items() if key not in previous]
+            closed = [remark for key, remark in previous.items() if key not in current]
+            if not opened and not closed:
+                continue
+
+            base = {
+                "entry_id": self.config_entry.entry_id,
+                "airplane_id": airplane_id,
+                "regnr": airplane["regnr"],
+            }
+            _LOGGER.debug(
+                "Remark changes for airplane_id=%s: %d opened, %d closed",
+                airplane_id,
+                len(opened),
+                len(closed),
+            )
+            if opened:
+                self.hass.bus.async_fire(
+                    EVENT_REMARK_OPENED,
+                    {**base, "remarks": [remark_event_data(r) for r in opened]},
+                )
+            if closed:
+                self.hass.bus.async_fire(
+                    EVENT_REMARK_CLOSED,
+                    {**base, "remarks": [remark_event_data(r) for r in closed]},
+                )
+
+    @callback
+    def _async_follow_club(self) -> None:
+        """Track every club airplane found in the objects payload.
+
+        Only active when the entry follows the whole club. A changed set of
+        airplanes is written to the config entry, whose update listener then
+        applies it through async_update_airplanes.
+        """
+        if not self.config_entry.options.get(CONF_FOLLOW_CLUB):
+            return
+        airplanes = extract_airplanes(self.objects_coordinator.data or [])
+        if not airplanes:
+            # Never drop the whole fleet because of an empty payload
+            return
+        current_ids = {
+            airplane["id"] for airplane in self.config_entry.data.get("airplanes", [])
+        }
+        if {airplane["id"] for airplane in airplanes} == current_ids:
+            return
+
+        _LOGGER.info("Club airplanes changed, now tracking %d", len(airplanes))
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            title=entry_title(self.config_entry.data.get("username"), len(airplanes)),
+            data={**self.config_entry.data, "airplanes": airplanes},
+        )
+
+    def bookings_window_options(self) -> tuple[int, int]:
+        """Return the configured days back and ahead of the fetch horizon."""
+        options = self.config_entry.options
+        return (
+            options.get(CONF_BOOKINGS_DAYS_BACK, DEFAULT_BOOKINGS_DAYS_BACK),
+            options.get(CONF_BOOKINGS_DAYS_AHEAD, DEFAULT_BOOKINGS_DAYS_AHEAD),
+        )
+
+    def polling_options(
+        self,
+    ) -> tuple[timedelta, timedelta, tuple[dt_time, dt_time] | None]:
+        """Return the objects and bookings intervals and the quiet hours."""
+        options = self.config_entry.options
+        profile = options.get(CONF_POLLING_PROFILE, PROFILE_STANDARD)
+        if profile == PROFILE_CUSTOM:
+            objects_interval, bookings_interval = POLLING_PROFILES[PROFILE_STANDARD]
+            if CONF_OBJECTS_INTERVAL in options:
+                objects_interval = timedelta(minutes=options[CONF_OBJECTS_INTERVAL])
+            if CONF_BOOKINGS_INTERVAL in options:
+                bookings_interval = timedelta(minutes=options[CONF_BOOKINGS_INTERVAL])
+        else:
+            objects_interval, bookings_interval = POLLING_PROFILES.get(
+                profile, POLLING_PROFILES[PROFILE_STANDARD]
+            )
+        quiet_hours = None
+        start = options.get(CONF_QUIET_START)
+        end = options.get(CONF_QUIET_END)
+        if start and end:
+            quiet_hours = (dt_util.parse_time(start), dt_util.parse_time(end))
+        return objects_interval, bookings_interval, quiet_hours
+
+    async def async_update_options(self) -> None:
+        """Apply changed options of the config entry."""
+        async with self._update_lock:
+            objects_interval, bookings_interval, quiet_hours = self.polling_options()
+            self.objects_coordinator.async_set_polling(objects_interval, quiet_hours)
+            for coordinator in self.bookings_coordinators.values():
+                coordinator.async_set_polling(bookings_interval, quiet_hours)
+            window = self.bookings_window_options()
+            if window != self._bookings_window:
+                self._bookings_window = window
+                for coordinator in self.bookings_coordinators.values():
+                    if coordinator.has_demand:
+                        await coordinator.async_request_refresh()
+            await self._async_update_airplanes(
+                self.config_entry.data.get("airplanes", [])
+            )
+
+    async def async_update_airplanes(self, airplanes: list[dict[str, Any]]) -> None:
+        """Apply a new airplane selection as a diff against the tracked one.
+
+        Only coordinators and entities of added or removed airplanes are
+        touched; the objects coordinator and its data are kept as is.
+        """
+        async with self._update_lock:
+            await self._async_update_airplanes(airplanes)
+
+    async def _async_update_airplanes(self, airplanes: list[dict[str, Any]]) -> None:
+        """Apply a new airplane selection while holding the update lock."""
+        selected = {airplane["id"]: airplane for airplane in airplanes}
+        removed = [
+            airplane
+            for airplane_id, airplane in self.airplanes.items()
+            if airplane_id not in selected
+        ]
+        added = [
+            airplane
+            for airplane_id, airplane in selected.items()
+            if airplane_id not in self.airplanes
+        ]
+        if not added and not removed:
+            return
+
+        _LOGGER.info(
+            "Updating airplanes: %d added, %d removed", len(added), len(removed)
+        )
+        await self._async_remove_airplanes(removed)
+        for airplane in added:
+            coordinator = self._create_bookings_coordinator(airplane)
+            await coordinator.async_refresh()
+        if any(airplane["id"] not in self._projected_ids for airplane in added):
+            # The objects of untracked airplanes were not kept in full
+            await self.objects_coordinator.async_refresh()
+
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_AIRPLANES_UPDATED.format(self.config_entry.entry_id),
+            added,
+        )
+
+    async def _async_remove_airplanes(self, airplanes: list[dict[str, Any]]) -> None:
+        """Remove coordinators, entities and devices of airplanes."""
+        if not airplanes:
+            return
+        ent_reg = er.async_get(self.hass)
+        dev_reg = dr.async_get(self.hass)
+        entry_id = self.config_entry.entry_id
+        prefixes = tuple(
+            airplane_unique_id_prefix(airplane["regnr"]) for airplane in airplanes
+        )
+
+        for entity in er.async_entries_for_config_entry(ent_reg, entry_id):
+            if entity.unique_id.startswith(prefixes):
+                _LOGGER.info("Removing sensor: %s", entity.entity_id)
+                ent_reg.async_remove(entity.entity_id)
+
+        for airplane in airplanes:
+            device = dev_reg.async_get_device(identifiers={(DOMAIN, airplane["regnr"])})
+            if device is not None:
+                dev_reg.async_update_device(device.id, remove_config_entry_id=entry_id)
+            self.airplanes.pop(airplane["id"], None)
+            self._booking_indexes.pop(airplane["id"], None)
+            self._tracked_remarks.pop(airplane["id"], None)
+            self._booking_stores.pop(airplane["id"], None)
+            coordinator = self.bookings_coordinators.pop(airplane["id"], None)
+            if coordinator is not None:
+                await coordinator.async_shutdown()
@@ -0,0 +1,62 @@
+"""Diagnostics support for the MyWeblog integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data  # type: ignore[import]
+from homeassistant.config_entries import ConfigEntry  # type: ignore[import]
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+
+from .const import DOMAIN
+from .coordinator import MyWebLogRuntime, StaggeredCoordinator
+
+TO_REDACT = {"username", "password", "app_token"}
+
+
+def _coordinator_diagnostics(coordinator: StaggeredCoordinator) -> dict[str, Any]:
+    interval = coordinator.update_interval
+    return {
+        "last_update_success": coordinator.last_update_success,
+        "last_exception": (
+            repr(coordinator.last_exception)
+            if coordinator.last_exception is not None
+            else None
+        ),
+        "update_interval": interval.total_seconds() if interval else None,
+        "poll_offset": coordinator.poll_offset(),
+        "has_demand": coordinator.has_demand,
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime: MyWebLogRuntime = hass.data[DOMAIN][entry.entry_id]
+    call_timeout, refresh_timeout = runtime.timeout_options()
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "api": {
+            "request_timeout": call_timeout,
+            "refresh_timeout": refresh_timeout,
+            **runtime.api_stats.as_dict(),
+            "coalesced": runtime.single_flight.joined,
+        },
+        "coordinators": {
+            "objects": _coordinator_diagnostics(runtime.objects_coordinator),
+            **{
+                f"bookings_{airplane_id}": _coordinator_diagnostics(coordinator)
+                for airplane_id, coordinator in runtime.bookings_coordinators.items()
+            },
+        },
+        "publisher": {
+            "last_duration": runtime.publisher.last_duration,
+            "last_entities": runtime.publisher.last_entities,
+            "last_written": runtime.publisher.last_written,
+        },
+        "event_loop": runtime.watchdog.as_dict(),
+    }
@@ -0,0 +1,241 @@
+"""Maintenance forecasting for the MyWeblog integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+import logging
+import statistics
+from typing import Any
+
+from homeassistant.const import (  # type: ignore[import]
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback  # type: ignore[import]
+from homeassistant.helpers.entity import Entity  # type: ignore[import]
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+
+from .const import FORECAST_HISTORY_DAYS
+from .coordinator import MyWebLogRuntime
+
+_LOGGER = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+# Reads the current usage counters from an airplane object, by usage key
+UsageFn = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class UtilizationFit:
+    """Utilization of an airplane fitted from its recorded flight time."""
+
+    hours_per_day: float
+    source: str
+    samples: int
+
+
+def fit_utilization(samples: list[tuple[float, float]]) -> float | None:
+    """Return the least squares slope of (timestamp, hours) samples in h/day."""
+    if len(samples) < 2:
+        return None
+    days = [timestamp / SECONDS_PER_DAY for timestamp, _ in samples]
+    hours = [value for _, value in samples]
+    try:
+        slope, _ = statistics.linear_regression(days, hours)
+    except statistics.StatisticsError:
+        return None
+    return slope
+
+
+def forecast_due_date(
+    hours_to_go: Any, hours_per_day: float | None, today: date
+) -> date | None:
+    """Return the date when the remaining hours are used at the given rate."""
+    if not isinstance(hours_to_go, (int, float)) or isinstance(hours_to_go, bool):
+        return None
+    if hours_per_day is None or hours_per_day <= 0:
+        return None
+    if hours_to_go <= 0:
+        return today
+    return today + timedelta(days=int(hours_to_go / hours_per_day))
+
+
+def _fit_from_history(
+    hass: HomeAssistant,
+    sources: dict[str, list[tuple[str, str]]],
+    current: dict[str, dict[str, float]],
+    start_time: datetime,
+) -> dict[str, UtilizationFit | None]:
+    """Query the recorded usage history and fit utilization per airplane.
+
+    Runs in the recorder executor. ``sources`` lists the (usage key,
+    entity_id) candidates of each airplane in order of preference, and
+    ``current`` the latest value of each usage key.
+    """
+    from homeassistant.components.recorder import history  # type: ignore[import]
+
+    entity_ids = sorted(
+        {entity_id for candidates in sources.values() for _, entity_id in candidates}
+    )
+    recorded = (
+        history.get_significant_states(
+            hass,
+            start_time,
+            entity_ids=entity_ids,
+            significant_changes_only=False,
+            minimal_response=True,
+            no_attributes=True,
+            compressed_state_format=True,
+        )
+        if entity_ids
+        else {}
+    )
+    now = dt_util.utcnow().timestamp()
+
+    fits: dict[str, UtilizationFit | None] = {}
+    for airplane_id, candidates in sources.items():
+        fits[airplane_id] = None
+        for key, entity_id in candidates:
+            samples: list[tuple[float, float]] = []
+            for row in recorded.get(entity_id, []):
+                try:
+                    samples.append(
+                        (
+                            float(row[COMPRESSED_STATE_LAST_UPDATED]),
+                            float(row[COMPRESSED_STATE_STATE]),
+                        )
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+            value = current.get(airplane_id, {}).get(key)
+            if value is not None:
+                samples.append((now, value))
+            hours_per_day = fit_utilization(samples)
+            if hours_per_day is not None:
+                fits[airplane_id] = UtilizationFit(hours_per_day, key, len(samples))
+                break
+    return fits
+
+
+class MaintenanceForecaster:
+    """Fit the utilization of the tracked airplanes from recorded history.
+
+    The fit for an airplane is cached until its usage counters change in the
+    objects payload, so the history is queried at most once per new value.
+    All changed airplanes are fitted together in one recorder executor job,
+    and the registered forecast entities are published afterwards.
+    """
+
+    def __init__(
+        self,
+        runtime: MyWebLogRuntime,
+        usage_fn: UsageFn,
+        usage_entity_id: Callable[[str, str], str | None],
+    ) -> None:
+        """Initialize the forecaster.
+
+        ``usage_fn`` returns the usage counters of an airplane object in
+        order of preference, and ``usage_entity_id`` the entity recording a
+        usage counter of an airplane.
+        """
+        self.hass = runtime.hass
+        self._runtime = runtime
+        self._usage_fn = usage_fn
+        self._usage_entity_id = usage_entity_id
+        self._entities: dict[str, Entity] = {}
+        self._fits: dict[str, UtilizationFit | None] = {}
+        self._fitted_for: dict[str, tuple[Any, ...]] = {}
+        self._task: asyncio.Task | None = None
+        self._pending = False
+
+    def get(self, airplane_id: str) -> UtilizationFit | None:
+        """Return the cached utilization fit of an airplane."""
+        return self._fits.get(airplane_id)
+
+    @callback
+    def async_add_entity(self, airplane_id: str, entity: Entity) -> CALLBACK_TYPE:
+        """Track the forecast entity of an airplane."""
+        self._entities[airplane_id] = entity
+        self.async_schedule_refit()
+
+        @callback
+        def async_remove_entity() -> None:
+            if self._entities.get(airplane_id) is entity:
+                del self._entities[airplane_id]
+            self._fits.pop(airplane_id, None)
+            self._fitted_for.pop(airplane_id, None)
+
+        return async_remove_entity
+
+    @callback
+    def async_schedule_refit(self) -> None:
+        """Refit the airplanes whose usage changed, once at a time."""
+        if self._task is not None and not self._task.done():
+            self._pending = True
+            return
+        self._task = self.hass.async_create_task(
+            self._async_refit(), "myweblog maintenance forecast"
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel a running refit."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_refit(self) -> None:
+        self._pending = True
+        while self._pending:
+            self._pending = False
+            await self._async_refit_changed()
+
+    async def _async_refit_changed(self) -> None:
+        sources: dict[str, list[tuple[str, str]]] = {}
+        current: dict[str, dict[str, float]] = {}
+        usage: dict[str, tuple[Any, ...]] = {}
+        for airplane_id in self._entities:
+            obj = self._runtime.get_airplane_object(airplane_id)
+            if obj is None:
+                continue
+            values = self._usage_fn(obj)
+            fitted_for = tuple(values.values())
+            if self._fitted_for.get(airplane_id) == fitted_for:
+                continue
+            usage[airplane_id] = fitted_for
+            current[airplane_id] = {
+                key: float(value)
+                for key, value in values.items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)
+            }
+            sources[airplane_id] = [
+                (key, entity_id)
+                for key in values
+                if (entity_id := self._usage_entity_id(airplane_id, key)) is not None
+            ]
+        if not usage:
+            return
+
+        if "recorder" in self.hass.config.components:
+            from homeassistant.components.recorder import get_instance  # type: ignore[import]
+
+            start_time = dt_util.utcnow() - timedelta(days=FORECAST_HISTORY_DAYS)
+            fits = await get_instance(self.hass).async_add_executor_job(
+                _fit_from_history, self.hass, sources, current, start_time
+            )
+        else:
+            fits = dict.fromkeys(usage)
+
+        entities = []
+        for airplane_id, fitted_for in usage.items():
+            if airplane_id not in self._entities:
+                continue
+            self._fits[airplane_id] = fits.get(airplane_id)
+            self._fitted_for[airplane_id] = fitted_for
+            entities.append(self._entities[airplane_id])
+        _LOGGER.debug("Fitted maintenance forecast for %d airplanes", len(entities))
+        self._runtime.publisher.async_publish(entities)
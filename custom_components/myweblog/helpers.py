@@ -0,0 +1,64 @@
+"""Helpers shared by the setup and the config flow of the MyWeblog integration.
+
+This module is imported when an entry is set up, so it must stay light: it
+imports nothing beyond the standard library and the Home Assistant core.
+Modules only needed by a service are loaded with async_import_module when
+first used.
+"""
+
+from __future__ import annotations
+
+import importlib
+import re
+from types import ModuleType
+from typing import Any
+
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+
+CALLSIGN_PATTERN = re.compile(r"^[A-Z0-9]{1,2}-[A-Z0-9]+$", re.IGNORECASE)
+
+
+def is_auth_error(err: Exception) -> bool:
+    """Check if an exception indicates an authentication error."""
+    err_str = str(err).lower()
+    return (
+        "ogiltigt" in err_str
+        or "invalid" in err_str
+        or "auth" in err_str
+        or "unauthorized" in err_str
+        or "forbidden" in err_str
+        or "401" in err_str
+        or "403" in err_str
+    )
+
+
+def extract_airplanes(objects: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Filter out non-planes from club objects and extract required data."""
+    airplanes = []
+    for obj in objects:
+        regnr = obj.get("regnr", "")
+        plane_id = obj.get("ID")
+        if CALLSIGN_PATTERN.match(regnr) and plane_id:
+            airplanes.append(
+                {
+                    "id": plane_id,
+                    "regnr": regnr,
+                    "title": f"{regnr} ({obj.get('model', '')})",
+                }
+            )
+    return airplanes
+
+
+def entry_title(username: str | None, planes_count: int) -> str:
+    """Return the config entry title for a number of airplanes."""
+    return f"MyWeblog ({username} - {planes_count} {'plane' if planes_count == 1 else 'planes'})"
+
+
+async def async_import_module(hass: HomeAssistant, name: str) -> ModuleType:
+    """Import a module of the integration in the executor.
+
+    Importing reads and compiles files, so it is kept out of the event loop.
+    """
+    return await hass.async_add_executor_job(
+        importlib.import_module, f"{__package__}.{name}"
+    )
@@ -0,0 +1,76 @@
+"""Projection of getObjects payloads for the MyWeblog integration."""
+
+from __future__ import annotations
+
+from collections.abc import Container, Iterable, Mapping
+import copy
+from typing import Any, Union
+
+# A projection spec keeps the listed keys of a dict. A key maps to None to
+# keep its value as is, to a nested spec to project a dict value, or to a
+# one-item list holding the spec of the dicts in a list value.
+ProjectionSpec = Mapping[str, Union["ProjectionSpec", list["ProjectionSpec"], None]]
+
+REMARK_FIELDS: ProjectionSpec = dict.fromkeys(
+    ("remarkID", "remarkBy", "remarkCategory", "remarkDate", "remarkText")
+)
+
+# Fields of an airplane object read by the runtime itself, to identify the
+# airplanes and track their remarks. The fields read by the sensors are added
+# from their descriptions, see object_fields.
+BASE_OBJECT_FIELDS: ProjectionSpec = {
+    "ID": None,
+    "regnr": None,
+    "model": None,
+    "activeRemarks": [REMARK_FIELDS],
+}
+
+
+def object_fields(
+    paths: Iterable[tuple[str, ...]], base: ProjectionSpec = BASE_OBJECT_FIELDS
+) -> ProjectionSpec:
+    """Return a spec keeping the fields of a base spec and at nested paths."""
+    spec: dict[str, Any] = copy.deepcopy(dict(base))
+    for path in paths:
+        if not path:
+            continue
+        node = spec
+        for key in path[:-1]:
+            if key in node and not isinstance(node[key], dict):
+                # Already kept as a whole, or a list projected by its items
+                break
+            node = node.setdefault(key, {})
+        else:
+            node[path[-1]] = None
+    return spec
+
+
+def project(value: Any, spec: ProjectionSpec | list[ProjectionSpec] | None) -> Any:
+    """Return a copy of a value holding only the fields of a spec."""
+    if spec is None:
+        return value
+    if isinstance(spec, list):
+        if not isinstance(value, list):
+            return value
+        return [project(item, spec[0]) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {key: project(value[key], spec[key]) for key in spec if key in value}
+
+
+def project_objects(
+    objects: Any, airplane_ids: Container[Any], fields: ProjectionSpec
+) -> list[dict[str, Any]]:
+    """Return compact records of the objects of a getObjects payload.
+
+    Objects of the given airplanes keep the fields of the spec and the other
+    objects are dropped, so the payload held per entry scales with the
+    tracked airplanes rather than with the club.
+    """
+    if not isinstance(objects, list):
+        return []
+    return [
+        project(obj, fields)
+        for obj in objects
+        if isinstance(obj, dict) and obj.get("ID") in airplane_ids
+    ]
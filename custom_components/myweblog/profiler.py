@@ -0,0 +1,48 @@
+"""Profiling of the update cycle of the MyWeblog integration."""
+
+from __future__ import annotations
+
+import cProfile
+from collections.abc import Iterable
+import logging
+import time
+
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+
+from .coordinator import MyWebLogRuntime
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_profile_refresh(
+    hass: HomeAssistant, runtimes: Iterable[MyWebLogRuntime], cycles: int
+) -> str:
+    """Profile refresh cycles of config entries and return the stats file.
+
+    Each cycle refreshes the objects and all bookings coordinators of the
+    entries. The profiler runs in the event loop thread for the duration of
+    the cycles, so the network waits, decoding, coordinator listeners and
+    the state writes they trigger are all captured. The stats are written in
+    pstats format to the config directory, ready for snakeviz, flameprof or
+    ``python -m pstats``.
+    """
+    runtimes = list(runtimes)
+    path = hass.config.path(f"myweblog_profile_{int(time.time() * 1000)}.prof")
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        for _ in range(cycles):
+            for runtime in runtimes:
+                await runtime.async_refresh()
+    finally:
+        profiler.disable()
+    duration = time.perf_counter() - start
+    await hass.async_add_executor_job(profiler.dump_stats, path)
+    _LOGGER.info(
+        "Profiled %d refresh cycles in %.2f s, stats written to %s",
+        cycles,
+        duration,
+        path,
+    )
+    return path
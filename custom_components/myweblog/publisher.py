@@ -0,0 +1,178 @@
+"""Batched state publication for the MyWeblog integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from functools import partial
+import logging
+import time
+from typing import Any, TypeVar, cast
+
+from homeassistant.core import CALLBACK_TYPE, callback  # type: ignore[import]
+from homeassistant.helpers.entity import Entity  # type: ignore[import]
+from homeassistant.helpers.update_coordinator import (  # type: ignore[import]
+    DataUpdateCoordinator,
+)
+
+from .watchdog import LoopWatchdog
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class MyWebLogStatePublisher:
+    """Write the states of many entities once per coordinator refresh.
+
+    Instead of one listener per entity, the publisher holds a single listener
+    per coordinator. When a coordinator refreshes, the states of all entities
+    depending on it are computed in one pass, and only the entities whose
+    state, attributes or availability changed are written, all within the same
+    event loop tick. The computed states are reused by the writes rather than
+    computed again. The time spent in each pass is recorded, and the time
+    the entities take to compute their states is reported to the watchdog.
+    """
+
+    def __init__(self, watchdog: LoopWatchdog) -> None:
+        """Initialize the publisher."""
+        self.watchdog = watchdog
+        self._entities: dict[
+            DataUpdateCoordinator, dict[MyWebLogPublishedEntity, None]
+        ] = {}
+        self._unsubs: dict[DataUpdateCoordinator, CALLBACK_TYPE] = {}
+        self._published: dict[MyWebLogPublishedEntity, tuple[Any, ...]] = {}
+        self.last_duration: float | None = None
+        self.last_entities = 0
+        self.last_written = 0
+
+    @callback
+    def async_add_entity(
+        self,
+        entity: MyWebLogPublishedEntity,
+        coordinators: Iterable[DataUpdateCoordinator],
+    ) -> CALLBACK_TYPE:
+        """Publish an entity whenever one of the coordinators refreshes."""
+        coordinators = tuple(coordinators)
+        for coordinator in coordinators:
+            entities = self._entities.setdefault(coordinator, {})
+            if not entities:
+                self._unsubs[coordinator] = coordinator.async_add_listener(
+                    partial(self._async_publish_coordinator, coordinator)
+                )
+            entities[entity] = None
+
+        @callback
+        def async_remove_entity() -> None:
+            self._published.pop(entity, None)
+            for coordinator in coordinators:
+                entities = self._entities.get(coordinator)
+                if entities is None:
+                    continue
+                entities.pop(entity, None)
+                if not entities:
+                    del self._entities[coordinator]
+                    self._unsubs.pop(coordinator)()
+
+        return async_remove_entity
+
+    @callback
+    def _async_publish_coordinator(self, coordinator: DataUpdateCoordinator) -> None:
+        self.async_publish(list(self._entities.get(coordinator, ())))
+
+    @callback
+    def async_publish(self, entities: Iterable[MyWebLogPublishedEntity]) -> None:
+        """Write the states of the entities that changed since last published."""
+        start = time.perf_counter()
+        total = written = 0
+        published = self._published
+        for entity in entities:
+            if entity.hass is None:
+                continue
+            total += 1
+            snapshot = entity.async_write_if_changed(published.get(entity))
+            if snapshot is None:
+                continue
+            published[entity] = snapshot
+            written += 1
+
+        self.last_duration = time.perf_counter() - start
+        self.last_entities = total
+        self.last_written = written
+        _LOGGER.debug(
+            "Published %d of %d entity states in %.2f ms",
+            written,
+            total,
+            self.last_duration * 1000,
+        )
+
+
+class MyWebLogPublishedEntity(Entity):
+    """Entity whose state is written by the state publisher.
+
+    Availability and manual updates follow the first coordinator like a
+    CoordinatorEntity, but no listener is registered per entity. The other
+    coordinators only trigger publication.
+    """
+
+    _attr_should_poll = False
+    # Values computed while publishing, served again to the state write
+    _publish_cache: dict[str, Any] | None = None
+
+    def __init__(
+        self,
+        publisher: MyWebLogStatePublisher,
+        coordinator: DataUpdateCoordinator,
+        *other_coordinators: DataUpdateCoordinator,
+    ) -> None:
+        """Initialize the entity."""
+        self._publisher = publisher
+        self.coordinator = coordinator
+        self._coordinators = (coordinator, *other_coordinators)
+
+    async def async_added_to_hass(self) -> None:
+        """Register the entity with the publisher."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._publisher.async_add_entity(self, self._coordinators))
+
+    @callback
+    def async_write_if_changed(
+        self, published: tuple[Any, ...] | None
+    ) -> tuple[Any, ...] | None:
+        """Write the state unless it matches the published snapshot.
+
+        Return the snapshot of the written state, or None when unchanged.
+        """
+        self._publish_cache = {}
+        try:
+            available = self.available
+            snapshot = (
+                available,
+                self.state if available else None,
+                self.extra_state_attributes if available else None,
+            )
+            if snapshot == published:
+                return None
+            self.async_write_ha_state()
+            return snapshot
+        finally:
+            self._publish_cache = None
+
+    def _cached(self, key: str, compute: Callable[[], _T]) -> _T:
+        """Return a value computed once while the entity is published."""
+        cache = self._publish_cache
+        if cache is None:
+            return compute()
+        if key not in cache:
+            cache[key] = compute()
+        return cast(_T, cache[key])
+
+    @property
+    def available(self) -> bool:
+        """Return if the last update of the coordinator succeeded."""
+        return self.coordinator.last_update_success
+
+    async def async_update(self) -> None:
+        """Request a refresh of the coordinator."""
+        if not self.enabled:
+            return
+        await self.coordinator.async_request_refresh()
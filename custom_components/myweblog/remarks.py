@@ -0,0 +1,63 @@
+"""Remark helpers for the MyWeblog integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Categories of the active remarks of an airplane
+REMARK_CATEGORY_YELLOW = "1"
+REMARK_CATEGORY_RED = "2"
+
+REMARK_COLORS = {REMARK_CATEGORY_YELLOW: "yellow", REMARK_CATEGORY_RED: "red"}
+
+
+def remark_key(remark: dict[str, Any]) -> Any:
+    """Return the key identifying a remark across payloads."""
+    remark_id = remark.get("remarkID")
+    if remark_id is not None:
+        return str(remark_id)
+    return (
+        remark.get("remarkCategory"),
+        remark.get("remarkDate"),
+        remark.get("remarkBy"),
+        remark.get("remarkText"),
+    )
+
+
+def remark_title(remark: dict[str, Any]) -> str | None:
+    """Return the first line of the remark text."""
+    text = remark.get("remarkText")
+    if not isinstance(text, str):
+        return None
+    return text.strip().split("\n", 1)[0].strip() or None
+
+
+class RemarkIndex:
+    """Active remarks of one airplane, indexed by ID and by category.
+
+    The remark list is walked once; counts and the titles of open remarks
+    are read from the index afterwards.
+    """
+
+    def __init__(self, remarks: list[dict[str, Any]] | None) -> None:
+        """Build the index from the activeRemarks of an airplane object."""
+        self.by_id: dict[Any, dict[str, Any]] = {}
+        self.by_category: dict[Any, list[dict[str, Any]]] = {}
+        self._titles: dict[Any, list[str]] = {}
+        for remark in remarks or []:
+            if not isinstance(remark, dict):
+                continue
+            category = remark.get("remarkCategory")
+            self.by_id[remark_key(remark)] = remark
+            self.by_category.setdefault(category, []).append(remark)
+            title = remark_title(remark)
+            if title is not None:
+                self._titles.setdefault(category, []).append(title)
+
+    def count(self, category: str) -> int:
+        """Return the number of open remarks of a category."""
+        return len(self.by_category.get(category, ()))
+
+    def titles(self, category: str) -> list[str]:
+        """Return the titles of the open remarks of a category."""
+        return self._titles.get(category, [])
@@ -0,0 +1,92 @@
+"""Staggering of the polls of all MyWeblog config entries."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from datetime import datetime, time, timedelta
+import math
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback  # type: ignore[import]
+from homeassistant.helpers.singleton import singleton  # type: ignore[import]
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+
+from .const import DATA_POLL_SCHEDULER
+
+
+class PollScheduler:
+    """Spread the polls of every coordinator of the domain over time.
+
+    Each registered poll gets a slot on a ring. The slot of the i-th of n
+    polls in sorted key order starts at i/n of its update interval, counted
+    from the Unix epoch, so the polls of all airplanes and entries are evenly
+    spaced and land on the same wall clock times across restarts instead of
+    firing together whenever their entries happen to be set up.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._keys: list[Hashable] = []
+
+    @callback
+    def async_register(self, key: Hashable) -> CALLBACK_TYPE:
+        """Give a poll a slot on the ring and return a callback freeing it."""
+        self._keys.append(key)
+        self._keys.sort(key=repr)
+
+        @callback
+        def async_unregister() -> None:
+            # Coordinators can be shut down more than once
+            if key in self._keys:
+                self._keys.remove(key)
+
+        return async_unregister
+
+    def offset(self, key: Hashable, interval: float) -> float:
+        """Return the seconds into each interval at which a poll is due."""
+        return self._keys.index(key) * interval / len(self._keys)
+
+    def delay(
+        self, key: Hashable, interval: float, not_before: float | None = None
+    ) -> float:
+        """Return the seconds until the next due time of a poll.
+
+        The next due time is at least half an interval away, so a poll
+        refreshed on demand just before its slot skips that slot, and not
+        before the given timestamp.
+        """
+        offset = self.offset(key, interval)
+        now = dt_util.utcnow().timestamp()
+        earliest = now + interval / 2
+        if not_before is not None:
+            earliest = max(earliest, not_before)
+        due = offset + math.ceil((earliest - offset) / interval) * interval
+        return due - now
+
+
+def quiet_hours_end(when: datetime, quiet_hours: tuple[time, time]) -> datetime | None:
+    """Return the end of the quiet hours around a moment, None outside them.
+
+    The hours are local times and may span midnight; equal start and end
+    times mean there are no quiet hours.
+    """
+    start, end = quiet_hours
+    local = dt_util.as_local(when)
+    clock = local.time()
+    if start == end:
+        return None
+    if start < end:
+        if not start <= clock < end:
+            return None
+        day = local.date()
+    elif end <= clock < start:
+        return None
+    else:
+        day = local.date() + timedelta(days=1) if clock >= start else local.date()
+    return datetime.combine(day, end, tzinfo=local.tzinfo)
+
+
+@singleton(DATA_POLL_SCHEDULER)
+@callback
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler shared by all config entries."""
+    return PollScheduler()
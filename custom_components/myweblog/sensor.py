@@ -2,62 +2,222 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 import logging
 import time
 from typing import Any
-from zoneinfo import ZoneInfo
-
-from pyMyweblog import MyWebLogClient
 
 from homeassistant.components.sensor import (  # type: ignore[import]
+    ATTR_STATE_CLASS,
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry  # type: ignore[import]
-from homeassistant.const import EntityCategory  # type: ignore[import]
-from homeassistant.core import HomeAssistant  # type: ignore[import]
+from homeassistant.const import (  # type: ignore[import]
+    ATTR_DEVICE_CLASS,
+    ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
+    ATTR_UNIT_OF_MEASUREMENT,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    EntityCategory,
+)
+from homeassistant.core import HomeAssistant, callback  # type: ignore[import]
 from homeassistant.helpers import entity_registry as er  # type: ignore[import]
+from homeassistant.helpers.dispatcher import async_dispatcher_connect  # type: ignore[import]
 from homeassistant.helpers.entity import DeviceInfo  # type: ignore[import]
 from homeassistant.helpers.entity_platform import AddEntitiesCallback  # type: ignore[import]
 from homeassistant.helpers.typing import StateType  # type: ignore[import]
 from homeassistant.helpers.update_coordinator import (  # type: ignore[import]
     CoordinatorEntity,
     DataUpdateCoordinator,
-    UpdateFailed,
 )
-from homeassistant import config_entries  # type: ignore[import]
-
-from .const import BOOKINGS_UPDATE_INTERVAL, DOMAIN, OBJECTS_UPDATE_INTERVAL
-from .config_flow import is_auth_error
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+
+from .bookings import BookingSummary
+from .const import DOMAIN, FLEET_MAINTENANCE_DUE_HOURS, SIGNAL_AIRPLANES_UPDATED
+from .coordinator import (
+    SCHEMA_FLIGHT_DATA,
+    SCHEMA_FT_DATA,
+    MyWebLogRuntime,
+    airplane_unique_id_prefix,
+)
+from .forecast import MaintenanceForecaster, forecast_due_date
+from .objects import object_fields
+from .publisher import MyWebLogPublishedEntity
+from .remarks import REMARK_CATEGORY_RED, REMARK_CATEGORY_YELLOW
 
 _LOGGER = logging.getLogger(__name__)
 
-SENSOR_TYPES = {
-    "next_booking": SensorEntityDescription(
+ValueFn = Callable[[dict[str, Any]], StateType]
+
+# Presented while a sensor shows its restored state instead of live data
+ATTR_STALE_SINCE = "stale_since"
+
+# State attributes not set by the sensor itself, and thus not restored
+NON_RESTORED_ATTRIBUTES = frozenset(
+    {
+        ATTR_DEVICE_CLASS,
+        ATTR_FRIENDLY_NAME,
+        ATTR_ICON,
+        ATTR_STALE_SINCE,
+        ATTR_STATE_CLASS,
+        ATTR_UNIT_OF_MEASUREMENT,
+    }
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class MyWebLogSensorEntityDescription(SensorEntityDescription):
+    """Describes a myWebLog airplane sensor and how to read its value.
+
+    The value is read from the airplane object either with ``value_fn`` or
+    from a path spec: ``value_path`` for fields with a single location, or
+    ``flight_data_key``/``ft_data_key`` for flight counters, which live in
+    ``flightData.total`` or ``ftData`` depending on the payload schema.
+    ``precision`` converts the value to a rounded float. ``remark_category``
+    counts the open remarks of a category from the remark index.
+    ``bookings`` marks sensors reading the bookings of the airplane, which
+    are only fetched while such a sensor is enabled. ``object_paths`` names
+    the fields a ``value_fn`` reads, as only the fields named by some
+    description are kept of the objects payload.
+    """
+
+    value_fn: ValueFn | None = None
+    value_path: tuple[str, ...] | None = None
+    flight_data_key: str | None = None
+    ft_data_key: str | None = None
+    default: Any = None
+    precision: int | None = None
+    remark_category: str | None = None
+    bookings: bool = False
+    object_paths: tuple[tuple[str, ...], ...] = ()
+
+
+def description_paths(
+    description: MyWebLogSensorEntityDescription,
+) -> list[tuple[str, ...]]:
+    """Return the paths of the airplane object fields a description reads.
+
+    Remark counts are read from the remark index of the runtime, whose
+    fields are always kept.
+    """
+    paths = list(description.object_paths)
+    if description.value_path is not None:
+        paths.append(description.value_path)
+    if description.flight_data_key is not None:
+        paths.append(("flightData", "total", description.flight_data_key))
+    if description.ft_data_key is not None:
+        paths.append(("ftData", description.ft_data_key))
+    return paths
+
+
+def _path_getter(path: tuple[str, ...]) -> ValueFn:
+    """Return an accessor for a nested path that yields None when missing."""
+
+    def get(obj: dict[str, Any]) -> Any:
+        value: Any = obj
+        for key in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    return get
+
+
+def compile_value_fns(
+    description: MyWebLogSensorEntityDescription,
+    runtime: MyWebLogRuntime | None = None,
+) -> dict[str, ValueFn]:
+    """Compile the value spec of a description into one accessor per schema.
+
+    Remark counts are read from the remark index the runtime builds once per
+    payload, so descriptions with a ``remark_category`` need the runtime.
+    """
+    if description.value_fn is not None:
+        return dict.fromkeys((SCHEMA_FLIGHT_DATA, SCHEMA_FT_DATA), description.value_fn)
+    if description.remark_category is not None:
+        if runtime is None:
+            raise ValueError(f"Counting {description.key} requires the runtime")
+        category = description.remark_category
+        return dict.fromkeys(
+            (SCHEMA_FLIGHT_DATA, SCHEMA_FT_DATA),
+            lambda obj: runtime.get_remark_index(obj.get("ID")).count(category),
+        )
+
+    getters: dict[str, list[ValueFn]] = {SCHEMA_FLIGHT_DATA: [], SCHEMA_FT_DATA: []}
+    if description.value_path is not None:
+        getter = _path_getter(description.value_path)
+        getters[SCHEMA_FLIGHT_DATA].append(getter)
+        getters[SCHEMA_FT_DATA].append(getter)
+    if description.flight_data_key is not None:
+        getter = _path_getter(("flightData", "total", description.flight_data_key))
+        getters[SCHEMA_FLIGHT_DATA].insert(0, getter)
+        getters[SCHEMA_FT_DATA].append(getter)
+    if description.ft_data_key is not None:
+        getter = _path_getter(("ftData", description.ft_data_key))
+        getters[SCHEMA_FT_DATA].insert(0, getter)
+        getters[SCHEMA_FLIGHT_DATA].append(getter)
+
+    default = description.default
+    precision = description.precision
+
+    def compile_schema(schema_getters: list[ValueFn]) -> ValueFn:
+        # The preferred location of the schema comes first, the other one is
+        # only consulted for objects that lack the field.
+        def value_fn(obj: dict[str, Any]) -> StateType:
+            for getter in schema_getters:
+                value = getter(obj)
+                if value is not None:
+                    break
+            else:
+                value = default
+            if precision is None:
+                return value
+            try:
+                return round(float(value), precision)
+            except (TypeError, ValueError):
+                return value
+
+        return value_fn
+
+    return {schema: compile_schema(getters[schema]) for schema in getters}
+
+
+SENSOR_TYPES: dict[str, MyWebLogSensorEntityDescription] = {
+    "next_booking": MyWebLogSensorEntityDescription(
         key="next_booking",
         name="Next Booking",
         device_class=SensorDeviceClass.TIMESTAMP,
         icon="mdi:calendar-clock",
         translation_key="next_booking",
+        bookings=True,
     ),
-    "yellow_tags": SensorEntityDescription(
+    "yellow_tags": MyWebLogSensorEntityDescription(
         key="yellow_tags",
         name="Yellow Tags",
         icon="mdi:tag-outline",
         translation_key="yellow_tags",
         state_class=SensorStateClass.MEASUREMENT,
+        remark_category=REMARK_CATEGORY_YELLOW,
     ),
-    "red_tags": SensorEntityDescription(
+    "red_tags": MyWebLogSensorEntityDescription(
         key="red_tags",
         name="Red Tags",
         icon="mdi:tag",
         translation_key="red_tags",
         state_class=SensorStateClass.MEASUREMENT,
+        remark_category=REMARK_CATEGORY_RED,
     ),
-    "days_to_go": SensorEntityDescription(
+    "days_to_go": MyWebLogSensorEntityDescription(
         key="days_to_go",
         name="Days to Go (Maintenance)",
         icon="mdi:calendar-range",
@@ -65,8 +225,10 @@ SENSOR_TYPES = {
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement="d",
+        value_path=("maintTimeDate", "daysToGoValue"),
+        default=0,
     ),
-    "days_to_flight_stop": SensorEntityDescription(
+    "days_to_flight_stop": MyWebLogSensorEntityDescription(
         key="days_to_flight_stop",
         name="Days to Go (Flight Stop)",
         icon="mdi:calendar-alert",
@@ -74,8 +236,10 @@ SENSOR_TYPES = {
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement="d",
+        value_path=("maintTimeDate", "flightStop_daysToGoValue"),
+        default=0,
     ),
-    "hours_to_go": SensorEntityDescription(
+    "hours_to_go": MyWebLogSensorEntityDescription(
         key="hours_to_go",
         name="Hours to Go (Maintenance)",
         icon="mdi:clock-outline",
@@ -83,8 +247,11 @@ SENSOR_TYPES = {
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement="h",
+        value_path=("maintTimeDate", "hoursToGoValue"),
+        default=0,
+        precision=2,
     ),
-    "hours_to_flight_stop": SensorEntityDescription(
+    "hours_to_flight_stop": MyWebLogSensorEntityDescription(
         key="hours_to_flight_stop",
         name="Hours to Go (Flight Stop)",
         icon="mdi:clock-alert-outline",
@@ -92,8 +259,11 @@ SENSOR_TYPES = {
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement="h",
+        value_path=("maintTimeDate", "flightStop_hoursToGoValue"),
+        default=0,
+        precision=2,
     ),
-    "airborne": SensorEntityDescription(
+    "airborne": MyWebLogSensorEntityDescription(
         key="airborne",
         name="Airborne",
         icon="mdi:airplane",
@@ -101,8 +271,12 @@ SENSOR_TYPES = {
         state_class=SensorStateClass.TOTAL,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement="h",
+        flight_data_key="airborne",
+        ft_data_key="airborne",
+        default=0,
+        precision=2,
     ),
-    "block": SensorEntityDescription(
+    "block": MyWebLogSensorEntityDescription(
         key="block",
         name="Block",
         icon="mdi:car-brake-hold",
@@ -110,8 +284,12 @@ SENSOR_TYPES = {
         state_class=SensorStateClass.TOTAL,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement="h",
+        flight_data_key="block",
+        ft_data_key="block",
+        default=0,
+        precision=2,
     ),
-    "tachometer": SensorEntityDescription(
+    "tachometer": MyWebLogSensorEntityDescription(
         key="tachometer",
         name="Tachometer",
         icon="mdi:counter",
@@ -119,8 +297,12 @@ SENSOR_TYPES = {
         state_class=SensorStateClass.TOTAL,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement="h",
+        flight_data_key="tachoMeter",
+        ft_data_key="tachometer",
+        default=0,
+        precision=2,
     ),
-    "tach_time": SensorEntityDescription(
+    "tach_time": MyWebLogSensorEntityDescription(
         key="tach_time",
         name="Tach Time",
         icon="mdi:timer-outline",
@@ -128,28 +310,498 @@ SENSOR_TYPES = {
         state_class=SensorStateClass.TOTAL,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement="h",
+        flight_data_key="tachtime",
+        ft_data_key="tachtime",
+        default=0,
+        precision=2,
     ),
-    "landings": SensorEntityDescription(
+    "landings": MyWebLogSensorEntityDescription(
         key="landings",
         name="Landings",
         icon="mdi:airplane-landing",
         translation_key="landings",
         state_class=SensorStateClass.TOTAL,
+        flight_data_key="landings",
+        ft_data_key="landings",
+        default=0,
     ),
-    "model": SensorEntityDescription(
+    "model": MyWebLogSensorEntityDescription(
         key="model",
         name="Model",
         icon="mdi:alpha-m-circle-outline",
         translation_key="model",
+        value_path=("model",),
     ),
-    "club": SensorEntityDescription(
+    "club": MyWebLogSensorEntityDescription(
         key="club",
         name="Club",
         icon="mdi:account-group",
         translation_key="club",
+        value_path=("clubname",),
     ),
 }
 
+# Every field of an airplane object read by the runtime and the sensors
+OBJECT_FIELDS = object_fields(
+    path
+    for description in SENSOR_TYPES.values()
+    for path in description_paths(description)
+)
+
+# Airplane metrics aggregated over the whole fleet
+FLEET_METRICS = (
+    "hours_to_go",
+    "days_to_go",
+    "hours_to_flight_stop",
+    "days_to_flight_stop",
+    "yellow_tags",
+    "red_tags",
+    "airborne",
+    "landings",
+)
+
+
+# Usage counters the maintenance forecast is fitted on, in order of preference
+FORECAST_USAGE_METRICS = ("airborne", "tachometer")
+
+FORECAST_SENSOR_TYPE = SensorEntityDescription(
+    key="maintenance_forecast",
+    name="Maintenance Due (Forecast)",
+    icon="mdi:calendar-clock",
+    translation_key="maintenance_forecast",
+    device_class=SensorDeviceClass.DATE,
+)
+
+
+@dataclass(frozen=True)
+class RestoredSensorState:
+    """Last state of a sensor restored at startup."""
+
+    native_value: Any
+    attributes: dict[str, Any]
+    stale_since: str
+
+
+class MyWebLogRestoreSensor(MyWebLogPublishedEntity, RestoreSensor, ABC):
+    """Published sensor presenting its last state until live data arrives.
+
+    After a restart, the last native value and attributes are restored and
+    presented with a ``stale_since`` attribute until every coordinator of the
+    sensor has data, instead of the sensor being unavailable. The first live
+    data replaces the restored state for good. Subclasses provide the live
+    state through ``_live_value`` and ``_live_attributes``.
+    """
+
+    _restored: RestoredSensorState | None = None
+    # Named in the loop watchdog reports, the entity ID when not set
+    _watchdog_subject: str | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state unless live data is already available."""
+        await super().async_added_to_hass()
+        if self._has_live_data():
+            return
+        last_state = await self.async_get_last_state()
+        last_data = await self.async_get_last_sensor_data()
+        if (
+            last_state is None
+            or last_data is None
+            or last_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+        ):
+            return
+        self._restored = RestoredSensorState(
+            last_data.native_value,
+            {
+                key: value
+                for key, value in last_state.attributes.items()
+                if key not in NON_RESTORED_ATTRIBUTES
+            },
+            last_state.attributes.get(ATTR_STALE_SINCE)
+            or last_state.last_updated.isoformat(),
+        )
+
+    def _has_live_data(self) -> bool:
+        return all(coordinator.data is not None for coordinator in self._coordinators)
+
+    def _restored_state(self) -> RestoredSensorState | None:
+        """Return the restored state while no live data is available."""
+        if self._restored is not None and self._has_live_data():
+            self._restored = None
+        return self._restored
+
+    @property
+    def available(self) -> bool:
+        """Return True while stale, otherwise follow the coordinator."""
+        return self._restored_state() is not None or super().available
+
+    @property
+    def native_value(self) -> Any:
+        """Return the live value, or the restored one while stale."""
+        if (restored := self._restored_state()) is not None:
+            return restored.native_value
+        return self._cached("state", self._timed_live_value)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the live attributes, or the restored ones while stale."""
+        if (restored := self._restored_state()) is not None:
+            return {**restored.attributes, ATTR_STALE_SINCE: restored.stale_since}
+        return self._cached("extra_state_attributes", self._timed_live_attributes)
+
+    def _timed_live_value(self) -> Any:
+        with self._timed("state"):
+            return self._live_value()
+
+    def _timed_live_attributes(self) -> dict[str, Any] | None:
+        with self._timed("extra_state_attributes"):
+            return self._live_attributes()
+
+    def _timed(self, metric: str) -> AbstractContextManager[None]:
+        """Time computing the live state in the loop watchdog."""
+        return self._publisher.watchdog.timed(
+            self._watchdog_subject or self.entity_id,
+            f"{self.entity_description.key} {metric}",
+        )
+
+    @abstractmethod
+    def _live_value(self) -> Any:
+        """Return the value computed from the coordinator data."""
+
+    def _live_attributes(self) -> dict[str, Any] | None:
+        """Return the attributes computed from the coordinator data."""
+        return None
+
+
+class MyWebLogFleetStats:
+    """Fleet-wide aggregates of airplane metrics.
+
+    All metrics of all tracked airplanes are read in a single pass, once per
+    objects payload (or airplane selection), and shared by every fleet sensor.
+    """
+
+    def __init__(self, runtime: MyWebLogRuntime) -> None:
+        """Initialize the fleet stats."""
+        self._runtime = runtime
+        self._value_fns = {
+            key: compile_value_fns(SENSOR_TYPES[key], runtime) for key in FLEET_METRICS
+        }
+        self._computed_for: list[dict[str, Any]] | None = None
+        self._computed_airplanes: tuple[str, ...] | None = None
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    def get(self) -> dict[str, dict[str, Any]]:
+        """Return the aggregates of the current payload, computing them once."""
+        runtime = self._runtime
+        objects = runtime.objects_coordinator.data
+        airplanes = tuple(runtime.airplanes)
+        if (
+            self._computed_airplanes is None
+            or objects is not self._computed_for
+            or airplanes != self._computed_airplanes
+        ):
+            self._stats = self._compute()
+            self._computed_for = objects
+            self._computed_airplanes = airplanes
+        return self._stats
+
+    def _compute(self) -> dict[str, dict[str, Any]]:
+        runtime = self._runtime
+        schema = runtime.get_objects_schema()
+        value_fns = {key: fns[schema] for key, fns in self._value_fns.items()}
+        regnrs: list[str] = []
+        columns: dict[str, list[float]] = {key: [] for key in FLEET_METRICS}
+        column_regnrs: dict[str, list[str]] = {key: [] for key in FLEET_METRICS}
+
+        for airplane_id, airplane in runtime.airplanes.items():
+            obj = runtime.get_airplane_object(airplane_id)
+            if obj is None:
+                continue
+            regnrs.append(airplane["regnr"])
+            values = {key: value_fn(obj) for key, value_fn in value_fns.items()}
+            for key, value in values.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    columns[key].append(value)
+                    column_regnrs[key].append(airplane["regnr"])
+
+        stats: dict[str, dict[str, Any]] = {}
+        for key, values in columns.items():
+            if not values:
+                stats[key] = {"min": None, "max": None, "sum": None, "airplane": None}
+                continue
+            min_index = min(range(len(values)), key=values.__getitem__)
+            stats[key] = {
+                "min": values[min_index],
+                "max": max(values),
+                "sum": round(sum(values), 2),
+                "airplane": column_regnrs[key][min_index],
+            }
+
+        stats["grounded"] = {
+            "airplanes": [
+                regnr
+                for regnr, value in zip(column_regnrs["red_tags"], columns["red_tags"])
+                if value > 0
+            ]
+        }
+        stats["maintenance_due"] = {
+            "airplanes": [
+                regnr
+                for regnr, value in zip(
+                    column_regnrs["hours_to_go"], columns["hours_to_go"]
+                )
+                if value < FLEET_MAINTENANCE_DUE_HOURS
+            ]
+        }
+        stats["fleet"] = {"airplanes": regnrs}
+        return stats
+
+
+@dataclass(frozen=True, kw_only=True)
+class MyWebLogFleetSensorEntityDescription(SensorEntityDescription):
+    """Describes a fleet aggregate sensor."""
+
+    value_fn: Callable[[dict[str, dict[str, Any]]], StateType]
+    attributes_fn: Callable[[dict[str, dict[str, Any]]], dict[str, Any]] | None = None
+
+
+def _metric_attributes(metric: str) -> Callable[[dict[str, dict[str, Any]]], dict]:
+    """Return an attributes_fn exposing min/max/sum of a metric."""
+
+    def attributes_fn(stats: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        return dict(stats[metric])
+
+    return attributes_fn
+
+
+def _airplanes_attributes(group: str) -> Callable[[dict[str, dict[str, Any]]], dict]:
+    """Return an attributes_fn listing the airplanes of a group."""
+
+    def attributes_fn(stats: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        return {"airplanes": stats[group]["airplanes"]}
+
+    return attributes_fn
+
+
+FLEET_SENSOR_TYPES: tuple[MyWebLogFleetSensorEntityDescription, ...] = (
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_hours_to_go",
+        name="Lowest Hours to Go (Maintenance)",
+        icon="mdi:clock-outline",
+        translation_key="fleet_hours_to_go",
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement="h",
+        value_fn=lambda stats: stats["hours_to_go"]["min"],
+        attributes_fn=_metric_attributes("hours_to_go"),
+    ),
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_days_to_go",
+        name="Lowest Days to Go (Maintenance)",
+        icon="mdi:calendar-range",
+        translation_key="fleet_days_to_go",
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement="d",
+        value_fn=lambda stats: stats["days_to_go"]["min"],
+        attributes_fn=_metric_attributes("days_to_go"),
+    ),
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_hours_to_flight_stop",
+        name="Lowest Hours to Go (Flight Stop)",
+        icon="mdi:clock-alert-outline",
+        translation_key="fleet_hours_to_flight_stop",
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement="h",
+        value_fn=lambda stats: stats["hours_to_flight_stop"]["min"],
+        attributes_fn=_metric_attributes("hours_to_flight_stop"),
+    ),
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_days_to_flight_stop",
+        name="Lowest Days to Go (Flight Stop)",
+        icon="mdi:calendar-alert",
+        translation_key="fleet_days_to_flight_stop",
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement="d",
+        value_fn=lambda stats: stats["days_to_flight_stop"]["min"],
+        attributes_fn=_metric_attributes("days_to_flight_stop"),
+    ),
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_yellow_tags",
+        name="Yellow Tags",
+        icon="mdi:tag-outline",
+        translation_key="fleet_yellow_tags",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats["yellow_tags"]["sum"],
+        attributes_fn=_metric_attributes("yellow_tags"),
+    ),
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_red_tags",
+        name="Red Tags",
+        icon="mdi:tag",
+        translation_key="fleet_red_tags",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats["red_tags"]["sum"],
+        attributes_fn=_metric_attributes("red_tags"),
+    ),
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_airborne",
+        name="Airborne",
+        icon="mdi:airplane",
+        translation_key="fleet_airborne",
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement="h",
+        value_fn=lambda stats: stats["airborne"]["sum"],
+        attributes_fn=_metric_attributes("airborne"),
+    ),
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_landings",
+        name="Landings",
+        icon="mdi:airplane-landing",
+        translation_key="fleet_landings",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats["landings"]["sum"],
+        attributes_fn=_metric_attributes("landings"),
+    ),
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_grounded",
+        name="Grounded Airplanes",
+        icon="mdi:airplane-off",
+        translation_key="fleet_grounded",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: len(stats["grounded"]["airplanes"]),
+        attributes_fn=_airplanes_attributes("grounded"),
+    ),
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_maintenance_due",
+        name="Airplanes Due for Maintenance",
+        icon="mdi:wrench-clock",
+        translation_key="fleet_maintenance_due",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: len(stats["maintenance_due"]["airplanes"]),
+        attributes_fn=_airplanes_attributes("maintenance_due"),
+    ),
+    MyWebLogFleetSensorEntityDescription(
+        key="fleet_next_maintenance",
+        name="Next Maintenance",
+        icon="mdi:wrench",
+        translation_key="fleet_next_maintenance",
+        value_fn=lambda stats: stats["hours_to_go"]["airplane"],
+        attributes_fn=lambda stats: {
+            "hours_to_go": stats["hours_to_go"]["min"],
+        },
+    ),
+)
+
+
+class MyWebLogFleetSensor(MyWebLogRestoreSensor):
+    """Sensor aggregating a metric over all tracked airplanes."""
+
+    entity_description: MyWebLogFleetSensorEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        runtime: MyWebLogRuntime,
+        fleet_stats: MyWebLogFleetStats,
+        description: MyWebLogFleetSensorEntityDescription,
+    ) -> None:
+        """Initialize the fleet sensor."""
+        super().__init__(runtime.publisher, runtime.objects_coordinator)
+        self.entity_description = description
+        self._fleet_stats = fleet_stats
+        self._watchdog_subject = "fleet"
+        self._attr_unique_id = f"myweblog_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "fleet")},
+            name="MyWebLog Fleet",
+            manufacturer="myWebLog",
+        )
+
+    def _live_value(self) -> StateType:
+        """Return the aggregated value."""
+        return self.entity_description.value_fn(self._fleet_stats.get())
+
+    def _live_attributes(self) -> dict[str, Any] | None:
+        """Return the details of the aggregate."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self._fleet_stats.get())
+
+
+class MyWebLogMaintenanceForecastSensor(MyWebLogRestoreSensor):
+    """Sensor forecasting when hours-based maintenance of an airplane is due.
+
+    The remaining hours are divided by the utilization fitted from the
+    recorded flight time of the airplane.
+    """
+
+    _attr_has_entity_name = True
+    entity_description = FORECAST_SENSOR_TYPE
+
+    def __init__(
+        self,
+        runtime: MyWebLogRuntime,
+        forecaster: MaintenanceForecaster,
+        airplane: dict[str, Any],
+    ) -> None:
+        """Initialize the forecast sensor."""
+        super().__init__(runtime.publisher, runtime.objects_coordinator)
+        self._runtime = runtime
+        self._forecaster = forecaster
+        self._airplane_id = airplane["id"]
+        self._watchdog_subject = airplane["regnr"]
+        self._hours_to_go_fns = compile_value_fns(SENSOR_TYPES["hours_to_go"])
+        self._days_to_go_fns = compile_value_fns(SENSOR_TYPES["days_to_go"])
+        self._attr_unique_id = (
+            f"{airplane_unique_id_prefix(airplane['regnr'])}maintenance_forecast"
+        )
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, airplane["regnr"])},
+            name=airplane["regnr"],
+            manufacturer="myWebLog",
+            model=airplane.get("title", airplane["regnr"]),
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Register the sensor with the forecaster."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._forecaster.async_add_entity(self._airplane_id, self))
+
+    def _read(self, value_fns: dict[str, ValueFn]) -> StateType:
+        obj = self._runtime.get_airplane_object(self._airplane_id)
+        if obj is None:
+            return None
+        return value_fns[self._runtime.get_objects_schema()](obj)
+
+    def _live_value(self) -> date | None:
+        """Return the forecast due date."""
+        fit = self._forecaster.get(self._airplane_id)
+        if fit is None:
+            return None
+        return forecast_due_date(
+            self._read(self._hours_to_go_fns),
+            fit.hours_per_day,
+            dt_util.now().date(),
+        )
+
+    def _live_attributes(self) -> dict[str, Any] | None:
+        """Return the fitted utilization and the calendar due date."""
+        attrs: dict[str, Any] = {}
+        days_to_go = self._read(self._days_to_go_fns)
+        if isinstance(days_to_go, (int, float)) and not isinstance(days_to_go, bool):
+            attrs["calendar_due_date"] = (
+                dt_util.now().date() + timedelta(days=int(days_to_go))
+            ).isoformat()
+        fit = self._forecaster.get(self._airplane_id)
+        if fit is not None:
+            attrs["hours_per_day"] = round(fit.hours_per_day, 2)
+            attrs["based_on"] = fit.source
+            attrs["samples"] = fit.samples
+        return attrs
+
 
 class MyWebLogDiagnosticSensor(CoordinatorEntity, SensorEntity):
     """Diagnostic sensor for MyWebLog integration health."""
@@ -190,7 +842,7 @@ class MyWebLogDiagnosticSensor(CoordinatorEntity, SensorEntity):
                 # Convert Unix timestamp to ISO format datetime
                 dt = datetime.fromtimestamp(
                     self.coordinator._last_update_success_timestamp,  # type: ignore
-                    tz=ZoneInfo("UTC"),
+                    tz=dt_util.UTC,
                 )
                 return dt.isoformat()
             return None
@@ -203,6 +855,13 @@ class MyWebLogDiagnosticSensor(CoordinatorEntity, SensorEntity):
             return self._static_value
         return None
 
+    @callback
+    def set_static_value(self, value: int) -> None:
+        """Update the static value and write the new state."""
+        self._static_value = value
+        if self.hass is not None:
+            self.async_write_ha_state()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -211,9 +870,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up myWebLog sensors from a config entry."""
 
+    runtime: MyWebLogRuntime = hass.data[DOMAIN][config_entry.entry_id]
+    objects_coordinator = runtime.objects_coordinator
+
     ent_reg = er.async_get(hass)
-    airplanes = config_entry.data.get("airplanes", [])
-    current_regnrs = {p["regnr"].lower().replace("-", "_") for p in airplanes}
+    current_prefixes = tuple(
+        airplane_unique_id_prefix(p["regnr"]) for p in runtime.airplanes.values()
+    )
 
     # Hitta alla sensorer som tillhör denna integration
     existing_entities = er.async_entries_for_config_entry(
@@ -221,124 +884,65 @@ async def async_setup_entry(
     )
 
     for entity in existing_entities:
-        # Ignorera diagnos-sensorer
-        if entity.unique_id.startswith("myweblog_diagnostic_"):
+        # Ignorera diagnos- och flottsensorer
+        if entity.unique_id.startswith(("myweblog_diagnostic_", "myweblog_fleet_")):
             continue
 
         # Kolla om sensorn tillhör ett plan som inte längre är valt
-        is_current = any(
-            entity.unique_id.startswith(f"myweblog_{reg}_") for reg in current_regnrs
-        )
-
-        if not is_current:
+        if not entity.unique_id.startswith(current_prefixes):
             _LOGGER.info("Rensar bort gammal sensor: %s", entity.entity_id)
             # DENNA RAD BEHÖVS FÖR ATT RADERA:
             ent_reg.async_remove(entity.entity_id)
 
-    username = config_entry.data.get("username")
-    password = config_entry.data.get("password")
-    app_token = config_entry.data.get("app_token")
-    airplanes = config_entry.data.get("airplanes", [])
-
-    if (
-        not isinstance(username, str)
-        or not isinstance(password, str)
-        or not isinstance(app_token, str)
-    ):
-        raise TypeError("Missing or invalid credentials for myWebLog integration")
-
-    async def async_update_objects() -> list[dict[str, Any]]:
-        _LOGGER.debug("Fetching objects for username=%s", username)
-        try:
-            async with MyWebLogClient(username, password, app_token) as client:
-                result = await client.getObjects()
-                _LOGGER.debug("Fetched objects: %s", result)
-                return result.get("Object", [])
-        except Exception as e:
-            if is_auth_error(e):
-                _LOGGER.warning(
-                    "Authentication error detected, triggering re-authentication"
-                )
-                hass.async_create_task(
-                    hass.config_entries.flow.async_init(
-                        DOMAIN,
-                        context={
-                            "source": config_entries.SOURCE_REAUTH,
-                            "entry_id": config_entry.entry_id,
-                        },
-                        data=config_entry.data,
-                    )
-                )
-                raise UpdateFailed(
-                    "Authentication failed, please re-authenticate"
-                ) from e
-            raise UpdateFailed(f"Error fetching objects: {e}") from e
-
-    objects_coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="myweblog_airplanes_objects",
-        update_method=async_update_objects,
-        update_interval=OBJECTS_UPDATE_INTERVAL,
-    )
-    # Manually track last successful update time
-    objects_coordinator._last_update_success_timestamp = None  # type: ignore
-    await objects_coordinator.async_config_entry_first_refresh()
-    # Record successful initial refresh
-    if objects_coordinator.last_exception is None:
-        objects_coordinator._last_update_success_timestamp = time.time()  # type: ignore
-
-    sensors = []
-    for airplane in airplanes:
-        _LOGGER.info("Creating sensor for airplane_id=%s", airplane["id"])
-
-        async def async_update_bookings(
-            airplane_id: str = airplane["id"],
-        ) -> list[dict[str, Any]]:
-            _LOGGER.debug("Fetching bookings for airplane_id=%s", airplane_id)
-            try:
-                async with MyWebLogClient(username, password, app_token) as client:
-                    result = await client.getBookings(airplane_id)
-                    _LOGGER.debug("Fetched bookings: %s", result)
-                    return result.get("Booking", [])
-            except Exception as e:
-                if is_auth_error(e):
-                    _LOGGER.warning(
-                        "Authentication error detected, triggering re-authentication"
-                    )
-                    hass.async_create_task(
-                        hass.config_entries.flow.async_init(
-                            DOMAIN,
-                            context={
-                                "source": config_entries.SOURCE_REAUTH,
-                                "entry_id": config_entry.entry_id,
-                            },
-                            data=config_entry.data,
-                        )
-                    )
-                    raise UpdateFailed(
-                        "Authentication failed, please re-authenticate"
-                    ) from e
-                raise UpdateFailed(
-                    f"Error fetching bookings for airplane_id={airplane_id}: {e}"
-                ) from e
-
-        bookings_coordinator = DataUpdateCoordinator(
-            hass,
-            _LOGGER,
-            name=f"myweblog_airplane_{airplane['id']}_bookings",
-            update_method=async_update_bookings,
-            update_interval=BOOKINGS_UPDATE_INTERVAL,
+    # Forecast maintenance from the recorded usage of the airplanes
+    usage_value_fns = {
+        key: compile_value_fns(SENSOR_TYPES[key]) for key in FORECAST_USAGE_METRICS
+    }
+
+    def usage_fn(obj: dict[str, Any]) -> dict[str, Any]:
+        schema = runtime.get_objects_schema()
+        return {key: fns[schema](obj) for key, fns in usage_value_fns.items()}
+
+    def usage_entity_id(airplane_id: str, key: str) -> str | None:
+        airplane = runtime.airplanes.get(airplane_id)
+        if airplane is None:
+            return None
+        return ent_reg.async_get_entity_id(
+            "sensor", DOMAIN, f"{airplane_unique_id_prefix(airplane['regnr'])}{key}"
         )
-        await bookings_coordinator.async_config_entry_first_refresh()
-        sensors.extend(
-            MyWebLogAirplaneSensor(
-                objects_coordinator, bookings_coordinator, airplane, description
+
+    forecaster = MaintenanceForecaster(runtime, usage_fn, usage_entity_id)
+    config_entry.async_on_unload(
+        objects_coordinator.async_add_passive_listener(forecaster.async_schedule_refit)
+    )
+    config_entry.async_on_unload(forecaster.async_cancel)
+
+    def airplane_sensors(
+        airplanes: list[dict[str, Any]],
+    ) -> list[SensorEntity]:
+        sensors: list[SensorEntity] = []
+        for airplane in airplanes:
+            _LOGGER.info("Creating sensor for airplane_id=%s", airplane["id"])
+            sensors.extend(
+                MyWebLogAirplaneSensor(runtime, airplane, description)
+                for description in SENSOR_TYPES.values()
             )
-            for description in SENSOR_TYPES.values()
-        )
+            sensors.append(
+                MyWebLogMaintenanceForecastSensor(runtime, forecaster, airplane)
+            )
+        return sensors
+
+    sensors: list[SensorEntity] = []
+    sensors.extend(airplane_sensors(list(runtime.airplanes.values())))
 
     # Add diagnostic sensors for the integration
+    airplane_count_sensor = MyWebLogDiagnosticSensor(
+        objects_coordinator,
+        "airplane_count",
+        "Configured Airplanes",
+        "mdi:airplane",
+        len(runtime.airplanes),
+    )
     diagnostic_sensors = [
         MyWebLogDiagnosticSensor(
             objects_coordinator,
@@ -352,44 +956,63 @@ async def async_setup_entry(
             "Update Interval (Objects)",
             "mdi:timer",
         ),
-        MyWebLogDiagnosticSensor(
-            objects_coordinator,
-            "airplane_count",
-            "Configured Airplanes",
-            "mdi:airplane",
-            len(airplanes),
-        ),
+        airplane_count_sensor,
     ]
     sensors.extend(diagnostic_sensors)
 
-    def update_last_update_timestamp() -> None:
-        """Update the last update timestamp when coordinator refreshes."""
-        if objects_coordinator.last_exception is None:
-            objects_coordinator._last_update_success_timestamp = time.time()  # type: ignore
-
-    # Listen for coordinator updates and track successful ones
-    objects_coordinator.async_add_listener(update_last_update_timestamp)
+    # Add fleet aggregate sensors sharing one set of stats
+    fleet_stats = MyWebLogFleetStats(runtime)
+    fleet_sensors = [
+        MyWebLogFleetSensor(runtime, fleet_stats, description)
+        for description in FLEET_SENSOR_TYPES
+    ]
+    sensors.extend(fleet_sensors)
+
+    @callback
+    def async_airplanes_updated(added: list[dict[str, Any]]) -> None:
+        """Add sensors for airplanes added while the entry is loaded."""
+        if added:
+            async_add_entities(airplane_sensors(added))
+        airplane_count_sensor.set_static_value(len(runtime.airplanes))
+        runtime.publisher.async_publish(fleet_sensors)
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_AIRPLANES_UPDATED.format(config_entry.entry_id),
+            async_airplanes_updated,
+        )
+    )
 
-    async_add_entities(sensors, True)
+    async_add_entities(sensors)
 
 
-class MyWebLogAirplaneSensor(CoordinatorEntity, SensorEntity):
+class MyWebLogAirplaneSensor(MyWebLogRestoreSensor):
     """Sensor entity for a specific metric of a myWebLog airplane."""
 
+    entity_description: MyWebLogSensorEntityDescription
+
     def __init__(
         self,
-        objects_coordinator: DataUpdateCoordinator,
-        bookings_coordinator: DataUpdateCoordinator,
+        runtime: MyWebLogRuntime,
         airplane: dict[str, Any],
-        description: SensorEntityDescription,
+        description: MyWebLogSensorEntityDescription,
     ) -> None:
         """Initialize the sensor entity."""
-        # Initialize with the objects_coordinator as the main coordinator
-        super().__init__(objects_coordinator)
+        # The objects_coordinator is the main coordinator, bookings updates
+        # are published as well for the sensors reading them
+        self._bookings_coordinator = runtime.bookings_coordinators[airplane["id"]]
+        other_coordinators = (
+            (self._bookings_coordinator,) if description.bookings else ()
+        )
+        super().__init__(
+            runtime.publisher, runtime.objects_coordinator, *other_coordinators
+        )
         self.entity_description = description
-        self._bookings_coordinator = bookings_coordinator
+        self._runtime = runtime
+        self._value_fns = compile_value_fns(description, runtime)
         self._airplane_id = airplane["id"]
-        self._airplane_regnr = airplane["regnr"]
+        self._airplane_regnr = self._watchdog_subject = airplane["regnr"]
         self._airplane_title = airplane.get("title", airplane["regnr"])
         self._attr_unique_id = f"myweblog_{self._airplane_regnr.lower().replace('-', '_')}_{description.key}"
         self._attr_has_entity_name = True
@@ -399,8 +1022,6 @@ class MyWebLogAirplaneSensor(CoordinatorEntity, SensorEntity):
             manufacturer="myWebLog",
             model=self._airplane_title,
         )
-        self._next_booking_obj = None
-        self._attr_should_poll = False  # We use coordinator for updates
         _LOGGER.debug(
             "Created sensor: regnr=%s, key=%s, unique_id=%s",
             self._airplane_regnr,
@@ -408,143 +1029,24 @@ class MyWebLogAirplaneSensor(CoordinatorEntity, SensorEntity):
             self._attr_unique_id,
         )
 
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        await super().async_added_to_hass()
-        # Add listener for bookings coordinator updates
-        self.async_on_remove(
-            self._bookings_coordinator.async_add_listener(self._handle_bookings_update)
-        )
-        # Initial update
-        self._handle_bookings_update()
-
-    def _handle_bookings_update(self) -> None:
-        """Handle updated data from the bookings coordinator."""
-        # Force a state update when bookings change
-        self.async_write_ha_state()
-
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            super().available
-            and self.coordinator.data is not None
-            and self._bookings_coordinator.data is not None
-        )
-
-    def _get_yellow_tags(self, obj: dict[str, Any]) -> int:
-        return len(
-            [r for r in obj.get("activeRemarks", []) if r.get("remarkCategory") == "1"]
-        )
-
-    def _get_red_tags(self, obj: dict[str, Any]) -> int:
-        return len(
-            [r for r in obj.get("activeRemarks", []) if r.get("remarkCategory") == "2"]
+        return super().available and (
+            self._restored_state() is not None or self._has_live_data()
         )
 
-    def _get_days_to_go(self, obj: dict[str, Any]) -> int:
-        return obj.get("maintTimeDate", {}).get("daysToGoValue", 0)
-
-    def _get_days_to_flight_stop(self, obj: dict[str, Any]) -> int:
-        return obj.get("maintTimeDate", {}).get("flightStop_daysToGoValue", 0)
-
-    def _get_hours_to_go(self, obj: dict[str, Any]) -> float:
-        return round(float(obj.get("maintTimeDate", {}).get("hoursToGoValue", 0)), 2)
-
-    def _get_hours_to_flight_stop(self, obj: dict[str, Any]) -> float:
-        return round(
-            float(obj.get("maintTimeDate", {}).get("flightStop_hoursToGoValue", 0)), 2
-        )
-
-    def _get_airborne(self, obj: dict[str, Any]) -> float:
-        try:
-            value = obj["flightData"]["total"]["airborne"]
-        except (KeyError, TypeError):
-            value = obj.get("ftData", {}).get("airborne", 0)
-        try:
-            value = float(value)
-        except (TypeError, ValueError):
-            return obj.get("ftData", {}).get("landings", 0)
-        return round(value, 2)
-
-    def _get_block(self, obj: dict[str, Any]) -> float:
-        try:
-            value = obj["flightData"]["total"]["block"]
-        except (KeyError, TypeError):
-            value = obj.get("ftData", {}).get("block", 0)
-        try:
-            value = float(value)
-        except (TypeError, ValueError):
-            return value
-        return round(value, 2)
-
-    def _get_tachometer(self, obj: dict[str, Any]) -> float:
-        try:
-            value = obj["flightData"]["total"]["tachoMeter"]
-        except (KeyError, TypeError):
-            value = obj.get("ftData", {}).get("tachometer", 0)
-        try:
-            value = float(value)
-        except (TypeError, ValueError):
-            return value
-        return round(value, 2)
-
-    def _get_tach_time(self, obj: dict[str, Any]) -> float:
-        try:
-            value = obj["flightData"]["total"]["tachtime"]
-        except (KeyError, TypeError):
-            value = obj.get("ftData", {}).get("tachtime", 0)
-        try:
-            value = float(value)
-        except (TypeError, ValueError):
-            return value
-        return round(value, 2)
-
-    def _get_landings(self, obj: dict[str, Any]) -> int:
-        try:
-            return obj["flightData"]["total"]["landings"]
-        except (KeyError, TypeError):
-            return obj.get("ftData", {}).get("landings", 0)
-
-    def _get_model(self, obj: dict[str, Any]) -> str | None:
-        return obj.get("model")
-
-    def _get_club(self, obj: dict[str, Any]) -> str | None:
-        return obj.get("clubname")
-
-    def _get_next_booking(self, obj: dict[str, Any]) -> str | None:
-        bookings = self._bookings_coordinator.data or []
-        if not bookings:
-            self._next_booking_obj = None
-            return None
-        now = time.time()
-        future_bookings = [
-            b for b in bookings if b.get("bStart") and b.get("bStart") > now
-        ]
-        next_booking = min(
-            future_bookings,
-            key=lambda b: b.get("bStart", float("inf")),
-            default=None,
-        )
-        self._next_booking_obj = next_booking  # Save for attribute access
-        if not next_booking or not next_booking.get("bStartLTObj"):
-            return None
-        try:
-            lt_obj = next_booking["bStartLTObj"]
-            dt_str = lt_obj.get("date")
-            tz_str = lt_obj.get("timezone")
-            try:
-                dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S.%f")
-            except ValueError:
-                dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
-            dt = dt.replace(tzinfo=ZoneInfo(tz_str))
-            return dt.isoformat()
-        except (KeyError, TypeError, ValueError):
-            return None
+    def _next_booking(self) -> BookingSummary | None:
+        """Return the precomputed display fields of the next booking."""
+        return self._runtime.get_next_booking(self._airplane_id, time.time())
 
     @property
     def state(self) -> StateType:
         """Return the state of the sensor."""
+        return self.native_value
+
+    def _live_value(self) -> StateType:
+        """Return the value of the metric."""
         if not self.available:
             return None
 
@@ -555,39 +1057,23 @@ class MyWebLogAirplaneSensor(CoordinatorEntity, SensorEntity):
             )
             return None
 
-        key = self.entity_description.key
-
-        dispatch = {
-            "yellow_tags": self._get_yellow_tags,
-            "red_tags": self._get_red_tags,
-            "days_to_go": self._get_days_to_go,
-            "hours_to_go": self._get_hours_to_go,
-            "days_to_flight_stop": self._get_days_to_flight_stop,
-            "hours_to_flight_stop": self._get_hours_to_flight_stop,
-            "airborne": self._get_airborne,
-            "block": self._get_block,
-            "tachometer": self._get_tachometer,
-            "tach_time": self._get_tach_time,
-            "landings": self._get_landings,
-            "model": self._get_model,
-            "club": self._get_club,
-            "next_booking": self._get_next_booking,
-        }
+        if self.entity_description.key == "next_booking":
+            next_booking = self._next_booking()
+            return next_booking.start if next_booking is not None else None
 
-        if key in dispatch:
-            return dispatch[key](obj)
+        return self._value_fns[self._runtime.get_objects_schema()](obj)
 
-        _LOGGER.warning(
-            "Unknown sensor key: %s for regnr=%s", key, self._airplane_regnr
-        )
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _live_attributes(self) -> dict[str, Any]:
         """Return extra state attributes for the sensor."""
-        attrs = dict(super().extra_state_attributes or {})
         key = self.entity_description.key
-        state = self.state
+
+        # Add booking information for next_booking sensor
+        if key == "next_booking":
+            next_booking = self._next_booking()
+            return dict(next_booking.attributes) if next_booking is not None else {}
+
+        attrs: dict[str, Any] = {}
+        state = self._live_value()
 
         # Set icon colors for tag sensors
         if key == "red_tags" and isinstance(state, int) and state > 0:
@@ -595,52 +1081,14 @@ class MyWebLogAirplaneSensor(CoordinatorEntity, SensorEntity):
         elif key == "yellow_tags" and isinstance(state, int) and state > 0:
             attrs["icon_color"] = "yellow"
 
-        # Add booking information for next_booking sensor
-        if key == "next_booking":
-            next_booking_obj = getattr(self, "_next_booking_obj", None)
-            if next_booking_obj:
-                # Add booking owner information
-                fullname = next_booking_obj.get("fullname")
-                student_name = next_booking_obj.get("extra_elev_fullname")
-
-                if fullname:
-                    attrs["booked_by"] = fullname
-                if student_name and student_name.strip() not in ("", " "):
-                    attrs["student_name"] = student_name.strip()
-
-                # Calculate booking length
-                b_start = next_booking_obj.get("bStart")
-                b_end = next_booking_obj.get("bEnd")
-                if isinstance(b_start, (int, float)) and isinstance(
-                    b_end, (int, float)
-                ):
-                    total_seconds = b_end - b_start
-                    total_minutes = int(total_seconds / 60)
-                    minutes = total_minutes % 60
-                    total_hours = total_minutes // 60
-                    hours = total_hours % 24
-                    days = total_hours // 24
-
-                    # Format the duration string
-                    parts = []
-                    if days > 0:
-                        parts.append(f"{days} day{'s' if days != 1 else ''}")
-                    if hours > 0 or days > 0:  # Show hours if there are days or hours
-                        parts.append(f"{hours} hr{'s' if hours != 1 else ''}")
-                    parts.append(f"{minutes} min")
-
-                    attrs["booking_length"] = " ".join(parts)
+        # List the open remarks for tag sensors
+        remark_category = self.entity_description.remark_category
+        if remark_category is not None and self.available:
+            attrs["remarks"] = self._runtime.get_remark_index(self._airplane_id).titles(
+                remark_category
+            )
 
         return attrs
 
     def _get_airplane_obj(self) -> dict[str, Any] | None:
-        if not self.coordinator.data:
-            return None
-        return next(
-            (
-                obj
-                for obj in self.coordinator.data
-                if isinstance(obj, dict) and obj.get("ID") == self._airplane_id
-            ),
-            None,
-        )
+        return self._runtime.get_airplane_object(self._airplane_id)
@@ -0,0 +1,260 @@
+"""Services for the MyWeblog integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+
+import voluptuous as vol  # type: ignore[import]
+
+from homeassistant.core import (  # type: ignore[import]
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError  # type: ignore[import]
+from homeassistant.helpers import (  # type: ignore[import]
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.service import (  # type: ignore[import]
+    async_extract_referenced_entity_ids,
+)
+
+from .const import (
+    DEFAULT_STATISTICS_IMPORT_DAYS,
+    DOMAIN,
+    SERVICE_IMPORT_STATISTICS,
+    SERVICE_PROFILE,
+    SERVICE_RECORD_CASSETTE,
+    SERVICE_REFRESH,
+    SERVICE_REPLAY_CASSETTE,
+)
+from .coordinator import MyWebLogRuntime
+from .helpers import async_import_module
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_DAYS = "days"
+ATTR_DURATION = "duration"
+ATTR_PATH = "path"
+ATTR_SPEED = "speed"
+
+IMPORT_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DAYS, default=DEFAULT_STATISTICS_IMPORT_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=365)
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=20)
+        ),
+    }
+)
+
+RECORD_CASSETTE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=1440)
+        ),
+    }
+)
+
+REPLAY_CASSETTE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_PATH): cv.string,
+        vol.Optional(ATTR_SPEED, default=1): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=100)
+        ),
+    }
+)
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        **cv.ENTITY_SERVICE_FIELDS,
+    }
+)
+
+# Devices shared by all airplanes of an entry rather than tied to one
+ENTRY_DEVICES = {"fleet", "diagnostics"}
+
+
+def _runtimes(hass: HomeAssistant, call: ServiceCall) -> list[MyWebLogRuntime]:
+    """Return the runtimes a service call applies to."""
+    runtimes: dict[str, MyWebLogRuntime] = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is None:
+        return list(runtimes.values())
+    if entry_id not in runtimes:
+        raise ServiceValidationError(f"No loaded myWebLog entry {entry_id}")
+    return [runtimes[entry_id]]
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_import_statistics(call: ServiceCall) -> ServiceResponse:
+        """Backfill the long-term statistics of the flight counters."""
+        if "recorder" not in hass.config.components:
+            raise ServiceValidationError("The recorder is not running")
+        backfill = await async_import_module(hass, "backfill")
+        imported = 0
+        for runtime in _runtimes(hass, call):
+            imported += await backfill.async_import_flight_statistics(
+                runtime, call.data[ATTR_DAYS]
+            )
+        return {"imported": imported}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_STATISTICS,
+        async_import_statistics,
+        schema=IMPORT_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    # Only one profiler can be active in the event loop thread
+    profile_lock = asyncio.Lock()
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile refresh cycles and write the stats to the config dir."""
+        runtimes = _runtimes(hass, call)
+        if profile_lock.locked():
+            raise ServiceValidationError("A profile is already running")
+        async with profile_lock:
+            profiler = await async_import_module(hass, "profiler")
+            path = await profiler.async_profile_refresh(
+                hass, runtimes, call.data[ATTR_CYCLES]
+            )
+        return {"path": path}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_record_cassette(call: ServiceCall) -> ServiceResponse:
+        """Start recording the API traffic of entries to the config dir."""
+        runtimes = _runtimes(hass, call)
+        if any(runtime.cassette is not None for runtime in runtimes):
+            raise ServiceValidationError("A cassette is already recording or playing")
+        cassette = await async_import_module(hass, "cassette")
+        paths = cassette.async_record_cassettes(
+            hass, runtimes, timedelta(minutes=call.data[ATTR_DURATION])
+        )
+        return {"paths": paths}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECORD_CASSETTE,
+        async_record_cassette,
+        schema=RECORD_CASSETTE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_replay_cassette(call: ServiceCall) -> None:
+        """Serve the requests of entries from a cassette, or the API again."""
+        runtimes = _runtimes(hass, call)
+        path = call.data.get(ATTR_PATH)
+        if path is not None:
+            path = hass.config.path(path)
+            in_config_dir = (
+                Path(path)
+                .resolve()
+                .is_relative_to(Path(hass.config.config_dir).resolve())
+            )
+            if not in_config_dir and not hass.config.is_allowed_path(path):
+                raise ServiceValidationError(f"Access to {path} is not allowed")
+        cassette = await async_import_module(hass, "cassette")
+        try:
+            await cassette.async_replay_cassette(
+                hass, runtimes, path, call.data[ATTR_SPEED]
+            )
+        except (OSError, ValueError) as err:
+            raise ServiceValidationError(f"Cannot replay {path}: {err}") from err
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY_CASSETTE,
+        async_replay_cassette,
+        schema=REPLAY_CASSETTE_SCHEMA,
+    )
+
+    async def async_refresh(call: ServiceCall) -> None:
+        """Refresh the targeted airplanes now, joining fetches in flight."""
+        targets = _refresh_targets(hass, call)
+        await asyncio.gather(
+            *(
+                runtime.async_refresh(airplane_ids)
+                for runtime, airplane_ids in targets.items()
+            )
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH, async_refresh, schema=REFRESH_SCHEMA
+    )
+
+
+def _refresh_targets(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[MyWebLogRuntime, set[str] | None]:
+    """Return the airplanes to refresh per runtime, None meaning all of them.
+
+    Without a target every airplane of the entries the call applies to is
+    refreshed. An airplane device or entity refreshes that airplane, while
+    the fleet and diagnostics devices refresh the whole entry.
+    """
+    runtimes = _runtimes(hass, call)
+    if not any(call.data.get(key) for key in cv.ENTITY_SERVICE_FIELDS):
+        return dict.fromkeys(runtimes)
+
+    selected = async_extract_referenced_entity_ids(hass, call)
+    ent_reg = er.async_get(hass)
+    device_ids = set(selected.referenced_devices)
+    for entity_id in selected.referenced | selected.indirectly_referenced:
+        if (entity := ent_reg.async_get(entity_id)) and entity.device_id:
+            device_ids.add(entity.device_id)
+
+    dev_reg = dr.async_get(hass)
+    by_entry = {runtime.config_entry.entry_id: runtime for runtime in runtimes}
+    targets: dict[MyWebLogRuntime, set[str] | None] = {}
+    for device_id in device_ids:
+        if (device := dev_reg.async_get(device_id)) is None:
+            continue
+        names = {name for domain, name in device.identifiers if domain == DOMAIN}
+        for entry_id in device.config_entries:
+            if (runtime := by_entry.get(entry_id)) is None:
+                continue
+            if names & ENTRY_DEVICES:
+                targets[runtime] = None
+                continue
+            airplane_ids = {
+                airplane_id
+                for airplane_id, airplane in runtime.airplanes.items()
+                if airplane["regnr"] in names
+            }
+            if airplane_ids and runtime not in targets:
+                targets[runtime] = set()
+            if (airplanes := targets.get(runtime)) is not None:
+                airplanes |= airplane_ids
+
+    if not targets:
+        raise ServiceValidationError("No myWebLog airplane or fleet targeted")
+    return targets
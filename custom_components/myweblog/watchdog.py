@@ -0,0 +1,109 @@
+"""Timing of the work the MyWeblog integration does in the event loop."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+from .const import LOOP_BLOCK_THRESHOLD, LOOP_BLOCK_WARN_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CallbackTimings:
+    """Execution times of one callback for one subject."""
+
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    slow: int = 0
+    last_warned: float | None = None
+    unreported: int = 0
+
+
+class LoopWatchdog:
+    """Record how long callbacks hold the event loop.
+
+    Every timed call is counted per subject, an airplane, entity or
+    coordinator, and metric, the callback or property that ran. A call
+    taking longer than the threshold is logged as a warning, at most once
+    per warn interval for the same subject and metric, so a callback that
+    is slow on every update does not flood the log. The slowest callbacks
+    are reported in the diagnostics.
+    """
+
+    def __init__(
+        self,
+        threshold: float = LOOP_BLOCK_THRESHOLD,
+        warn_interval: float = LOOP_BLOCK_WARN_INTERVAL,
+    ) -> None:
+        """Initialize the watchdog."""
+        self.threshold = threshold
+        self.warn_interval = warn_interval
+        self.timings: dict[tuple[str, str], CallbackTimings] = {}
+
+    def record(self, subject: str, metric: str, duration: float) -> None:
+        """Count a call and warn if it held the loop too long."""
+        timings = self.timings.get((subject, metric))
+        if timings is None:
+            timings = self.timings[subject, metric] = CallbackTimings()
+        timings.calls += 1
+        timings.total += duration
+        if duration > timings.max:
+            timings.max = duration
+        if duration < self.threshold:
+            return
+
+        timings.slow += 1
+        now = time.monotonic()
+        if (
+            timings.last_warned is not None
+            and now - timings.last_warned < self.warn_interval
+        ):
+            timings.unreported += 1
+            return
+        _LOGGER.warning(
+            "%s of %s blocked the event loop for %.0f ms "
+            "(%d more slow calls since the last warning)",
+            metric,
+            subject,
+            duration * 1000,
+            timings.unreported,
+        )
+        timings.last_warned = now
+        timings.unreported = 0
+
+    @contextmanager
+    def timed(self, subject: str, metric: str) -> Iterator[None]:
+        """Time the enclosed code as a call of a metric of a subject."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(subject, metric, time.perf_counter() - start)
+
+    def as_dict(self, limit: int = 10) -> dict[str, Any]:
+        """Return the slowest callbacks for diagnostics."""
+        worst = sorted(
+            self.timings.items(), key=lambda item: item[1].max, reverse=True
+        )[:limit]
+        return {
+            "threshold_ms": self.threshold * 1000,
+            "slow_calls": sum(timings.slow for timings in self.timings.values()),
+            "worst": [
+                {
+                    "subject": subject,
+                    "metric": metric,
+                    "calls": timings.calls,
+                    "slow_calls": timings.slow,
+                    "max_ms": round(timings.max * 1000, 3),
+                    "mean_ms": round(timings.total / timings.calls * 1000, 3),
+                }
+                for (subject, metric), timings in worst
+            ],
+        }
@@ -0,0 +1,71 @@
+"""Test MyWeblog API access."""
+
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest  # type: ignore[import]
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from custom_components.myweblog.api import MyWebLogSessionClient
+
+
+async def test_session_client_borrows_session(hass: HomeAssistant) -> None:
+    """Test the client using a shared session without closing it."""
+    session = MagicMock()
+    session.close = AsyncMock()
+
+    async with MyWebLogSessionClient(session, "test_user", "test_password") as client:
+        assert client.session is session
+        assert client.username == "test_user"
+
+    assert client.session is None
+    session.close.assert_not_awaited()
+
+    # The session can be borrowed again
+    async with client:
+        assert client.session is session
+
+
+def _session(body: str) -> MagicMock:
+    response = MagicMock()
+    response.text = AsyncMock(return_value=body)
+    session = MagicMock()
+    session.post.return_value.__aenter__ = AsyncMock(return_value=response)
+    session.post.return_value.__aexit__ = AsyncMock(return_value=None)
+    return session
+
+
+async def test_session_client_decodes_response(hass: HomeAssistant) -> None:
+    """Test responses decoded in the event loop or, when large, the executor."""
+    body = json.dumps(
+        {
+            "qType": "GetObjects",
+            "APIVersion": "3.0.0",
+            "result": {"Object": [{"ID": "1", "regnr": "SE-ABC"}]},
+        }
+    )
+    session = _session(body)
+    async with MyWebLogSessionClient(session, "u", "p", "token") as client:
+        assert await client.getObjects() == {"Object": [{"ID": "1", "regnr": "SE-ABC"}]}
+        assert session.post.call_args.kwargs["data"]["qtype"] == "GetObjects"
+
+        threads = []
+        decode = json.loads
+
+        def loads(text: str) -> dict:
+            threads.append(threading.current_thread())
+            return decode(text)
+
+        with patch("custom_components.myweblog.api.json.loads", side_effect=loads):
+            await client.getObjects()
+            with patch("custom_components.myweblog.api.EXECUTOR_DECODE_BYTES", 10):
+                assert await client.getObjects() == {
+                    "Object": [{"ID": "1", "regnr": "SE-ABC"}]
+                }
+        assert threads[0] is threading.main_thread()
+        assert threads[1] is not threading.main_thread()
+
+    session = _session(json.dumps({"qType": "GetObjects", "error": "Ogiltigt"}))
+    async with MyWebLogSessionClient(session, "u", "p", "token") as client:
+        with pytest.raises(ValueError, match="Ogiltigt"):
+            await client.getObjects()
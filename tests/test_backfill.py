@@ -0,0 +1,140 @@
+"""Test MyWeblog statistics backfill."""
+
+from datetime import timedelta
+from unittest.mock import patch, AsyncMock
+
+import pytest  # type: ignore[import]
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+from custom_components.myweblog.backfill import (
+    build_hourly_statistics,
+    flight_end,
+    hourly_deltas,
+)
+from custom_components.myweblog.const import DOMAIN, SERVICE_IMPORT_STATISTICS
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import]
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(recorder_mock, enable_custom_integrations):
+    """Set up the recorder before Home Assistant starts."""
+    yield
+
+
+async def test_build_hourly_statistics(hass: HomeAssistant) -> None:
+    """Test hourly statistics rebuilt backwards from the current total."""
+    end = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    start = end - timedelta(hours=4)
+    deltas = {end - timedelta(hours=3): 1.5, end: 0.5}
+
+    rows = build_hourly_statistics(102.0, 10.0, deltas, start, end)
+    assert [row["start"] for row in rows] == [
+        start + timedelta(hours=hour) for hour in range(4)
+    ]
+    assert [row["state"] for row in rows] == [100.0, 101.5, 101.5, 101.5]
+    assert [row["sum"] for row in rows] == [8.5, 10.0, 10.0, 10.0]
+
+    flights = [
+        {
+            "flight_datum": "2025-05-01",
+            "block_end": "10:45",
+            "airborne_total": "1.2",
+            "flights": "2",
+        },
+        {"flight_datum": "2025-05-01", "airborne_end": "10:05", "airborne_total": 0.3},
+        {"flight_datum": "broken", "airborne_total": 5},
+    ]
+    hour = flight_end(flights[0]).replace(minute=0)
+    assert flight_end(flights[1]).replace(minute=0) == hour
+    assert flight_end(flights[2]) is None
+    deltas = hourly_deltas(flights)
+    assert dict(deltas["airborne"]) == {hour: 1.5}
+    assert dict(deltas["landings"]) == {hour: 2.0}
+    assert not deltas["block"]
+
+
+async def test_import_statistics_service(hass: HomeAssistant) -> None:
+    """Test the flight counter statistics imported from the flight log."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    yesterday = dt_util.now() - timedelta(days=1)
+    flight_log = {
+        "FlightLog": [
+            {
+                "flight_datum": yesterday.date().isoformat(),
+                "block_end": "10:30",
+                "airborne_total": "1.5",
+                "flights": "2",
+            }
+        ]
+    }
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client, patch(
+        "homeassistant.components.recorder.statistics.async_import_statistics"
+    ) as mock_import:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {
+                        "ID": "1",
+                        "regnr": "SE-ABC",
+                        "flightData": {"total": {"airborne": 130, "landings": 50}},
+                    }
+                ]
+            }
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+        instance.getFlightLog = AsyncMock(return_value=flight_log)
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_IMPORT_STATISTICS,
+            {"days": 3},
+            blocking=True,
+            return_response=True,
+        )
+
+        # One flight log request, 72 hourly rows for each of the five counters
+        assert instance.getFlightLog.call_count == 1
+        assert instance.getFlightLog.call_args.kwargs["ac_id"] == 1
+        assert response == {"imported": 360}
+
+        imported = {
+            call.args[1]["statistic_id"]: call.args[2]
+            for call in mock_import.call_args_list
+        }
+        assert len(imported) == 5
+        assert imported["sensor.se_abc_block"][0] == {
+            "start": imported["sensor.se_abc_block"][0]["start"],
+            "state": 0,
+            "sum": 0,
+        }
+        airborne = imported["sensor.se_abc_airborne"]
+        assert len(airborne) == 72
+        assert airborne[0]["state"] == 128.5
+        assert airborne[0]["sum"] == -1.5
+        assert airborne[-1]["state"] == 130
+        assert airborne[-1]["sum"] == 0
+        landings = imported["sensor.se_abc_landings"]
+        assert landings[0]["state"] == 48
+        assert landings[-1]["state"] == 50
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
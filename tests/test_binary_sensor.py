@@ -0,0 +1,162 @@
+"""Test MyWeblog airplane in use binary sensors."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, AsyncMock
+
+from freezegun.api import FrozenDateTimeFactory  # type: ignore[import]
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from custom_components.myweblog.const import DOMAIN
+from pytest_homeassistant_custom_component.common import (  # type: ignore[import]
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+NOW = datetime(2024, 6, 1, 9, 0, 0, tzinfo=timezone.utc)
+
+
+def _booking(booking_id: str, start: timedelta, end: timedelta, name: str) -> dict:
+    return {
+        "ID": booking_id,
+        "bStart": (NOW + start).timestamp(),
+        "bEnd": (NOW + end).timestamp(),
+        "fullname": name,
+    }
+
+
+async def test_in_use_follows_booking_edges(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the in use state flipping exactly as bookings start and end."""
+    freezer.move_to(NOW)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [{"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"}],
+        },
+        # Poll the bookings far less often than they change
+        options={"polling_profile": "economy"},
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={"Object": [{"ID": "1", "regnr": "SE-ABC"}]}
+        )
+        instance.getBookingsWithDates = AsyncMock(
+            return_value={
+                "Booking": [
+                    _booking("1", timedelta(minutes=10), timedelta(minutes=30), "A"),
+                    _booking("2", timedelta(minutes=20), timedelta(minutes=40), "B"),
+                ]
+            }
+        )
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        calls = instance.getBookingsWithDates.call_count
+
+        state = hass.states.get("binary_sensor.se_abc_in_use")
+        assert state.state == "off"
+        assert state.attributes["device_class"] == "occupancy"
+        assert "booked_by" not in state.attributes
+
+        expected = (
+            (timedelta(minutes=10), "on", "A"),
+            (timedelta(minutes=20), "on", "A"),
+            (timedelta(minutes=30), "on", "B"),
+            (timedelta(minutes=40), "off", None),
+        )
+        for offset, on_off, booked_by in expected:
+            # Nothing changes a second before the edge
+            before = hass.states.get("binary_sensor.se_abc_in_use")
+            freezer.move_to(NOW + offset - timedelta(seconds=1))
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+            state = hass.states.get("binary_sensor.se_abc_in_use")
+            assert state.state == before.state
+            assert state.attributes == before.attributes
+
+            freezer.move_to(NOW + offset)
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+            state = hass.states.get("binary_sensor.se_abc_in_use")
+            assert state.state == on_off
+            assert state.attributes.get("booked_by") == booked_by
+
+        state = hass.states.get("binary_sensor.se_abc_in_use")
+        assert "booking_start" not in state.attributes
+        assert instance.getBookingsWithDates.call_count == calls
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_in_use_attributes(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the details of the ongoing booking and a refresh ending it."""
+    hass.config.set_time_zone("UTC")
+    freezer.move_to(NOW)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [{"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"}],
+        },
+    )
+    entry.add_to_hass(hass)
+    booking = {
+        **_booking("1", timedelta(hours=-1), timedelta(hours=1), "Test Pilot"),
+        "extra_elev_fullname": "Test Student",
+        "bStartLTObj": {"date": "2024-06-01 10:00:00", "timezone": "Europe/Stockholm"},
+        "bEndLTObj": {"date": "2024-06-01 12:00:00", "timezone": "Europe/Stockholm"},
+    }
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={"Object": [{"ID": "1", "regnr": "SE-ABC"}]}
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": [booking]})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        state = hass.states.get("binary_sensor.se_abc_in_use")
+        assert state.state == "on"
+        assert state.attributes["booking_start"] == "2024-06-01T10:00:00+02:00"
+        assert state.attributes["booking_end"] == "2024-06-01T12:00:00+02:00"
+        assert state.attributes["booked_by"] == "Test Pilot"
+        assert state.attributes["student_name"] == "Test Student"
+        assert state.attributes["booking_length"] == "2 hrs 0 min"
+
+        # Unknown rather than off while the bookings are not known
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        coordinator = runtime.bookings_coordinators["1"]
+        coordinator.async_set_updated_data(None)
+        await hass.async_block_till_done()
+        state = hass.states.get("binary_sensor.se_abc_in_use")
+        assert state.state == "unknown"
+        assert "booked_by" not in state.attributes
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert hass.states.get("binary_sensor.se_abc_in_use").state == "on"
+
+        # A cancelled booking ends the use at the next refresh
+        instance.getBookingsWithDates.return_value = {"Booking": []}
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert hass.states.get("binary_sensor.se_abc_in_use").state == "off"
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
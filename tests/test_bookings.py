@@ -0,0 +1,276 @@
+"""Test MyWeblog booking sync."""
+
+from datetime import timedelta
+from unittest.mock import patch, AsyncMock
+
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+from custom_components.myweblog.bookings import (
+    BookingIndex,
+    BookingStore,
+    format_booking_length,
+)
+from custom_components.myweblog.const import (
+    DOMAIN,
+    EVENT_BOOKING_CANCELLED,
+    EVENT_BOOKING_CREATED,
+    EVENT_BOOKING_UPDATED,
+)
+from pytest_homeassistant_custom_component.common import (  # type: ignore[import]
+    MockConfigEntry,
+    async_capture_events,
+)
+
+
+async def test_booking_store_ingest(hass: HomeAssistant) -> None:
+    """Test merging fetched windows into the booking store."""
+    store = BookingStore()
+    store.ingest(
+        [
+            {"ID": 1, "bStart": 100, "bEnd": 200},
+            {"ID": 2, "bStart": 300, "bEnd": 400},
+            {"ID": 3, "bStart": 900, "bEnd": 950},
+        ],
+        window_start=0,
+        window_end=1000,
+        expire_before=0,
+    )
+    assert [b["ID"] for b in store.bookings] == [1, 2, 3]
+    assert not store.changes
+
+    # Booking 2 is moved, booking 1 expires and booking 3 lies outside the
+    # fetched window, so it is kept although it was not fetched again
+    bookings = store.ingest(
+        [{"ID": 2, "bStart": 500, "bEnd": 600}, {"ID": 4, "bStart": 450, "bEnd": 460}],
+        window_start=250,
+        window_end=800,
+        expire_before=250,
+    )
+    assert [b["ID"] for b in bookings] == [4, 2, 3]
+    assert bookings[1]["bStart"] == 500
+    assert len(store) == 3
+    assert [b["ID"] for b in store.changes.created] == [4]
+    assert [(old["bStart"], new["bStart"]) for old, new in store.changes.updated] == [
+        (300, 500)
+    ]
+    # Expired bookings are not reported as cancelled
+    assert store.changes.cancelled == []
+
+    # Booking 4 was cancelled
+    bookings = store.ingest(
+        [{"ID": 2, "bStart": 500, "bEnd": 600}],
+        window_start=250,
+        window_end=800,
+        expire_before=250,
+    )
+    assert [b["ID"] for b in bookings] == [2, 3]
+    assert [b["ID"] for b in store.changes.cancelled] == [4]
+    assert not store.changes.created and not store.changes.updated
+
+    # Bookings entering the window as it moves forward were not created now
+    store.ingest(
+        [
+            {"ID": 2, "bStart": 500, "bEnd": 600},
+            {"ID": 3, "bStart": 900, "bEnd": 950},
+            {"ID": 5, "bStart": 1100, "bEnd": 1200},
+        ],
+        window_start=250,
+        window_end=1500,
+        expire_before=250,
+    )
+    assert not store.changes
+
+
+async def test_booking_summaries(hass: HomeAssistant) -> None:
+    """Test the display fields of bookings computed once at ingest."""
+    store = BookingStore()
+    lesson = {
+        "ID": 1,
+        "bStart": 3600,
+        "bEnd": 3600 + 93900,
+        "fullname": "Test Pilot",
+        "extra_elev_fullname": " Test Student ",
+        "bStartLTObj": {
+            "date": "2024-06-01 12:00:00.000000",
+            "timezone": "Europe/Stockholm",
+        },
+        "bEndLTObj": {"date": "2024-06-02 14:05:00", "timezone": "Europe/Stockholm"},
+    }
+    solo = {"ID": 2, "bStart": 7200, "bEnd": 9000, "extra_elev_fullname": " "}
+    store.ingest([lesson, solo], 0, 100000, 0)
+
+    summary = store.summary(lesson)
+    assert summary.start == "2024-06-01T12:00:00+02:00"
+    assert summary.end == "2024-06-02T14:05:00+02:00"
+    assert summary.attributes == {
+        "booked_by": "Test Pilot",
+        "student_name": "Test Student",
+        "booking_length": "1 day 2 hrs 5 min",
+        "booking_end": "2024-06-02T14:05:00+02:00",
+    }
+    assert store.summary(solo).start is None
+    assert store.summary(solo).attributes == {"booking_length": "30 min"}
+
+    # Unchanged bookings keep their summary, changed ones get a new one
+    with patch(
+        "custom_components.myweblog.bookings.BookingSummary.from_booking"
+    ) as from_booking:
+        store.ingest([dict(lesson), {**solo, "bEnd": 10800}], 0, 100000, 0)
+    from_booking.assert_called_once_with({**solo, "bEnd": 10800})
+    assert store.summary(lesson) is summary
+
+    store.ingest([], 0, 100000, 0)
+    assert store.summary(lesson) is None
+
+    index = BookingIndex([lesson, solo])
+    assert index.next_starting(0) is lesson
+    assert index.next_starting(3600) is solo
+    assert index.next_starting(7200) is None
+
+    # A booking without an end is still the next one to start
+    open_ended = {"ID": 3, "bStart": 5400}
+    index = BookingIndex([lesson, solo, open_ended])
+    assert len(index) == 2
+    assert index.next_starting(3600) is open_ended
+    assert index.next_starting(5400) is solo
+    assert index.current(5400) is lesson
+
+    assert format_booking_length(3600) == "1 hr 0 min"
+    assert format_booking_length(2 * 86400 + 60) == "2 days 0 hrs 1 min"
+
+
+async def test_bookings_fetch_horizon(hass: HomeAssistant) -> None:
+    """Test bookings are fetched for the configured horizon."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+        options={"bookings_days_back": 2, "bookings_days_ahead": 10},
+    )
+    entry.add_to_hass(hass)
+
+    now = dt_util.utcnow().timestamp()
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={"Object": [{"ID": "1", "regnr": "SE-ABC"}]}
+        )
+        instance.getBookingsWithDates = AsyncMock(
+            return_value={
+                "Booking": [
+                    {"ID": 1, "bStart": now - 5 * 86400, "bEnd": now - 4 * 86400},
+                    {"ID": 2, "bStart": now + 3600, "bEnd": now + 7200},
+                ]
+            }
+        )
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        today = dt_util.now().date()
+        airplane_id, from_date, to_date = instance.getBookingsWithDates.call_args[0]
+        assert airplane_id == "1"
+        assert from_date == today - timedelta(days=2)
+        assert to_date == today + timedelta(days=10)
+
+        # The expired booking is pruned when ingested
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        assert [b["ID"] for b in runtime.bookings_coordinators["1"].data] == [2]
+
+        # A changed horizon applies to the running coordinators
+        hass.config_entries.async_update_entry(
+            entry, options={"bookings_days_back": 0, "bookings_days_ahead": 5}
+        )
+        await hass.async_block_till_done()
+        _, from_date, to_date = instance.getBookingsWithDates.call_args[0]
+        assert from_date == today
+        assert to_date == today + timedelta(days=5)
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_booking_change_events(hass: HomeAssistant) -> None:
+    """Test booking changes are fired as events, coalesced per refresh."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    now = dt_util.utcnow().timestamp()
+    bookings = [
+        {"ID": 1, "bStart": now + 3600, "bEnd": now + 7200, "fullname": "Test Pilot"},
+        {"ID": 2, "bStart": now + 86400, "bEnd": now + 90000},
+        {"ID": 3, "bStart": now + 2 * 86400, "bEnd": now + 2 * 86400 + 3600},
+    ]
+    created = async_capture_events(hass, EVENT_BOOKING_CREATED)
+    updated = async_capture_events(hass, EVENT_BOOKING_UPDATED)
+    cancelled = async_capture_events(hass, EVENT_BOOKING_CANCELLED)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={"Object": [{"ID": "1", "regnr": "SE-ABC"}]}
+        )
+        instance.getBookingsWithDates = AsyncMock(
+            return_value={"Booking": list(bookings)}
+        )
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        # The first payload is the baseline
+        assert not created and not updated and not cancelled
+
+        instance.getBookingsWithDates.return_value = {
+            "Booking": [
+                {**bookings[0], "bStart": now + 1800},
+                {"ID": 4, "bStart": now + 3 * 86400, "bEnd": now + 3 * 86400 + 60},
+                {"ID": 5, "bStart": now + 4 * 86400, "bEnd": now + 4 * 86400 + 60},
+            ]
+        }
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        await runtime.bookings_coordinators["1"].async_refresh()
+        await hass.async_block_till_done()
+
+        assert len(created) == 1
+        assert created[0].data["regnr"] == "SE-ABC"
+        assert [b["booking_id"] for b in created[0].data["bookings"]] == [4, 5]
+
+        assert len(updated) == 1
+        (booking,) = updated[0].data["bookings"]
+        assert booking["booking_id"] == 1
+        assert booking["booked_by"] == "Test Pilot"
+        assert booking["start"] == dt_util.utc_from_timestamp(now + 1800).isoformat()
+        assert (
+            booking["previous"]["start"]
+            == dt_util.utc_from_timestamp(now + 3600).isoformat()
+        )
+
+        assert len(cancelled) == 1
+        assert [b["booking_id"] for b in cancelled[0].data["bookings"]] == [2, 3]
+
+        # An unchanged payload fires nothing
+        await runtime.bookings_coordinators["1"].async_refresh()
+        await hass.async_block_till_done()
+        assert (len(created), len(updated), len(cancelled)) == (1, 1, 1)
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
@@ -0,0 +1,161 @@
+"""Test MyWeblog booking calendars."""
+
+import random
+import time
+from unittest.mock import patch, AsyncMock
+
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+from custom_components.myweblog.bookings import BookingIndex
+from custom_components.myweblog.const import DOMAIN
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import]
+
+
+async def test_booking_index_matches_linear_scan(hass: HomeAssistant) -> None:
+    """Test interval lookups against a brute force scan."""
+    rng = random.Random(42)
+    bookings = []
+    for booking_id in range(2000):
+        start = rng.uniform(0, 365 * 86400)
+        bookings.append(
+            {
+                "ID": booking_id,
+                "bStart": start,
+                "bEnd": start + rng.uniform(900, 86400 * rng.choice((0.1, 1, 5))),
+            }
+        )
+    bookings.append({"ID": "broken", "bStart": None, "bEnd": 10})
+    index = BookingIndex(bookings)
+    assert len(index) == 2000
+
+    for _ in range(200):
+        start = rng.uniform(-86400, 366 * 86400)
+        end = start + rng.uniform(0, 30 * 86400)
+        expected = sorted(
+            (
+                b["ID"]
+                for b in bookings[:2000]
+                if b["bStart"] < end and b["bEnd"] > start
+            )
+        )
+        assert sorted(b["ID"] for b in index.overlapping(start, end)) == expected
+
+        now = start
+        ongoing_or_future = [b for b in bookings[:2000] if b["bEnd"] > now]
+        expected_next = min(ongoing_or_future, key=lambda b: (b["bStart"], b["bEnd"]))
+        assert index.current_or_next(now) is expected_next
+
+        ongoing = [b for b in ongoing_or_future if b["bStart"] <= now]
+        expected_current = min(
+            ongoing, key=lambda b: (b["bStart"], b["bEnd"]), default=None
+        )
+        assert index.current(now) is expected_current
+        edges = [
+            edge
+            for b in bookings[:2000]
+            for edge in (b["bStart"], b["bEnd"])
+            if edge > now
+        ]
+        assert index.next_change(now) == min(edges, default=None)
+
+    assert BookingIndex([]).current_or_next(0) is None
+    assert BookingIndex([]).current(0) is None
+    assert BookingIndex([]).next_change(0) is None
+
+
+async def test_calendars(hass: HomeAssistant) -> None:
+    """Test airplane and fleet calendars built from bookings."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"},
+                {"id": "2", "regnr": "SE-DEF", "title": "SE-DEF (Piper PA-28)"},
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    now = time.time()
+    bookings = {
+        "1": [
+            {
+                "ID": 11,
+                "bStart": now + 3600,
+                "bEnd": now + 7200,
+                "fullname": "Test Pilot",
+                "extra_elev_fullname": "Test Student",
+            },
+            {"ID": 12, "bStart": now + 86400, "bEnd": now + 90000},
+        ],
+        "2": [{"ID": 21, "bStart": now + 1800, "bEnd": now + 5400}],
+    }
+
+    async def get_bookings(airplane_id: str, from_date, to_date) -> dict:
+        return {"Booking": bookings[airplane_id]}
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {"ID": "1", "regnr": "SE-ABC"},
+                    {"ID": "2", "regnr": "SE-DEF"},
+                ]
+            }
+        )
+        instance.getBookingsWithDates = AsyncMock(side_effect=get_bookings)
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        state = hass.states.get("calendar.se_abc_bookings")
+        assert state is not None
+        assert state.attributes["message"] == "SE-ABC: Test Pilot"
+        assert state.attributes["description"] == "Student: Test Student"
+
+        state = hass.states.get("calendar.myweblog_fleet_bookings")
+        assert state is not None
+        assert state.attributes["message"] == "SE-DEF"
+
+        component = hass.data["calendar"]
+        fleet = component.get_entity("calendar.myweblog_fleet_bookings")
+        events = await fleet.async_get_events(
+            hass,
+            dt_util.utc_from_timestamp(now),
+            dt_util.utc_from_timestamp(now + 2 * 86400),
+        )
+        assert [event.uid for event in events] == ["21", "11", "12"]
+
+        airplane = component.get_entity("calendar.se_abc_bookings")
+        events = await airplane.async_get_events(
+            hass,
+            dt_util.utc_from_timestamp(now + 80000),
+            dt_util.utc_from_timestamp(now + 2 * 86400),
+        )
+        assert [event.uid for event in events] == ["12"]
+
+        # A removed airplane has no bookings until its calendar is gone
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        await runtime.async_update_airplanes([runtime.airplanes["2"]])
+        assert airplane.event is None
+        events = await airplane.async_get_events(
+            hass,
+            dt_util.utc_from_timestamp(now),
+            dt_util.utc_from_timestamp(now + 2 * 86400),
+        )
+        assert events == []
+        events = await fleet.async_get_events(
+            hass,
+            dt_util.utc_from_timestamp(now),
+            dt_util.utc_from_timestamp(now + 2 * 86400),
+        )
+        assert [event.uid for event in events] == ["21"]
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
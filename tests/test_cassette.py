@@ -0,0 +1,311 @@
+"""Test MyWeblog API traffic recording and replay."""
+
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from freezegun.api import FrozenDateTimeFactory  # type: ignore[import]
+import pytest  # type: ignore[import]
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from homeassistant.exceptions import ServiceValidationError  # type: ignore[import]
+from custom_components.myweblog.cassette import (
+    Cassette,
+    CassettePlayer,
+    CassetteRecorder,
+    Interaction,
+)
+from custom_components.myweblog.const import (
+    DOMAIN,
+    SERVICE_RECORD_CASSETTE,
+    SERVICE_REPLAY_CASSETTE,
+)
+from pytest_homeassistant_custom_component.common import (  # type: ignore[import]
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+# Recorded with two airplanes at 2024-06-01 10:00 UTC
+CASSETTE = Path(__file__).parent / "cassettes" / "club.json"
+RECORDED_AT = datetime(2024, 6, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+
+def _entry() -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"},
+                {"id": "2", "regnr": "SE-LOP", "title": "SE-LOP"},
+            ],
+        },
+    )
+
+
+def _api_session(results: dict[str, dict]) -> MagicMock:
+    """Return a session answering each query type like the API does."""
+
+    def post(url: str, data: dict) -> MagicMock:
+        response = MagicMock()
+        response.text = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "qType": data["qtype"],
+                    "APIVersion": "3.0.0",
+                    "result": results[data["qtype"]],
+                }
+            )
+        )
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=None)
+        return context
+
+    session = MagicMock()
+    session.post.side_effect = post
+    return session
+
+
+async def test_record_cassette(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, tmp_path: Path
+) -> None:
+    """Test recording the traffic of an entry with personal data replaced."""
+    freezer.move_to(RECORDED_AT)
+    hass.config.config_dir = str(tmp_path)
+    entry = _entry()
+    entry.add_to_hass(hass)
+    session = _api_session(
+        {
+            "GetObjects": {
+                "Object": [
+                    {
+                        "ID": "1",
+                        "regnr": "SE-ABC",
+                        "activeRemarks": [
+                            {
+                                "remarkID": "7",
+                                "remarkBy": "Anna Andersson",
+                                "remarkCategory": "1",
+                                "remarkText": "Anna dented the flap",
+                            }
+                        ],
+                    },
+                    {"ID": "2", "regnr": "SE-LOP"},
+                ]
+            },
+            "GetBookings": {
+                "Booking": [
+                    {
+                        "ID": "501",
+                        "user_id": "1501",
+                        "fullname": "Anna Andersson",
+                        "email": "anna@example.com",
+                        "extra_elev_fullname": "",
+                    },
+                    {
+                        "ID": "502",
+                        "user_id": 1502,
+                        "fullname": "Bo Berg",
+                        "email": None,
+                    },
+                ]
+            },
+        }
+    )
+
+    with patch(
+        "custom_components.myweblog.coordinator.async_get_clientsession",
+        return_value=session,
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_RECORD_CASSETTE,
+            {"config_entry_id": entry.entry_id, "duration": 1},
+            blocking=True,
+            return_response=True,
+        )
+        [path] = response["paths"]
+        await hass.async_block_till_done()
+
+        # The service returns while the recording goes on in the background
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        assert isinstance(runtime.cassette, CassetteRecorder)
+        assert not Path(path).exists()
+        [recording] = [
+            task
+            for task in hass._background_tasks
+            if task.get_name() == "myweblog cassette recording"
+        ]
+
+        freezer.tick(timedelta(minutes=1))
+        async_fire_time_changed(hass)
+        await recording
+        assert runtime.cassette is None
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    text = Path(path).read_text(encoding="utf-8")
+    for secret in (
+        "test_user",
+        "test_password",
+        "fake_token",
+        "Anna",
+        "Bo Berg",
+        "1501",
+        "1502",
+    ):
+        assert secret not in text
+
+    interactions = json.loads(text)["interactions"]
+    assert [interaction["qtype"] for interaction in interactions] == [
+        "GetObjects",
+        "GetBookings",
+        "GetBookings",
+    ]
+    assert {interaction["params"].get("ac_id") for interaction in interactions} == {
+        None,
+        "1",
+        "2",
+    }
+    remark = interactions[0]["result"]["Object"][0]["activeRemarks"][0]
+    assert remark["remarkBy"] == "remarkBy 1"
+    assert remark["remarkText"] == "remarkText 1"
+    bookings = interactions[1]["result"]["Booking"]
+    assert bookings[0]["fullname"] == "fullname 1"
+    assert bookings[0]["user_id"] == "user_id 1"
+    assert bookings[1]["user_id"] == "user_id 2"
+    assert bookings[0]["email"] == "email 1"
+    assert bookings[0]["extra_elev_fullname"] == ""
+    assert bookings[1]["fullname"] == "fullname 2"
+    assert bookings[1]["email"] is None
+
+
+async def test_replay_cassette(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test running an entry on a recorded cassette over many polls."""
+    hass.config.set_time_zone("Europe/Stockholm")
+    freezer.move_to(RECORDED_AT)
+    player = await hass.async_add_executor_job(CassettePlayer.load, str(CASSETTE), 0)
+    entry = _entry()
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient",
+        player.client_factory(),
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.se_abc_airborne").state == "1523.4"
+        assert hass.states.get("sensor.se_lop_model").state == "Piper PA-28"
+        assert hass.states.get("sensor.se_abc_yellow_tags").state == "1"
+        next_booking = hass.states.get("sensor.se_abc_next_booking")
+        assert next_booking.attributes["booked_by"] == "fullname 1"
+        assert next_booking.attributes["student_name"] == "extra_elev_fullname 1"
+        served = player.served
+        assert served == 3
+
+        # The recording starts over for as long as the entry polls
+        for _ in range(8):
+            freezer.tick(timedelta(minutes=15))
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+        assert player.served > served + 8
+        assert hass.states.get("sensor.se_lop_airborne").state == "2890.1"
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_player_matching() -> None:
+    """Test requests served by parameters, then query type, at speed."""
+    player = CassettePlayer(
+        [
+            Interaction("GetBookings", {"ac_id": "1", "from_date": "a"}, {"n": 1}, 2),
+            Interaction("GetBookings", {"ac_id": "2", "from_date": "a"}, {"n": 2}, 2),
+            Interaction("GetBookings", {"ac_id": "1", "from_date": "b"}, {"n": 3}, 2),
+        ],
+        speed=4,
+    )
+
+    with patch("custom_components.myweblog.cassette.asyncio.sleep") as sleep:
+        assert await player.async_play("GetBookings", {"ac_id": "1"}) == {"n": 1}
+        sleep.assert_awaited_once_with(0.5)
+    player.speed = 0
+
+    result = await player.async_play("GetBookings", {"ac_id": "1", "from_date": "c"})
+    assert result == {"n": 3}
+    result["n"] = 0
+    assert await player.async_play("GetBookings", {"ac_id": "1"}) == {"n": 1}
+    assert await player.async_play("GetBookings", {"ac_id": "3"}) == {"n": 1}
+    assert await player.async_play("GetBookings", {"ac_id": "3"}) == {"n": 2}
+    with pytest.raises(ValueError):
+        await player.async_play("GetObjects", {})
+
+    with pytest.raises(TypeError):
+        Cassette()  # type: ignore[abstract]
+
+
+async def test_replay_cassette_service(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, tmp_path: Path
+) -> None:
+    """Test switching a running entry from the API to a cassette and back."""
+    freezer.move_to(RECORDED_AT)
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / "club.json").write_bytes(CASSETTE.read_bytes())
+    entry = _entry()
+    entry.add_to_hass(hass)
+    session = _api_session(
+        {
+            "GetObjects": {"Object": [{"ID": "1", "regnr": "SE-ABC", "model": "C172"}]},
+            "GetBookings": {"Booking": []},
+        }
+    )
+
+    with patch(
+        "custom_components.myweblog.coordinator.async_get_clientsession",
+        return_value=session,
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        assert hass.states.get("sensor.se_abc_model").state == "C172"
+        posts = session.post.call_count
+
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_REPLAY_CASSETTE,
+            {"path": "club.json", "speed": 0},
+            blocking=True,
+        )
+        assert runtime.cassette.served == 3
+        assert session.post.call_count == posts
+        assert hass.states.get("sensor.se_abc_model").state == "Cessna 172"
+
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN, SERVICE_RECORD_CASSETTE, {}, blocking=True
+            )
+
+        await hass.services.async_call(
+            DOMAIN, SERVICE_REPLAY_CASSETTE, {}, blocking=True
+        )
+        assert runtime.cassette is None
+        assert session.post.call_count == posts + 3
+        assert hass.states.get("sensor.se_abc_model").state == "C172"
+
+        for path in ("/etc/passwd", "missing.json"):
+            with pytest.raises(ServiceValidationError):
+                await hass.services.async_call(
+                    DOMAIN, SERVICE_REPLAY_CASSETTE, {"path": path}, blocking=True
+                )
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
@@ -1,11 +1,15 @@
 """Test MyWeblog config flow."""
+import asyncio
 from unittest.mock import patch, AsyncMock
 
+import pytest  # type: ignore[import]
+
 from homeassistant import config_entries, data_entry_flow  # type: ignore[import]
 from homeassistant.core import HomeAssistant  # type: ignore[import]
 from homeassistant.helpers import entity_registry as er  # type: ignore[import]
 from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import]
 from custom_components.myweblog.const import DOMAIN
+from custom_components.myweblog.scheduler import async_get_poll_scheduler
 
 
 async def test_flow_user_init(hass: HomeAssistant) -> None:
@@ -20,9 +24,9 @@ async def test_flow_user_init(hass: HomeAssistant) -> None:
 async def test_flow_user_success(hass: HomeAssistant) -> None:
     """Test a successful config flow."""
     with patch(
-        "custom_components.myweblog.config_flow.MyWebLogClient"
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
     ) as mock_client, patch(
-        "custom_components.myweblog.sensor.MyWebLogClient"
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
     ) as mock_sensor_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
@@ -41,7 +45,7 @@ async def test_flow_user_success(hass: HomeAssistant) -> None:
                 "Object": [{"ID": "1", "regnr": "SE-ABC", "model": "Cessna 172"}]
             }
         )
-        sensor_instance.getBookings = AsyncMock(return_value={"Booking": []})
+        sensor_instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         result = await hass.config_entries.flow.async_init(
             DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -74,7 +78,9 @@ async def test_flow_user_success(hass: HomeAssistant) -> None:
 
 async def test_flow_user_invalid_auth(hass: HomeAssistant) -> None:
     """Test config flow with invalid credentials."""
-    with patch("custom_components.myweblog.config_flow.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client:
         mock_client.return_value.__aenter__.side_effect = Exception(
             "Invalid credentials"
         )
@@ -94,7 +100,9 @@ async def test_flow_user_invalid_auth(hass: HomeAssistant) -> None:
 
 async def test_flow_user_invalid_auth_real(hass: HomeAssistant) -> None:
     """Test config flow with invalid credentials (distinguished)."""
-    with patch("custom_components.myweblog.config_flow.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client:
         mock_client.return_value.__aenter__.side_effect = Exception(
             "Invalid credentials"
         )
@@ -129,9 +137,9 @@ async def test_reauth_flow(hass: HomeAssistant) -> None:
     entry.add_to_hass(hass)
 
     with patch(
-        "custom_components.myweblog.config_flow.MyWebLogClient"
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
     ) as mock_client, patch(
-        "custom_components.myweblog.sensor.MyWebLogClient"
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
     ) as mock_sensor_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="new_token")
@@ -151,7 +159,7 @@ async def test_reauth_flow(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        sensor_instance.getBookings = AsyncMock(return_value={"Booking": []})
+        sensor_instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         # First call should show the form (don't pass data - it will be available via context)
         result = await hass.config_entries.flow.async_init(
@@ -201,7 +209,9 @@ async def test_reauth_flow_invalid_auth(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.config_flow.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client:
         mock_client.return_value.__aenter__.side_effect = Exception(
             "Invalid credentials"
         )
@@ -240,9 +250,9 @@ async def test_options_flow(hass: HomeAssistant) -> None:
     entry.add_to_hass(hass)
 
     with patch(
-        "custom_components.myweblog.config_flow.MyWebLogClient"
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
     ) as mock_client, patch(
-        "custom_components.myweblog.sensor.MyWebLogClient"
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
     ) as mock_sensor_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="new_token")
@@ -264,7 +274,7 @@ async def test_options_flow(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        sensor_instance.getBookings = AsyncMock(return_value={"Booking": []})
+        sensor_instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         # Start options flow
         result = await hass.config_entries.options.async_init(entry.entry_id)
@@ -334,9 +344,9 @@ async def test_options_flow_remove_airplane(hass: HomeAssistant) -> None:
     assert registry.async_get(diag_entry.entity_id) is not None
 
     with patch(
-        "custom_components.myweblog.config_flow.MyWebLogClient"
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
     ) as mock_client, patch(
-        "custom_components.myweblog.sensor.MyWebLogClient"
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
     ) as mock_sensor_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="new_token")
@@ -357,7 +367,7 @@ async def test_options_flow_remove_airplane(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        sensor_instance.getBookings = AsyncMock(return_value={"Booking": []})
+        sensor_instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         # Start options flow
         result = await hass.config_entries.options.async_init(entry.entry_id)
@@ -386,6 +396,71 @@ async def test_options_flow_remove_airplane(hass: HomeAssistant) -> None:
         assert registry.async_get(diag_entry.entity_id) is not None  # Should be kept
 
 
+async def test_options_flow_add_airplanes_loaded(hass: HomeAssistant) -> None:
+    """Test adding airplanes to a loaded entry creates each coordinator once."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+        title="MyWeblog (test_user - 1 plane)",
+    )
+    entry.add_to_hass(hass)
+    objects = {
+        "Object": [
+            {"ID": "1", "regnr": "SE-ABC", "model": "Cessna 172"},
+            {"ID": "2", "regnr": "SE-DEF", "model": "Piper PA-28"},
+            {"ID": "3", "regnr": "SE-GHI", "model": "Piper PA-28"},
+        ]
+    }
+
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client, patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_sensor_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.obtainAppToken = AsyncMock(return_value="new_token")
+        instance.getObjects = AsyncMock(return_value=objects)
+        sensor_instance = mock_sensor_client.return_value.__aenter__.return_value
+        sensor_instance.getObjects = AsyncMock(return_value=objects)
+        sensor_instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        sensor_instance.getBookingsWithDates.reset_mock()
+
+        # Updating the data and the options of the entry both fire its listener
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        result = await hass.config_entries.options.async_configure(
+            result.get("flow_id"),
+            {"airplanes": ["SE-ABC", "SE-DEF", "SE-GHI"]},
+        )
+        assert result.get("type") == data_entry_flow.FlowResultType.CREATE_ENTRY
+        await hass.async_block_till_done()
+
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        assert set(runtime.bookings_coordinators) == {"1", "2", "3"}
+        # The objects coordinator plus one bookings coordinator per airplane
+        assert len(async_get_poll_scheduler(hass)._keys) == 4
+        assert sensor_instance.getBookingsWithDates.call_count == 2
+
+        registry = er.async_get(hass)
+        for regnr in ("se_def", "se_ghi"):
+            unique_id = f"myweblog_{regnr}_next_booking"
+            assert registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+            assert hass.states.get(f"sensor.{regnr}_next_booking") is not None
+            assert hass.states.get(f"sensor.{regnr}_next_booking_2") is None
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
 async def test_options_flow_no_selection(hass: HomeAssistant) -> None:
     """Test options flow with no airplanes selected."""
     entry = MockConfigEntry(
@@ -402,7 +477,9 @@ async def test_options_flow_no_selection(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.config_flow.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="new_token")
         instance.getObjects = AsyncMock(
@@ -427,6 +504,50 @@ async def test_options_flow_no_selection(hass: HomeAssistant) -> None:
         assert result.get("errors") == {"base": "no_airplanes_selected"}
 
 
+async def test_options_flow_quiet_hours_incomplete(hass: HomeAssistant) -> None:
+    """Test options flow with only the start of the quiet hours."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+        title="MyWeblog (test_user - 1 plane)",
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.obtainAppToken = AsyncMock(return_value="new_token")
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {"ID": "1", "regnr": "SE-ABC", "model": "Cessna 172"},
+                ]
+            }
+        )
+
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        result = await hass.config_entries.options.async_configure(
+            result.get("flow_id"),
+            {
+                "airplanes": ["SE-ABC"],
+                "polling_profile": "flight_day",
+                "quiet_start": "22:00:00",
+            },
+        )
+
+        assert result.get("type") == data_entry_flow.FlowResultType.FORM
+        assert result.get("errors") == {"base": "quiet_hours_incomplete"}
+        assert entry.options == {}
+
+
 async def test_options_flow_invalid_auth(hass: HomeAssistant) -> None:
     """Test options flow with invalid credentials."""
     entry = MockConfigEntry(
@@ -443,7 +564,9 @@ async def test_options_flow_invalid_auth(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.config_flow.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client:
         mock_client.return_value.__aenter__.side_effect = Exception(
             "Invalid credentials"
         )
@@ -488,7 +611,9 @@ async def test_validate_credentials_connection_error(hass: HomeAssistant) -> Non
         CannotConnect,
     )
 
-    with patch("custom_components.myweblog.config_flow.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client:
         mock_client.return_value.__aenter__.side_effect = Exception(
             "Connection timeout"
         )
@@ -502,11 +627,39 @@ async def test_validate_credentials_connection_error(hass: HomeAssistant) -> Non
             assert False, "Should have raised CannotConnect, not other exception"
 
 
+async def test_validate_credentials_timeout(hass: HomeAssistant) -> None:
+    """Test validate_credentials cancelling a hung call."""
+    from custom_components.myweblog.config_flow import (
+        validate_credentials,
+        CannotConnect,
+    )
+
+    async def hang() -> dict:
+        await asyncio.Event().wait()
+        return {}
+
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client, patch(
+        "custom_components.myweblog.config_flow.DEFAULT_REQUEST_TIMEOUT", 0.01
+    ):
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.obtainAppToken = AsyncMock(return_value="fake_token")
+        instance.getObjects = AsyncMock(side_effect=hang)
+
+        with pytest.raises(CannotConnect):
+            await validate_credentials(hass, "test_user", "test_password")
+        # The client is released after the cancelled call
+        assert mock_client.return_value.__aexit__.await_count == 1
+
+
 async def test_validate_credentials_no_airplanes(hass: HomeAssistant) -> None:
     """Test validate_credentials with no airplanes found."""
     from custom_components.myweblog.config_flow import validate_credentials
 
-    with patch("custom_components.myweblog.config_flow.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="token")
         instance.getObjects = AsyncMock(return_value={"Object": []})  # No airplanes
@@ -522,7 +675,9 @@ async def test_validate_credentials_invalid_callsign(hass: HomeAssistant) -> Non
     """Test validate_credentials with invalid callsign patterns."""
     from custom_components.myweblog.config_flow import validate_credentials
 
-    with patch("custom_components.myweblog.config_flow.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="token")
         # Object with invalid callsign (doesn't match pattern)
@@ -700,3 +855,69 @@ async def test_options_flow_generic_exception(hass: HomeAssistant) -> None:
 
         assert result.get("type") == data_entry_flow.FlowResultType.FORM
         assert result.get("errors") == {"base": "unknown"}
+
+
+async def test_options_flow_follow_club(hass: HomeAssistant) -> None:
+    """Test options flow selecting every club airplane when following the club."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+        title="MyWeblog (test_user - 1 plane)",
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.config_flow.MyWebLogSessionClient"
+    ) as mock_client, patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_sensor_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.obtainAppToken = AsyncMock(return_value="new_token")
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {"ID": "1", "regnr": "SE-ABC", "model": "Cessna 172"},
+                    {"ID": "2", "regnr": "SE-DEF", "model": "Piper PA-28"},
+                ]
+            }
+        )
+        sensor_instance = mock_sensor_client.return_value.__aenter__.return_value
+        sensor_instance.getObjects = instance.getObjects
+        sensor_instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        result = await hass.config_entries.options.async_configure(
+            result.get("flow_id"),
+            {"airplanes": [], "follow_club": True},
+        )
+
+        assert result.get("type") == data_entry_flow.FlowResultType.CREATE_ENTRY
+        await hass.async_block_till_done()
+
+        assert entry.options == {
+            "follow_club": True,
+            "bookings_days_back": 1,
+            "bookings_days_ahead": 30,
+            "request_timeout": 30,
+            "refresh_timeout": 90,
+            "polling_profile": "standard",
+            "objects_interval": 60,
+            "bookings_interval": 15,
+            "quiet_start": None,
+            "quiet_end": None,
+        }
+        assert [plane["regnr"] for plane in entry.data["airplanes"]] == [
+            "SE-ABC",
+            "SE-DEF",
+        ]
+        assert entry.title == "MyWeblog (test_user - 2 planes)"
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
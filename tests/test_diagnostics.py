@@ -0,0 +1,70 @@
+"""Test MyWeblog diagnostics."""
+
+import asyncio
+from unittest.mock import patch, AsyncMock
+
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from custom_components.myweblog.const import DOMAIN
+from custom_components.myweblog.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import]
+
+
+async def test_diagnostics_count_timeouts(hass: HomeAssistant) -> None:
+    """Test timeouts counted apart from other errors in the diagnostics."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+        options={"request_timeout": 0.01, "refresh_timeout": 1},
+    )
+    entry.add_to_hass(hass)
+
+    async def hang() -> dict:
+        await asyncio.Event().wait()
+        return {}
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={"Object": [{"ID": "1", "regnr": "SE-ABC"}]}
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        closed = mock_client.return_value.__aexit__.await_count
+
+        # A hung call is cancelled and its client released
+        instance.getObjects.side_effect = hang
+        await runtime.objects_coordinator.async_refresh()
+        assert not runtime.objects_coordinator.last_update_success
+        assert mock_client.return_value.__aexit__.await_count == closed + 1
+
+        instance.getBookingsWithDates.side_effect = Exception("Server error")
+        await runtime.bookings_coordinators["1"].async_refresh()
+
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+        assert diagnostics["entry"]["data"]["password"] == "**REDACTED**"
+        assert diagnostics["api"]["requests"] == 4
+        assert diagnostics["api"]["timeouts"] == 1
+        assert diagnostics["api"]["errors"] == 1
+        assert diagnostics["api"]["last_timeout"] is not None
+        assert diagnostics["api"]["request_timeout"] == 0.01
+        assert diagnostics["coordinators"]["objects"]["last_update_success"] is False
+        assert diagnostics["coordinators"]["bookings_1"]["last_update_success"] is False
+        assert diagnostics["event_loop"]["threshold_ms"] == 50
+        assert diagnostics["event_loop"]["worst"]
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
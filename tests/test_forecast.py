@@ -0,0 +1,122 @@
+"""Test MyWeblog maintenance forecasting."""
+
+from datetime import date, timedelta
+from unittest.mock import patch, AsyncMock
+
+import pytest  # type: ignore[import]
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from homeassistant.util import dt as dt_util  # type: ignore[import]
+from custom_components.myweblog.const import DOMAIN
+from custom_components.myweblog.forecast import fit_utilization, forecast_due_date
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import]
+from pytest_homeassistant_custom_component.components.recorder.common import (  # type: ignore[import]
+    async_wait_recording_done,
+)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(recorder_mock, enable_custom_integrations):
+    """Set up the recorder before Home Assistant starts."""
+    yield
+
+
+async def test_fit_utilization(hass: HomeAssistant) -> None:
+    """Test the utilization fit and the due date forecast."""
+    day = 86400
+    samples = [(1000 + i * day, 100 + 2 * i) for i in range(10)]
+    assert round(fit_utilization(samples), 6) == 2
+    assert fit_utilization(samples[:1]) is None
+    assert fit_utilization([(1000, 100), (1000, 110)]) is None
+
+    today = date(2025, 5, 1)
+    assert forecast_due_date(20, 2.0, today) == date(2025, 5, 11)
+    assert forecast_due_date(-1, 2.0, today) == today
+    assert forecast_due_date(20, 0, today) is None
+    assert forecast_due_date(20, None, today) is None
+    assert forecast_due_date("n/a", 2.0, today) is None
+
+
+def _objects(airborne: float, hours_to_go: float) -> dict:
+    return {
+        "Object": [
+            {
+                "ID": "1",
+                "regnr": "SE-ABC",
+                "maintTimeDate": {"hoursToGoValue": hours_to_go, "daysToGoValue": 90},
+                "flightData": {"total": {"airborne": airborne}},
+            }
+        ]
+    }
+
+
+async def test_maintenance_forecast(hass: HomeAssistant) -> None:
+    """Test the forecast sensor fitted from the recorded airborne time."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    now = dt_util.utcnow().timestamp()
+    # Three hours flown per day over the last ten days
+    recorded = {
+        "sensor.se_abc_airborne": [
+            {"s": str(100 + 3 * day), "lu": now - (10 - day) * 86400}
+            for day in range(10)
+        ]
+    }
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client, patch(
+        "homeassistant.components.recorder.history.get_significant_states",
+        return_value=recorded,
+    ) as mock_history:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(return_value=_objects(130, 30))
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        await async_wait_recording_done(hass)
+
+        state = hass.states.get("sensor.se_abc_maintenance_due_forecast")
+        assert state.attributes["based_on"] == "airborne"
+        assert state.attributes["hours_per_day"] == 3
+        assert state.attributes["samples"] == 11
+        assert state.state == (dt_util.now().date() + timedelta(days=10)).isoformat()
+        assert state.attributes["calendar_due_date"] == (
+            (dt_util.now().date() + timedelta(days=90)).isoformat()
+        )
+        assert mock_history.call_count == 1
+        assert mock_history.call_args.kwargs["entity_ids"] == [
+            "sensor.se_abc_airborne",
+            "sensor.se_abc_tachometer",
+        ]
+
+        # The fit is cached until the usage changes
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        instance.getObjects.return_value = _objects(130, 30)
+        await runtime.objects_coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert mock_history.call_count == 1
+
+        # Without history the forecast is unknown
+        mock_history.return_value = {}
+        instance.getObjects.return_value = _objects(133, 27)
+        await runtime.objects_coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert mock_history.call_count == 2
+        state = hass.states.get("sensor.se_abc_maintenance_due_forecast")
+        assert state.state == "unknown"
+        assert "hours_per_day" not in state.attributes
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
@@ -0,0 +1,116 @@
+"""Test the import cost of the MyWeblog integration."""
+
+import asyncio
+import os
+from pathlib import Path
+import sys
+
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Modules Home Assistant has loaded by the time it sets up the integration
+PRELOADED = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.device_registry",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.entity_registry",
+    "homeassistant.helpers.service",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.calendar",
+    "homeassistant.components.sensor",
+)
+
+# What Home Assistant imports to set up an entry
+INTEGRATION = (
+    "custom_components.myweblog",
+    "custom_components.myweblog.binary_sensor",
+    "custom_components.myweblog.calendar",
+    "custom_components.myweblog.sensor",
+)
+
+# Modules only needed by a flow, a service or the diagnostics
+DEFERRED = {
+    "cProfile",
+    "custom_components.myweblog.backfill",
+    "custom_components.myweblog.cassette",
+    "custom_components.myweblog.config_flow",
+    "custom_components.myweblog.diagnostics",
+    "custom_components.myweblog.profiler",
+    "homeassistant.components.recorder",
+}
+
+# Share of the import time of the preloaded modules, measured in the same
+# run, the modules loaded by the integration may take together. Several
+# times their share on a development machine, and independent of how fast
+# the machine running the test is.
+IMPORT_BUDGET = 0.2
+
+MARKER = "--- integration"
+
+
+async def _import_times(env: dict[str, str]) -> tuple[int, dict[str, int]]:
+    """Return the import times of setting up an entry.
+
+    The modules Home Assistant has loaded beforehand are timed together, the
+    modules loaded to set up the entry by their self time.
+    """
+    script = "\n".join(
+        (
+            "import sys",
+            *(f"import {module}" for module in PRELOADED),
+            f"sys.stderr.write({MARKER!r} + '\\n')",
+            *(f"import {module}" for module in INTEGRATION),
+        )
+    )
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        script,
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate()
+    lines = stderr.decode().splitlines()
+    assert process.returncode == 0, "\n".join(lines[-20:])
+
+    preloaded = 0
+    times = {}
+    marker = lines.index(MARKER)
+    for index, line in enumerate(lines):
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line.removeprefix("import time:").split("|")
+        if index < marker:
+            preloaded += int(self_us)
+        else:
+            times[module.strip()] = int(self_us)
+    return preloaded, times
+
+
+async def test_import_time(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test that setting up an entry imports little beyond the integration."""
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(REPO_ROOT),
+        # Measure with compiled bytecode, as Home Assistant does
+        "PYTHONPYCACHEPREFIX": str(tmp_path),
+    }
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    await _import_times(env)
+    runs = [await _import_times(env) for _ in range(3)]
+
+    assert not DEFERRED & set(runs[0][1])
+    best = min(sum(times.values()) / preloaded for preloaded, times in runs)
+    assert best < IMPORT_BUDGET, sorted(
+        runs[0][1].items(), key=lambda item: item[1], reverse=True
+    )[:10]
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch, AsyncMock
 from homeassistant.config_entries import ConfigEntryState  # type: ignore[import]
 from homeassistant.core import HomeAssistant  # type: ignore[import]
@@ -19,10 +20,12 @@ async def test_setup_unload_entry(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.getObjects = AsyncMock(return_value={"Object": []})
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         assert await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -50,7 +53,9 @@ async def test_entity_cleanup_on_reload(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         # Returnera data för båda planen så att sensorer skapas
         instance.getObjects = AsyncMock(
@@ -61,7 +66,7 @@ async def test_entity_cleanup_on_reload(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -90,3 +95,291 @@ async def test_entity_cleanup_on_reload(hass: HomeAssistant) -> None:
         # Stoppa timers för att slippa "lingering timer" errors
         await hass.config_entries.async_unload(entry.entry_id)
         await hass.async_block_till_done()
+
+
+async def test_airplane_update_without_reload(hass: HomeAssistant) -> None:
+    """Test that changing airplanes only touches the added and removed ones."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "token123",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"},
+                {"id": "2", "regnr": "SE-LOP", "title": "SE-LOP"},
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {"ID": "1", "regnr": "SE-ABC"},
+                    {"ID": "2", "regnr": "SE-LOP"},
+                    {"ID": "3", "regnr": "SE-XYZ"},
+                ]
+            }
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        kept_coordinator = runtime.bookings_coordinators["1"]
+        objects_calls = instance.getObjects.call_count
+        instance.getBookingsWithDates.reset_mock()
+
+        # Drop SE-LOP and add SE-XYZ
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                **entry.data,
+                "airplanes": [
+                    {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"},
+                    {"id": "3", "regnr": "SE-XYZ", "title": "SE-XYZ"},
+                ],
+            },
+        )
+        await hass.async_block_till_done()
+
+        ent_reg = er.async_get(hass)
+        assert entry.state == ConfigEntryState.LOADED
+        assert ent_reg.async_is_registered("sensor.se_abc_next_booking")
+        assert ent_reg.async_is_registered("sensor.se_xyz_next_booking")
+        assert not ent_reg.async_is_registered("sensor.se_lop_next_booking")
+        assert hass.states.get("sensor.se_lop_next_booking") is None
+
+        # Objects are refetched once, as the object of the new airplane was
+        # not kept, and only the new airplane fetches bookings
+        assert instance.getObjects.call_count == objects_calls + 1
+        assert runtime.get_airplane_object("3") == {"ID": "3", "regnr": "SE-XYZ"}
+        instance.getBookingsWithDates.assert_called_once()
+        assert instance.getBookingsWithDates.call_args[0][0] == "3"
+        assert instance.getObjects.call_count == 2
+        assert runtime.bookings_coordinators["1"] is kept_coordinator
+        assert set(runtime.bookings_coordinators) == {"1", "3"}
+
+        state = hass.states.get("sensor.myweblog_diagnostics_configured_airplanes")
+        assert state is not None
+        assert state.state == "2"
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_follow_club_tracks_new_and_retired_airplanes(
+    hass: HomeAssistant,
+) -> None:
+    """Test that following the club adds and removes airplanes on refresh."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "token123",
+            "airplanes": [{"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"}],
+        },
+        options={"follow_club": True},
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {"ID": "1", "regnr": "SE-ABC", "model": "C172"},
+                    {"ID": "2", "regnr": "SE-LOP", "model": "PA28"},
+                    {"ID": "9", "regnr": "Simulator"},
+                ]
+            }
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        assert set(runtime.airplanes) == {"1", "2"}
+        assert entry.title == "MyWeblog (test_user - 2 planes)"
+        # The objects of new airplanes are kept, so they are not fetched again
+        assert instance.getObjects.call_count == 1
+        assert runtime.get_airplane_object("2")["model"] == "PA28"
+
+        # SE-LOP is retired and SE-XYZ joins the club
+        instance.getObjects.return_value = {
+            "Object": [
+                {"ID": "1", "regnr": "SE-ABC", "model": "C172"},
+                {"ID": "3", "regnr": "SE-XYZ", "model": "DA40"},
+            ]
+        }
+        instance.getBookingsWithDates.reset_mock()
+        await runtime.objects_coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+        ent_reg = er.async_get(hass)
+        assert set(runtime.airplanes) == {"1", "3"}
+        assert entry.state == ConfigEntryState.LOADED
+        assert ent_reg.async_is_registered("sensor.se_xyz_next_booking")
+        assert not ent_reg.async_is_registered("sensor.se_lop_next_booking")
+        instance.getBookingsWithDates.assert_called_once()
+        assert instance.getBookingsWithDates.call_args[0][0] == "3"
+        assert instance.getObjects.call_count == 2
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_airplane_removed_while_fetching_bookings(hass: HomeAssistant) -> None:
+    """Test a bookings fetch finishing after its airplane was removed."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "token123",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"},
+                {"id": "2", "regnr": "SE-LOP", "title": "SE-LOP"},
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+    fetching = asyncio.Event()
+    release = asyncio.Event()
+
+    async def get_bookings(airplane_id, from_date, to_date):
+        if fetching.is_set():
+            return {"Booking": []}
+        fetching.set()
+        await release.wait()
+        return {"Booking": [{"ID": "1", "bStart": 1, "bEnd": 2}]}
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {"ID": "1", "regnr": "SE-ABC"},
+                    {"ID": "2", "regnr": "SE-LOP"},
+                ]
+            }
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        coordinator = runtime.bookings_coordinators["2"]
+
+        instance.getBookingsWithDates.side_effect = get_bookings
+        refresh = hass.async_create_task(coordinator.async_refresh())
+        await fetching.wait()
+        await runtime.async_update_airplanes([runtime.airplanes["1"]])
+        release.set()
+        await refresh
+
+        assert coordinator.last_update_success
+        assert set(runtime.airplanes) == {"1"}
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_polling_follows_enabled_entities(hass: HomeAssistant) -> None:
+    """Test that only data an enabled entity depends on is fetched."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "token123",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"},
+                {"id": "2", "regnr": "SE-LOP", "title": "SE-LOP"},
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {"ID": "1", "regnr": "SE-ABC"},
+                    {"ID": "2", "regnr": "SE-LOP"},
+                ]
+            }
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+        # Disable everything reading the bookings of SE-LOP
+        ent_reg = er.async_get(hass)
+        for entity_id in (
+            "sensor.se_lop_next_booking",
+            "binary_sensor.se_lop_in_use",
+            "calendar.se_lop_bookings",
+            "calendar.myweblog_fleet_bookings",
+        ):
+            ent_reg.async_update_entity(
+                entity_id, disabled_by=er.RegistryEntryDisabler.USER
+            )
+
+        instance.getObjects.reset_mock()
+        instance.getBookingsWithDates.reset_mock()
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        # The restored entities fetch what they depend on in the background
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        instance.getObjects.assert_called_once()
+        instance.getBookingsWithDates.assert_called_once()
+        assert instance.getBookingsWithDates.call_args[0][0] == "1"
+        assert runtime.objects_coordinator.has_demand
+        assert runtime.bookings_coordinators["1"].has_demand
+        assert not runtime.bookings_coordinators["2"].has_demand
+
+        # Refreshing on demand skips the idle airplane too
+        instance.getBookingsWithDates.reset_mock()
+        await runtime.async_refresh()
+        instance.getBookingsWithDates.assert_called_once()
+        assert instance.getBookingsWithDates.call_args[0][0] == "1"
+
+        # So does a changed bookings window
+        instance.getBookingsWithDates.reset_mock()
+        hass.config_entries.async_update_entry(
+            entry, options={**entry.options, "bookings_days_back": 3}
+        )
+        await hass.async_block_till_done()
+        instance.getBookingsWithDates.assert_called_once()
+        assert instance.getBookingsWithDates.call_args[0][0] == "1"
+
+        # A subscribing entity fetches the missing bookings right away
+        instance.getBookingsWithDates.reset_mock()
+        unsub = runtime.bookings_coordinators["2"].async_add_listener(lambda: None)
+        await hass.async_block_till_done()
+        instance.getBookingsWithDates.assert_called_once()
+        assert instance.getBookingsWithDates.call_args[0][0] == "2"
+        unsub()
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
@@ -0,0 +1,73 @@
+"""Test MyWeblog objects projection."""
+
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from custom_components.myweblog.objects import (
+    BASE_OBJECT_FIELDS,
+    object_fields,
+    project_objects,
+)
+from custom_components.myweblog.sensor import OBJECT_FIELDS, SENSOR_TYPES
+
+
+async def test_project_objects(hass: HomeAssistant) -> None:
+    """Test objects projected to the fields in use."""
+    objects = [
+        {
+            "ID": "1",
+            "regnr": "SE-ABC",
+            "model": "Cessna 172",
+            "club_id": "7",
+            "comment": "Long description",
+            "maintTimeDate": {"hoursToGoValue": 20.5, "nextService": "100h"},
+            "flightData": {
+                "initial": {"airborne": 1},
+                "total": {"airborne": 120.5, "landings": 300, "blockOffset": 2},
+            },
+            "activeRemarks": [
+                {"remarkID": "10", "remarkText": "Oil leak", "remarkImage": "..."},
+                "broken",
+            ],
+        },
+        {"ID": "2", "regnr": "SE-XYZ", "model": "Piper PA-28", "clubname": "Club"},
+        "broken",
+    ]
+
+    assert project_objects(objects, {"1"}, OBJECT_FIELDS) == [
+        {
+            "ID": "1",
+            "regnr": "SE-ABC",
+            "model": "Cessna 172",
+            "maintTimeDate": {"hoursToGoValue": 20.5},
+            "flightData": {"total": {"airborne": 120.5, "landings": 300}},
+            "activeRemarks": [{"remarkID": "10", "remarkText": "Oil leak"}, "broken"],
+        }
+    ]
+    assert project_objects(objects, {"1", "2"}, OBJECT_FIELDS)[1] == objects[1]
+    assert project_objects(None, {"1"}, OBJECT_FIELDS) == []
+
+
+async def test_object_fields(hass: HomeAssistant) -> None:
+    """Test the fields read by the sensor descriptions kept."""
+    assert OBJECT_FIELDS["maintTimeDate"] == dict.fromkeys(
+        (
+            "daysToGoValue",
+            "flightStop_daysToGoValue",
+            "hoursToGoValue",
+            "flightStop_hoursToGoValue",
+        )
+    )
+    assert set(OBJECT_FIELDS["ftData"]) == {
+        SENSOR_TYPES[key].ft_data_key
+        for key in ("airborne", "block", "tachometer", "tach_time", "landings")
+    }
+    assert OBJECT_FIELDS["clubname"] is None
+
+    spec = object_fields(
+        [("a", "b"), ("a", "c"), ("d",), ("d", "e"), ("activeRemarks", "x"), ()]
+    )
+    assert spec == {
+        **BASE_OBJECT_FIELDS,
+        "a": {"b": None, "c": None},
+        "d": None,
+    }
+    assert object_fields([("a",), ("a", "b")], {}) == {"a": None}
@@ -0,0 +1,60 @@
+"""Test MyWeblog profiling."""
+
+import os
+import pstats
+from unittest.mock import patch, AsyncMock
+
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from custom_components.myweblog.const import DOMAIN, SERVICE_PROFILE
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import]
+
+
+async def test_profile_service(hass: HomeAssistant, tmp_path) -> None:
+    """Test the profile service writing the stats of refresh cycles."""
+    hass.config.config_dir = str(tmp_path)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={"Object": [{"ID": "1", "regnr": "SE-ABC"}]}
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        objects_calls = instance.getObjects.call_count
+        bookings_calls = instance.getBookingsWithDates.call_count
+
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE,
+            {"cycles": 2},
+            blocking=True,
+            return_response=True,
+        )
+
+        assert instance.getObjects.call_count == objects_calls + 2
+        assert instance.getBookingsWithDates.call_count == bookings_calls + 2
+        path = response["path"]
+        assert os.path.dirname(path) == str(tmp_path)
+        stats = pstats.Stats(path)
+        assert any(
+            function == "_async_update_objects" for _, _, function in stats.stats
+        )
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
@@ -0,0 +1,231 @@
+"""Test MyWeblog on-demand refreshes."""
+
+import asyncio
+import gc
+from unittest.mock import patch, AsyncMock
+
+import pytest  # type: ignore[import]
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from homeassistant.exceptions import ServiceValidationError  # type: ignore[import]
+from homeassistant.helpers import device_registry as dr  # type: ignore[import]
+from custom_components.myweblog.api import SingleFlight
+from custom_components.myweblog.const import DOMAIN, SERVICE_REFRESH
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import]
+
+
+def _entry() -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"},
+                {"id": "2", "regnr": "SE-LOP", "title": "SE-LOP"},
+            ],
+        },
+    )
+
+
+OBJECTS = {
+    "Object": [
+        {"ID": "1", "regnr": "SE-ABC"},
+        {"ID": "2", "regnr": "SE-LOP"},
+    ]
+}
+
+
+async def test_single_flight(hass: HomeAssistant) -> None:
+    """Test concurrent calls for a key sharing one call."""
+    single_flight = SingleFlight(hass)
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch() -> int:
+        calls.append(None)
+        await release.wait()
+        return len(calls)
+
+    first = asyncio.create_task(single_flight.async_run("objects", fetch))
+    second = asyncio.create_task(single_flight.async_run("objects", fetch))
+    other = asyncio.create_task(single_flight.async_run("bookings", fetch))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == await second
+    await other
+    assert len(calls) == 2
+    assert single_flight.joined == 1
+
+    # A finished call is not reused
+    assert await single_flight.async_run("objects", fetch) == 3
+
+
+async def test_single_flight_cancelled_caller(hass: HomeAssistant) -> None:
+    """Test that cancelling one caller leaves the shared call running."""
+    single_flight = SingleFlight(hass)
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(single_flight.async_run("objects", fetch))
+    second = asyncio.create_task(single_flight.async_run("objects", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_single_flight_abandoned_call(hass: HomeAssistant) -> None:
+    """Test a call nobody waits for anymore being tracked and cancelled."""
+    single_flight = SingleFlight(hass)
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        raise ValueError("failed")
+
+    def inflight() -> asyncio.Task:
+        (task,) = (
+            task
+            for task in hass._background_tasks
+            if task.get_name() == "myweblog single flight objects"
+        )
+        return task
+
+    caller = asyncio.create_task(single_flight.async_run("objects", fetch))
+    await asyncio.sleep(0)
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+    # The call outlives its callers as a background task of Home Assistant
+    task = inflight()
+    assert not task.done()
+
+    # Its exception is retrieved although nobody awaits it
+    release.set()
+    await asyncio.wait([task])
+    with patch.object(hass.loop, "call_exception_handler") as exception_handler:
+        del task
+        gc.collect()
+    exception_handler.assert_not_called()
+
+    # Calls in flight are cancelled on request
+    release.clear()
+    caller = asyncio.create_task(single_flight.async_run("objects", fetch))
+    await asyncio.sleep(0)
+    task = inflight()
+    single_flight.async_cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    assert task.cancelled()
+
+
+async def test_refresh_service_coalesces(hass: HomeAssistant) -> None:
+    """Test overlapping refreshes sharing the requests in flight."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(return_value=OBJECTS)
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        instance.getObjects.reset_mock()
+        instance.getBookingsWithDates.reset_mock()
+
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def get_objects() -> dict:
+            started.set()
+            await release.wait()
+            return OBJECTS
+
+        instance.getObjects.side_effect = get_objects
+        calls = [
+            hass.async_create_task(
+                hass.services.async_call(DOMAIN, SERVICE_REFRESH, {}, blocking=True)
+            )
+            for _ in range(2)
+        ]
+        await started.wait()
+        await asyncio.sleep(0)
+        assert instance.getObjects.call_count == 1
+
+        release.set()
+        await asyncio.gather(*calls)
+
+        assert instance.getObjects.call_count == 1
+        assert instance.getBookingsWithDates.call_count == 2
+        assert runtime.single_flight.joined == 3
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_refresh_service_targets(hass: HomeAssistant) -> None:
+    """Test refreshing an airplane or the whole fleet from its device."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(return_value=OBJECTS)
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        instance.getObjects.reset_mock()
+        instance.getBookingsWithDates.reset_mock()
+
+        dev_reg = dr.async_get(hass)
+        airplane = dev_reg.async_get_device(identifiers={(DOMAIN, "SE-LOP")})
+        await hass.services.async_call(
+            DOMAIN, SERVICE_REFRESH, {"device_id": airplane.id}, blocking=True
+        )
+        instance.getObjects.assert_called_once()
+        instance.getBookingsWithDates.assert_called_once()
+        assert instance.getBookingsWithDates.call_args[0][0] == "2"
+
+        instance.getBookingsWithDates.reset_mock()
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_REFRESH,
+            {"entity_id": "sensor.se_abc_next_booking"},
+            blocking=True,
+        )
+        instance.getBookingsWithDates.assert_called_once()
+        assert instance.getBookingsWithDates.call_args[0][0] == "1"
+
+        instance.getBookingsWithDates.reset_mock()
+        fleet = dev_reg.async_get_device(identifiers={(DOMAIN, "fleet")})
+        await hass.services.async_call(
+            DOMAIN, SERVICE_REFRESH, {"device_id": fleet.id}, blocking=True
+        )
+        assert instance.getBookingsWithDates.call_count == 2
+
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_REFRESH,
+                {"entity_id": "sensor.not_myweblog"},
+                blocking=True,
+            )
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
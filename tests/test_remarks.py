@@ -0,0 +1,136 @@
+"""Test MyWeblog remark tracking."""
+
+from unittest.mock import patch, AsyncMock
+
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from custom_components.myweblog.const import (
+    DOMAIN,
+    EVENT_REMARK_CLOSED,
+    EVENT_REMARK_OPENED,
+)
+from custom_components.myweblog.remarks import RemarkIndex
+from pytest_homeassistant_custom_component.common import (  # type: ignore[import]
+    MockConfigEntry,
+    async_capture_events,
+)
+
+
+def _remark(remark_id: str, category: str, text: str) -> dict:
+    return {
+        "remarkID": remark_id,
+        "remarkBy": "Test Pilot",
+        "remarkCategory": category,
+        "remarkDate": "2025-05-01",
+        "remarkText": text,
+    }
+
+
+async def test_remark_index(hass: HomeAssistant) -> None:
+    """Test remarks indexed by ID and category."""
+    index = RemarkIndex(
+        [
+            _remark("1", "1", "Scratch on left wing\nNot structural"),
+            _remark("2", "2", "Oil leak"),
+            _remark("3", "1", "  "),
+            {"remarkCategory": "1"},
+            "broken",
+        ]
+    )
+    assert index.count("1") == 3
+    assert index.count("2") == 1
+    assert index.count("3") == 0
+    assert index.titles("1") == ["Scratch on left wing"]
+    assert index.titles("2") == ["Oil leak"]
+    assert index.titles("3") == []
+    assert set(index.by_id) >= {"1", "2", "3"}
+    assert RemarkIndex(None).count("1") == 0
+
+
+async def test_remark_events(hass: HomeAssistant) -> None:
+    """Test remark open and close events and remark attributes."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    opened = async_capture_events(hass, EVENT_REMARK_OPENED)
+    closed = async_capture_events(hass, EVENT_REMARK_CLOSED)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {
+                        "ID": "1",
+                        "regnr": "SE-ABC",
+                        "activeRemarks": [
+                            _remark("10", "1", "Scratch on left wing"),
+                            _remark("11", "2", "Oil leak"),
+                        ],
+                    }
+                ]
+            }
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        # The first payload is the baseline
+        assert not opened and not closed
+
+        state = hass.states.get("sensor.se_abc_red_tags")
+        assert state.state == "1"
+        assert state.attributes["remarks"] == ["Oil leak"]
+        state = hass.states.get("sensor.se_abc_yellow_tags")
+        assert state.attributes["remarks"] == ["Scratch on left wing"]
+
+        instance.getObjects.return_value = {
+            "Object": [
+                {
+                    "ID": "1",
+                    "regnr": "SE-ABC",
+                    "activeRemarks": [
+                        _remark("10", "1", "Scratch on left wing"),
+                        _remark("12", "2", "Flat tire"),
+                        _remark("13", "2", "Cracked windshield"),
+                    ],
+                }
+            ]
+        }
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        await runtime.objects_coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+        assert len(opened) == 1
+        assert opened[0].data["regnr"] == "SE-ABC"
+        assert [r["remark_id"] for r in opened[0].data["remarks"]] == ["12", "13"]
+        assert opened[0].data["remarks"][0]["color"] == "red"
+        assert opened[0].data["remarks"][0]["title"] == "Flat tire"
+
+        assert len(closed) == 1
+        assert [r["remark_id"] for r in closed[0].data["remarks"]] == ["11"]
+
+        state = hass.states.get("sensor.se_abc_red_tags")
+        assert state.state == "2"
+        assert state.attributes["remarks"] == ["Flat tire", "Cracked windshield"]
+        assert hass.states.get("sensor.myweblog_fleet_red_tags").state == "2"
+
+        # An unchanged payload fires nothing
+        await runtime.objects_coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert len(opened) == 1 and len(closed) == 1
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
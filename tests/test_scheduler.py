@@ -0,0 +1,190 @@
+"""Test MyWeblog poll staggering."""
+
+from datetime import datetime, time, timedelta, timezone
+from unittest.mock import patch, AsyncMock
+
+from freezegun.api import FrozenDateTimeFactory  # type: ignore[import]
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from custom_components.myweblog.const import DOMAIN
+from custom_components.myweblog.scheduler import (
+    PollScheduler,
+    async_get_poll_scheduler,
+    quiet_hours_end,
+)
+from pytest_homeassistant_custom_component.common import (  # type: ignore[import]
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+
+async def test_poll_offsets(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test polls spread evenly over the interval in a stable order."""
+    scheduler = PollScheduler()
+    unregister = scheduler.async_register(("b", "2"))
+    scheduler.async_register(("a", "1"))
+    scheduler.async_register(("b", "1"))
+
+    assert scheduler.offset(("a", "1"), 900) == 0
+    assert scheduler.offset(("b", "1"), 900) == 300
+    assert scheduler.offset(("b", "2"), 900) == 600
+
+    # Due at the next slot at least half an interval away
+    freezer.move_to(datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc))
+    assert scheduler.delay(("b", "1"), 900) == 1200
+    freezer.move_to(datetime(2024, 1, 1, 12, 4, 0, tzinfo=timezone.utc))
+    assert scheduler.delay(("b", "1"), 900) == 60 + 900
+    freezer.move_to(datetime(2024, 1, 1, 12, 10, 0, tzinfo=timezone.utc))
+    assert scheduler.delay(("b", "1"), 900) == 600
+
+    unregister()
+    unregister()
+    assert scheduler.offset(("b", "1"), 900) == 450
+
+
+async def test_quiet_hours_end(hass: HomeAssistant) -> None:
+    """Test finding the end of quiet hours, also across midnight."""
+    hass.config.set_time_zone("UTC")
+    day = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    night = (time(22, 0), time(6, 30))
+
+    assert quiet_hours_end(day.replace(hour=23), night) == datetime(
+        2024, 1, 2, 6, 30, tzinfo=timezone.utc
+    )
+    assert quiet_hours_end(day.replace(hour=3), night) == datetime(
+        2024, 1, 1, 6, 30, tzinfo=timezone.utc
+    )
+    assert quiet_hours_end(day.replace(hour=12), night) is None
+    assert quiet_hours_end(day.replace(hour=6, minute=30), night) is None
+
+    lunch = (time(12, 0), time(13, 0))
+    assert quiet_hours_end(day.replace(hour=12, minute=30), lunch) == datetime(
+        2024, 1, 1, 13, 0, tzinfo=timezone.utc
+    )
+    assert quiet_hours_end(day.replace(hour=13), lunch) is None
+    assert quiet_hours_end(day, (time(8, 0), time(8, 0))) is None
+
+
+async def test_bookings_polls_staggered(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the bookings of two airplanes polled at different times."""
+    freezer.move_to(datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc))
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"},
+                {"id": "2", "regnr": "SE-LOP", "title": "SE-LOP"},
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {"ID": "1", "regnr": "SE-ABC"},
+                    {"ID": "2", "regnr": "SE-LOP"},
+                ]
+            }
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        offsets = {
+            airplane_id: coordinator.poll_offset()
+            for airplane_id, coordinator in runtime.bookings_coordinators.items()
+        }
+        assert offsets == {"1": 0, "2": 300}
+
+        # Each airplane polls in its own slot, at 12:15 and at 12:20
+        for airplane_id, tick in (
+            ("1", timedelta(minutes=15, seconds=1)),
+            ("2", timedelta(minutes=5)),
+        ):
+            instance.getBookingsWithDates.reset_mock()
+            freezer.tick(tick)
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+            instance.getBookingsWithDates.assert_called_once()
+            assert instance.getBookingsWithDates.call_args[0][0] == airplane_id
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        assert async_get_poll_scheduler(hass)._keys == []
+
+
+async def test_polling_profile_applied_without_reload(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a changed polling profile and quiet hours applied in place."""
+    hass.config.set_time_zone("UTC")
+    freezer.move_to(datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc))
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [{"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"}],
+        },
+        options={"polling_profile": "economy"},
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={"Object": [{"ID": "1", "regnr": "SE-ABC"}]}
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        coordinator = runtime.bookings_coordinators["1"]
+        assert runtime.objects_coordinator.update_interval == timedelta(hours=4)
+        assert coordinator.update_interval == timedelta(hours=1)
+
+        # Quiet until 12:30, with bookings every 5 minutes outside of them
+        hass.config_entries.async_update_entry(
+            entry,
+            options={
+                "polling_profile": "custom",
+                "objects_interval": 30,
+                "bookings_interval": 5,
+                "quiet_start": "11:00:00",
+                "quiet_end": "12:30:00",
+            },
+        )
+        await hass.async_block_till_done()
+        assert hass.data[DOMAIN][entry.entry_id] is runtime
+        assert runtime.objects_coordinator.update_interval == timedelta(minutes=30)
+        assert coordinator.update_interval == timedelta(minutes=5)
+
+        instance.getBookingsWithDates.reset_mock()
+        freezer.tick(timedelta(minutes=29))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        instance.getBookingsWithDates.assert_not_called()
+
+        freezer.tick(timedelta(minutes=1, seconds=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        instance.getBookingsWithDates.assert_called_once()
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
@@ -1,7 +1,12 @@
-from unittest.mock import patch, AsyncMock
-from homeassistant.core import HomeAssistant  # type: ignore[import]
+import asyncio
+from unittest.mock import MagicMock, patch, AsyncMock
+from homeassistant.core import HomeAssistant, State  # type: ignore[import]
+from homeassistant.helpers import entity_registry as er  # type: ignore[import]
 from custom_components.myweblog.const import DOMAIN
-from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import]
+from pytest_homeassistant_custom_component.common import (  # type: ignore[import]
+    MockConfigEntry,
+    mock_restore_cache_with_extra_data,
+)
 
 
 async def test_sensors(hass: HomeAssistant) -> None:
@@ -19,7 +24,9 @@ async def test_sensors(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -50,7 +57,7 @@ async def test_sensors(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -89,7 +96,9 @@ async def test_get_yellow_tags(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -107,7 +116,7 @@ async def test_get_yellow_tags(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -134,7 +143,9 @@ async def test_get_red_tags(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -153,7 +164,7 @@ async def test_get_red_tags(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -180,7 +191,9 @@ async def test_get_days_to_go(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -196,7 +209,7 @@ async def test_get_days_to_go(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -223,7 +236,9 @@ async def test_get_days_to_flight_stop(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -239,7 +254,7 @@ async def test_get_days_to_flight_stop(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -266,7 +281,9 @@ async def test_get_hours_to_go(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -282,7 +299,7 @@ async def test_get_hours_to_go(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -309,7 +326,9 @@ async def test_get_hours_to_flight_stop(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -325,7 +344,7 @@ async def test_get_hours_to_flight_stop(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -352,7 +371,9 @@ async def test_get_airborne_fallback(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         # Test fallback to ftData
@@ -369,7 +390,7 @@ async def test_get_airborne_fallback(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -396,7 +417,9 @@ async def test_get_block_fallback(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         # Test fallback to ftData
@@ -413,7 +436,7 @@ async def test_get_block_fallback(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -440,7 +463,9 @@ async def test_get_tachometer_fallback(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -456,7 +481,7 @@ async def test_get_tachometer_fallback(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -483,7 +508,9 @@ async def test_get_tach_time_fallback(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -499,7 +526,7 @@ async def test_get_tach_time_fallback(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -526,7 +553,9 @@ async def test_get_landings_fallback(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -542,7 +571,7 @@ async def test_get_landings_fallback(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -569,7 +598,9 @@ async def test_get_model(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -583,7 +614,7 @@ async def test_get_model(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -610,7 +641,9 @@ async def test_get_club(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -624,7 +657,7 @@ async def test_get_club(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -657,7 +690,9 @@ async def test_get_next_booking(hass: HomeAssistant) -> None:
     # Create a future booking timestamp
     future_time = time.time() + 3600  # 1 hour from now
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -672,7 +707,7 @@ async def test_get_next_booking(hass: HomeAssistant) -> None:
         )
         # Test with date format with microseconds
         future_dt = datetime.now() + timedelta(hours=1)
-        instance.getBookings = AsyncMock(
+        instance.getBookingsWithDates = AsyncMock(
             return_value={
                 "Booking": [
                     {
@@ -726,7 +761,7 @@ async def test_get_next_booking(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(
+        instance.getBookingsWithDates = AsyncMock(
             return_value={
                 "Booking": [
                     {
@@ -771,7 +806,7 @@ async def test_get_next_booking(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(
+        instance.getBookingsWithDates = AsyncMock(
             return_value={
                 "Booking": [
                     {
@@ -808,7 +843,7 @@ async def test_coordinator_auth_error_objects(hass: HomeAssistant) -> None:
     entry.add_to_hass(hass)
 
     with patch(
-        "custom_components.myweblog.sensor.MyWebLogClient"
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
     ) as mock_client, patch(
         "homeassistant.config_entries.ConfigEntriesFlowManager.async_init"
     ) as mock_reauth:
@@ -816,7 +851,7 @@ async def test_coordinator_auth_error_objects(hass: HomeAssistant) -> None:
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         # Simulate auth error
         instance.getObjects = AsyncMock(side_effect=Exception("Invalid credentials"))
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         # Setup should handle the error gracefully
         # The error triggers re-auth flow and is logged
@@ -851,7 +886,7 @@ async def test_coordinator_auth_error_bookings(hass: HomeAssistant) -> None:
     entry.add_to_hass(hass)
 
     with patch(
-        "custom_components.myweblog.sensor.MyWebLogClient"
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
     ) as mock_client, patch(
         "homeassistant.config_entries.ConfigEntriesFlowManager.async_init"
     ) as mock_reauth:
@@ -868,7 +903,9 @@ async def test_coordinator_auth_error_bookings(hass: HomeAssistant) -> None:
             }
         )
         # Simulate auth error in bookings
-        instance.getBookings = AsyncMock(side_effect=Exception("Invalid credentials"))
+        instance.getBookingsWithDates = AsyncMock(
+            side_effect=Exception("Invalid credentials")
+        )
 
         # Setup should handle the error gracefully
         # The error triggers re-auth flow and is logged
@@ -901,7 +938,9 @@ async def test_sensor_state_missing_airplane(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         # Return objects but without the airplane we're looking for
@@ -915,7 +954,7 @@ async def test_sensor_state_missing_airplane(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -950,7 +989,9 @@ async def test_sensor_extra_state_attributes(hass: HomeAssistant) -> None:
 
     future_time = time.time() + 3600
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -968,7 +1009,7 @@ async def test_sensor_extra_state_attributes(hass: HomeAssistant) -> None:
             }
         )
         future_dt = datetime.now() + timedelta(hours=1)
-        instance.getBookings = AsyncMock(
+        instance.getBookingsWithDates = AsyncMock(
             return_value={
                 "Booking": [
                     {
@@ -1028,7 +1069,9 @@ async def test_sensor_available_property(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -1041,7 +1084,7 @@ async def test_sensor_available_property(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -1071,7 +1114,9 @@ async def test_diagnostic_sensor_state(hass: HomeAssistant) -> None:
     )
     entry.add_to_hass(hass)
 
-    with patch("custom_components.myweblog.sensor.MyWebLogClient") as mock_client:
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
         instance = mock_client.return_value.__aenter__.return_value
         instance.obtainAppToken = AsyncMock(return_value="fake_token")
         instance.getObjects = AsyncMock(
@@ -1084,7 +1129,7 @@ async def test_diagnostic_sensor_state(hass: HomeAssistant) -> None:
                 ]
             }
         )
-        instance.getBookings = AsyncMock(return_value={"Booking": []})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
 
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -1128,3 +1173,325 @@ async def test_setup_entry_missing_credentials(hass: HomeAssistant) -> None:
     # We can verify the error path was executed by checking no sensors exist
     state = hass.states.get("sensor.se_abc_yellow_tags")
     assert state is None  # No sensors should be created
+
+
+async def test_compiled_value_fns(hass: HomeAssistant) -> None:
+    """Test value specs compiled into per-schema accessors."""
+    from custom_components.myweblog.coordinator import (
+        SCHEMA_FLIGHT_DATA,
+        SCHEMA_FT_DATA,
+        detect_objects_schema,
+    )
+    from custom_components.myweblog.remarks import RemarkIndex
+    from custom_components.myweblog.sensor import (
+        SENSOR_TYPES,
+        MyWebLogSensorEntityDescription,
+        compile_value_fns,
+    )
+
+    flight_data_obj = {
+        "flightData": {"total": {"tachoMeter": "120.3456", "landings": 50}},
+        "ftData": {"tachometer": 99.0},
+    }
+    ft_data_obj = {"ftData": {"tachometer": 200.5, "landings": 7}}
+
+    assert detect_objects_schema([flight_data_obj]) == SCHEMA_FLIGHT_DATA
+    assert detect_objects_schema([ft_data_obj]) == SCHEMA_FT_DATA
+    assert detect_objects_schema([]) == SCHEMA_FLIGHT_DATA
+
+    tachometer = compile_value_fns(SENSOR_TYPES["tachometer"])
+    assert tachometer[SCHEMA_FLIGHT_DATA](flight_data_obj) == 120.35
+    assert tachometer[SCHEMA_FT_DATA](ft_data_obj) == 200.5
+    assert tachometer[SCHEMA_FT_DATA](flight_data_obj) == 99.0
+    # Objects lacking the preferred location fall back to the other one
+    assert tachometer[SCHEMA_FLIGHT_DATA](ft_data_obj) == 200.5
+    assert tachometer[SCHEMA_FLIGHT_DATA]({}) == 0
+
+    hours_to_go = compile_value_fns(SENSOR_TYPES["hours_to_go"])
+    assert (
+        hours_to_go[SCHEMA_FLIGHT_DATA]({"maintTimeDate": {"hoursToGoValue": "n/a"}})
+        == "n/a"
+    )
+
+    # Additional metrics are declared the same way
+    seats = compile_value_fns(
+        MyWebLogSensorEntityDescription(key="seats", value_path=("info", "seats"))
+    )
+    assert seats[SCHEMA_FT_DATA]({"info": {"seats": 4}}) == 4
+    assert seats[SCHEMA_FT_DATA]({"info": None}) is None
+
+    # Remark counts come from the index the runtime keeps per payload
+    runtime = MagicMock()
+    runtime.get_remark_index.return_value = RemarkIndex(
+        [{"remarkID": "1", "remarkCategory": "2"}]
+    )
+    red_tags = compile_value_fns(SENSOR_TYPES["red_tags"], runtime)
+    assert red_tags[SCHEMA_FLIGHT_DATA]({"ID": "7"}) == 1
+    runtime.get_remark_index.assert_called_once_with("7")
+
+
+async def test_fleet_sensors(hass: HomeAssistant) -> None:
+    """Test fleet aggregate sensors computed over all airplanes."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"},
+                {"id": "2", "regnr": "SE-DEF", "title": "SE-DEF (Piper PA-28)"},
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={
+                "Object": [
+                    {
+                        "ID": "1",
+                        "regnr": "SE-ABC",
+                        "activeRemarks": [{"remarkCategory": "2"}],
+                        "maintTimeDate": {"hoursToGoValue": 5.5, "daysToGoValue": 40},
+                        "flightData": {"total": {"airborne": 100.1, "landings": 50}},
+                    },
+                    {
+                        "ID": "2",
+                        "regnr": "SE-DEF",
+                        "activeRemarks": [{"remarkCategory": "1"}],
+                        "maintTimeDate": {"hoursToGoValue": 20, "daysToGoValue": 10},
+                        "flightData": {"total": {"airborne": 200.2, "landings": 70}},
+                    },
+                    {
+                        "ID": "3",
+                        "regnr": "SE-XYZ",
+                        "maintTimeDate": {"hoursToGoValue": 1},
+                    },
+                ]
+            }
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        state = hass.states.get("sensor.myweblog_fleet_lowest_hours_to_go_maintenance")
+        assert state is not None
+        assert state.state == "5.5"
+        assert state.attributes["max"] == 20.0
+        assert state.attributes["airplane"] == "SE-ABC"
+
+        state = hass.states.get("sensor.myweblog_fleet_lowest_days_to_go_maintenance")
+        assert state is not None
+        assert state.state == "10"
+        assert state.attributes["airplane"] == "SE-DEF"
+
+        state = hass.states.get("sensor.myweblog_fleet_airborne")
+        assert state is not None
+        assert state.state == "300.3"
+
+        state = hass.states.get("sensor.myweblog_fleet_grounded_airplanes")
+        assert state is not None
+        assert state.state == "1"
+        assert state.attributes["airplanes"] == ["SE-ABC"]
+
+        state = hass.states.get("sensor.myweblog_fleet_airplanes_due_for_maintenance")
+        assert state is not None
+        assert state.state == "1"
+
+        state = hass.states.get("sensor.myweblog_fleet_next_maintenance")
+        assert state is not None
+        assert state.state == "SE-ABC"
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_batched_state_publication(hass: HomeAssistant) -> None:
+    """Test states are published once per refresh and only when changed."""
+    airplanes = [
+        {"id": str(i), "regnr": f"SE-A{i:02d}", "title": f"SE-A{i:02d}"}
+        for i in range(20)
+    ]
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": airplanes,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    objects = [
+        {
+            "ID": airplane["id"],
+            "regnr": airplane["regnr"],
+            "model": "Cessna 172",
+            "activeRemarks": [],
+            "maintTimeDate": {"hoursToGoValue": 20 + int(airplane["id"])},
+            "flightData": {"total": {"airborne": 100, "landings": 50}},
+        }
+        for airplane in airplanes
+    ]
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(return_value={"Object": objects})
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        coordinator = runtime.objects_coordinator
+        publisher = runtime.publisher
+        published_entities = len(airplanes) * 15 + 11
+
+        # One publisher listener instead of one per sensor
+        assert len(coordinator._listeners) < 10
+
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        # Nothing changed, so nothing is written again
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert publisher.last_entities == published_entities
+        assert publisher.last_written == 0
+        assert publisher.last_duration is not None
+
+        changed = [dict(obj) for obj in objects]
+        changed[3] = {**changed[3], "model": "Cessna 182"}
+        instance.getObjects.return_value = {"Object": changed}
+        timings = runtime.watchdog.timings
+        state_calls = timings["SE-A03", "model state"].calls
+        attributes_calls = timings["SE-A03", "model extra_state_attributes"].calls
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert publisher.last_written == 1
+        # The write reuses the state computed to detect the change
+        assert timings["SE-A03", "model state"].calls == state_calls + 1
+        assert (
+            timings["SE-A03", "model extra_state_attributes"].calls
+            == attributes_calls + 1
+        )
+        assert hass.states.get("sensor.se_a03_model").state == "Cessna 182"
+
+        # A bookings refresh only publishes the sensors reading its bookings
+        await runtime.bookings_coordinators["5"].async_refresh()
+        await hass.async_block_till_done()
+        assert publisher.last_entities == 1
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        assert not coordinator._listeners
+
+
+async def test_restored_sensor_state(hass: HomeAssistant) -> None:
+    """Test sensors presenting their restored state until the first refresh."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [
+                {"id": "1", "regnr": "SE-ABC", "title": "SE-ABC (Cessna 172)"}
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    # Entities left in the registry by a previous run
+    ent_reg = er.async_get(hass)
+    for unique_id, object_id in (
+        ("myweblog_se_abc_airborne", "se_abc_airborne"),
+        ("myweblog_se_abc_red_tags", "se_abc_red_tags"),
+    ):
+        ent_reg.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            unique_id,
+            suggested_object_id=object_id,
+            config_entry=entry,
+        )
+    mock_restore_cache_with_extra_data(
+        hass,
+        (
+            (
+                State(
+                    "sensor.se_abc_airborne",
+                    "120.5",
+                    {"unit_of_measurement": "h", "friendly_name": "SE-ABC Airborne"},
+                ),
+                {"native_value": 120.5, "native_unit_of_measurement": "h"},
+            ),
+            (
+                State(
+                    "sensor.se_abc_red_tags",
+                    "1",
+                    {"remarks": ["Oil leak"], "icon_color": "red"},
+                ),
+                {"native_value": 1, "native_unit_of_measurement": None},
+            ),
+        ),
+    )
+
+    release = asyncio.Event()
+
+    async def get_objects() -> dict:
+        await release.wait()
+        return {
+            "Object": [
+                {
+                    "ID": "1",
+                    "regnr": "SE-ABC",
+                    "activeRemarks": [],
+                    "flightData": {"total": {"airborne": 130}},
+                }
+            ]
+        }
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(side_effect=get_objects)
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        # The entry is set up without waiting for the first refresh
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        state = hass.states.get("sensor.se_abc_airborne")
+        assert state.state == "120.5"
+        assert "stale_since" in state.attributes
+        state = hass.states.get("sensor.se_abc_red_tags")
+        assert state.state == "1"
+        assert state.attributes["remarks"] == ["Oil leak"]
+        assert state.attributes["icon_color"] == "red"
+        # Sensors without a restored state wait for live data
+        assert hass.states.get("sensor.se_abc_landings").state == "unavailable"
+
+        release.set()
+        await hass.async_block_till_done()
+
+        state = hass.states.get("sensor.se_abc_airborne")
+        assert state.state == "130.0"
+        assert "stale_since" not in state.attributes
+        state = hass.states.get("sensor.se_abc_red_tags")
+        assert state.state == "0"
+        assert state.attributes["remarks"] == []
+        assert hass.states.get("sensor.se_abc_landings").state == "0"
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
@@ -0,0 +1,116 @@
+"""Test the MyWeblog event loop watchdog."""
+
+from unittest.mock import MagicMock, patch, AsyncMock
+
+from homeassistant.core import HomeAssistant  # type: ignore[import]
+from custom_components.myweblog.const import DOMAIN
+from custom_components.myweblog.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.myweblog.watchdog import LoopWatchdog
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import]
+
+
+def _warnings(logger: MagicMock) -> list[str]:
+    return [call.args[0] % call.args[1:] for call in logger.warning.call_args_list]
+
+
+async def test_watchdog_rate_limits_warnings() -> None:
+    """Test slow calls warned about at most once per interval."""
+    watchdog = LoopWatchdog(threshold=0.05, warn_interval=900)
+
+    with patch(
+        "custom_components.myweblog.watchdog.time.monotonic"
+    ) as monotonic, patch("custom_components.myweblog.watchdog._LOGGER") as logger:
+        monotonic.return_value = 1000
+        watchdog.record("SE-ABC", "next_booking state", 0.01)
+        assert not _warnings(logger)
+
+        watchdog.record("SE-ABC", "next_booking state", 0.2)
+        watchdog.record("SE-ABC", "next_booking state", 0.3)
+        watchdog.record("SE-LOP", "next_booking state", 0.1)
+        assert _warnings(logger) == [
+            "next_booking state of SE-ABC blocked the event loop for 200 ms "
+            "(0 more slow calls since the last warning)",
+            "next_booking state of SE-LOP blocked the event loop for 100 ms "
+            "(0 more slow calls since the last warning)",
+        ]
+
+        logger.reset_mock()
+        monotonic.return_value = 1900
+        watchdog.record("SE-ABC", "next_booking state", 0.06)
+        assert _warnings(logger) == [
+            "next_booking state of SE-ABC blocked the event loop for 60 ms "
+            "(1 more slow calls since the last warning)",
+        ]
+
+    report = watchdog.as_dict(limit=1)
+    assert report["threshold_ms"] == 50
+    assert report["slow_calls"] == 4
+    assert report["worst"] == [
+        {
+            "subject": "SE-ABC",
+            "metric": "next_booking state",
+            "calls": 4,
+            "slow_calls": 3,
+            "max_ms": 300,
+            "mean_ms": 142.5,
+        }
+    ]
+
+
+async def test_watchdog_times_callbacks(hass: HomeAssistant) -> None:
+    """Test the states, listeners and bookings ingest of an entry timed."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "test_user",
+            "password": "test_password",
+            "app_token": "fake_token",
+            "airplanes": [{"id": "1", "regnr": "SE-ABC", "title": "SE-ABC"}],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.myweblog.coordinator.MyWebLogSessionClient"
+    ) as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.getObjects = AsyncMock(
+            return_value={"Object": [{"ID": "1", "regnr": "SE-ABC"}]}
+        )
+        instance.getBookingsWithDates = AsyncMock(return_value={"Booking": []})
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        runtime = hass.data[DOMAIN][entry.entry_id]
+        timings = runtime.watchdog.timings
+        assert timings["SE-ABC", "airborne state"].calls > 0
+        assert timings["SE-ABC", "next_booking extra_state_attributes"].calls > 0
+        assert timings["fleet", "fleet_airborne state"].calls > 0
+        assert timings["SE-ABC", "ingest_bookings"].calls == 1
+        assert timings["myweblog_airplane_1_bookings", "update_listeners"].calls == 1
+
+        await runtime.objects_coordinator.async_refresh()
+        assert timings["objects", "project_objects"].calls == 2
+        assert timings["myweblog_airplanes_objects", "_async_track_remarks"].calls == 1
+
+        # Everything is slow with no time allowed, warned about once
+        runtime.watchdog.threshold = 0
+        with patch("custom_components.myweblog.watchdog._LOGGER") as logger:
+            for _ in range(2):
+                await runtime.bookings_coordinators["1"].async_refresh()
+        slow_ingests = [
+            message
+            for message in _warnings(logger)
+            if message.startswith("ingest_bookings of SE-ABC blocked the event loop")
+        ]
+        assert len(slow_ingests) == 1
+
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+        assert diagnostics["event_loop"]["threshold_ms"] == 0
+        assert diagnostics["event_loop"]["slow_calls"] > 0
+        assert len(diagnostics["event_loop"]["worst"]) == 10
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()